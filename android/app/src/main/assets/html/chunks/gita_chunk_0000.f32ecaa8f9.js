@@ -0,0 +1 @@
+GITA_CHUNK(0,["सर्वस्य चाहं हृदि संनिविष्टो मत्तः स्मृतिर्ज्ञानमपोहनं च ।","मैं सभी के हृदय में स्थित हूँ। स्मृति, ज्ञान और विस्मृति — सब मुझसे ही प्राप्त होते हैं।","एग्ज़ाम में अचानक कुछ भूल जाना — मन शांत करते ही वही याद फिर से आ जाना।","ईश्वरः सर्वभूतानां हृद्देशेऽर्जुन तिष्ठति। भ्रामयन्सर्वभूतानि यन्त्रारूढानि मायया॥","ईश्वर सभी जीवों के हृदय में रहता है और प्रकृति के गुणों के अनुसार उन्हें संचालित करता है।","अगर मन दुख-चिंता में उलझा हो, तो व्यक्ति महत्वपूर्ण बातें भूल सकता है।","वीतरागभयक्रोधा… मद्भावायोपपद्यते","जो व्यक्ति राग, भय और क्रोध से मुक्त हो जाता है, वह दिव्य अवस्था को प्राप्त करता है।","इंटरव्यू का डर — क्योंकि मन कहता है ‘अगर मैं फेल हुआ तो क्या होगा?’","(अर्जुन का भय शांत होने का वर्णन)","भगवान ने अपना भयानक विश्वरूप समेट लिया और शांत, सुंदर चार-भुजा रूप दिखाया। अर्जुन का डर दूर हो गया।","अंधेरे में रस्सी को साँप समझकर डर जाना। रोशनी आते ही भ्रम खत्म हो जाता है।","प्रवृत्तिं च निवृत्तिं च... या सा बुद्धिः सा सात्त्विकी।","जो बुद्धि सही और गलत, कर्तव्य और अकर्तव्य को स्पष्ट रूप से समझती है — वह सात्त्विक बुद्धि है।","ट्रैफिक नियम जानने वाला ड्राइवर निश्चिंत होकर चलता है; ना जानने वाला हर समय डरता है।","रजसः लोभ एव च ।","रजोगुण से लोभ यानी लालच उत्पन्न होता है।","मोबाइल है, फिर भी नया वाला चाहिए — यह रजोगुण का लोभ है।","त्रिविधं नरकस्येदं द्वारं नाशनमात्मनः— कामः क्रोधस्तथा लोभः","काम, क्रोध और लोभ — ये तीन नरक के द्वार हैं।","व्यापार में अत्यधिक लालच से गलत निर्णय लेकर नुकसान उठाना।","दान, यज्ञ, तप पुण्य के लिए किए जाएँ, लालच के लिए नहीं।","जो कार्य केवल धन या लाभ के लोभ के लिए किए जाते हैं, वे अशुद्ध होते हैं।","किसी की मदद केवल इसलिए करना कि बाद में उससे लाभ मिलेगा — यह लोभ है, न कि पुण्य।","तस्मात् प्रणम्य प्रणिधाय कायं प्रसादये त्वामहम् ईशम् ईड्यम् ॥","इसलिए मैं तेरे सामने शरीर को झुकाकर क्षमा माँगता हूँ।","गलती से दोस्त की भावनाओं को चोट पहुँची — अपना अहंकार छोड़कर ‘सॉरी’ कह देना ही क्षमा का अभ्यास है।","अद्वेष्टा सर्वभूतानां… क्षमी","जो सबका हित चाहता है, द्वेष रहित, करुणावान, क्षमाशील है — वह भगवान को प्रिय है।","किसी की गलती बार-बार पकड़ने से तनाव बढ़ता है; क्षमा कर देने से मन शांत हो जाता है।","दैवी गुण — अभय, पवित्रता, दया, सत्य, क्षमा, सरलता…","दैवी गुणों में क्षमा भी शामिल है।","परिवार में छोटी-छोटी बातों पर क्रोध न करके, क्षमा करना संबंधों को मजबूत बनाता है।","तानहं द्विषतः क्रूरान् संसारेषु नराधमान्…","भगवान कहते हैं – जो दुष्ट और क्रूर हैं, उन्हें मैं संसार के चक्र में और नीचे स्थितियों में रखता हूँ।","अगर कोई हिंसा, छल और बुराई करता है तो उसका जीवन कठिनाइयों से भरा होता है — यह कर्मों का परिणाम है।","श्रद्धावाननसूयश्च शृणुयादपि यो नरः…","जो व्यक्ति श्रद्धा से गीता सुनता या समझता है, वह श्रेष्ठ स्थान को प्राप्त करता है।","आध्यात्मिक ज्ञान रखने वाला व्यक्ति मौत से नहीं डरता, क्योंकि वह जानता है — ‘आत्मा जन्म नहीं लेती, मरती नहीं।’","कार्पण्यदोषोपहतस्वभावः… यच्छ्रेयः स्यान्निश्चितं ब्रूहि।","अर्जुन कहता है – मेरा स्वभाव भ्रम से दब गया है; मुझे नहीं पता क्या सही है। कृपया मुझे स्पष्ट मार्ग बताओ।","करियर चुनते समय — ‘जॉब करूँ या बिज़नेस?’ यह भ्रम है।","व्यामिश्रेणेव वाक्येन बुद्धिं मोहयसीव मे","अर्जुन कहता है – आपके कहने से मेरी बुद्धि भ्रमित हो रही है।","यूट्यूब पर 10 वीडियो देखकर व्यक्ति और कन्फ्यूज़ हो जाना।","क्लैब्यं मा स्म गमः पार्थ… उद्यत्थ करोत्तेजः","हे अर्जुन! ऐसी कायरता में मत पड़ो। उठो, वीर बनो!","व्यायाम करने में आलस — लेकिन शुरू करते ही ऊर्जा बढ़ जाती है।"],[[0,0,15,15,0,1,2,[1,72,14,31,60]],[0,0,18,61,3,4,5,[0,11,9,52,10]],[1,1,4,10,6,7,8,[3,4,13,39,48]],[1,1,11,50,9,10,11,[2,4,13,48,20]],[1,1,18,30,12,13,14,[3,2,13,57,67]],[2,2,14,17,15,16,17,[6,7,41,49,52]],[2,2,16,21,18,19,20,[5,7,72,36,73]],[2,2,17,25,21,22,23,[5,6,68,28,42]],[3,3,11,44,24,25,26,[9,10,36,35,34]],[3,3,12,"13-14",27,28,29,[10,8,1,31,19]],[3,3,16,"1-3",30,31,32,[9,8,48,52,50]],[4,4,16,19,33,34,35,[12,1,57,62,22]],[4,4,18,71,36,37,38,[11,54,60,67,57]],[5,5,2,7,39,40,41,[14,34,3,4,2]],[5,5,3,2,42,43,44,[13,72,43,0,3]],[6,6,2,3,45,46,47,[37,16,17,39,18]]]);
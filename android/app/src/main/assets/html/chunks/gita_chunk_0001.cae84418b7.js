@@ -0,0 +1 @@
+GITA_CHUNK(1,["शीतोष्णसुखदुःखदाः… तितिक्षस्व भारत","सुख-दुःख की अनुभूतियाँ आती-जाती रहती हैं। धैर्य रखो।","काम में थोड़ी थकान आने पर ब्रेक लो, लेकिन काम छोड़ कर भागो मत।","वेदाविनाशिनं नित्यं… कथं स पुरुषः हन्ति","जो आत्मा को नाशरहित जानता है, उसका मन कभी हताश या थका हुआ नहीं होता।","लक्ष्य पता हो तो थकावट कम होती है— जैसे मैराथन दौड़ते समय मंज़िल देख कर ऊर्जा आती है।","तस्मात्त्वमुत्तिष्ठ यशो लभस्व जित्वा शत्रून्भुङ्क्ष्व राज्यं समृद्धम् ।","इसलिए उठो, विजय पाओ और समृद्ध राज्य का आनंद लो।","बार-बार इंटरव्यू में रिजेक्ट होने के बाद भी खुद को उठाकर अगला कदम उठाना ही उत्साह है।","सहजं कर्म कौन्तेय सदोषमपि न त्यजेत्","अपने स्वभाव से जुड़े कर्म को उसमें दोष दिखाई देने पर भी मत छोड़ो।","स्टार्टअप में बार-बार मुश्किलें आएँ, फिर भी अपनी दिशा न छोड़ना ही धैर्य है।","यत्र योगेश्वरः कृष्णो यत्र पार्थो धनुर्धरः… विजयः","जहाँ भगवान कृष्ण और अर्जुन जैसे पुरुषार्थी हों, वहाँ विजय निश्चित है।","अच्छे गुरु + अपनी मेहनत = हमेशा जीत।","ये यथा मां प्रपद्यन्ते तांस्तथैव भजाम्यहम्","जो जैसे मुझे याद करता है, मैं उसे उसी प्रकार फल देता हूँ।","अगर आप सोचो ‘मेरा कुछ नहीं होगा,’ तो वास्तव में कुछ नहीं होगा।","योगक्षेमं वहाम्यहम्","जो मेरा भजन करते हैं, उनकी रक्षा और आवश्यकता मैं स्वयं पूरी करता हूँ।","काम न मिलने पर भी सकारात्मक रहना — कुछ दिनों बाद वही मेहनत आपको बेहतर मौके से मिलवाती है।","मन्मना भव… मां नमस्कुरु","मन को मेरी ओर लगाओ, मैं तुमको कभी निराश नहीं करूँगा।","बार-बार फेल होने पर भी अगर मन शांत रहे, तो अगली बार सफलता की संभावना बढ़ती है।","सर्वधर्मान्परित्यज्य मामेकं शरणं व्रज","सब चिंताएँ छोड़कर मेरी शरण में आओ, मैं तुम्हें सब पापों से मुक्त कर दूँगा।","सब रास्ते बंद लगें, तभी चमत्कार होते हैं।","विद्याविनयसंपन्ने ब्राह्मणे गवि हस्तिनि… पण्डिताः समदर्शिनः","ज्ञानी व्यक्ति ब्राह्मण, गाय, हाथी, कुत्ता, चांडाल—सबमें समान आत्मा देखता है।","अमीर-गरीब में सम्मान का अंतर न करना।","इहैव तैर्जितः सर्गो येषां साम्ये स्थितं मनः","जिनका मन समान दृष्टि में स्थित है, वे संसार के बंधन से मुक्त हो जाते हैं।","किसी को जाति, रंग, शिक्षा से न आँकना— यही सच्ची आध्यात्मिकता है।","आत्मौपम्येन सर्वत्र समं पश्यति","जो दूसरों में भी स्वयं को देखता है, वही श्रेष्ठ योगी है।","किसी गरीब को ठंड में देखकर उसे कपड़ा देना क्योंकि आप सोचते हैं— ‘अगर मैं होता तो मुझे कैसा लगता?’","समोऽहं सर्वभूतेषु","मैं सभी के लिए समान हूँ।","बच्चे अपने-अपने रंग, भाषा, परिवार के होते हैं, लेकिन शिक्षक सबको समान पढ़ाता है।","उद्धरेदात्मनाऽत्मानं…","मनुष्य स्वयं अपने मन को ऊपर उठाए। मन ही मित्र और शत्रु बनता है।","मन कहे ‘मैं नहीं कर सकता’ — बस यहीं से हार शुरू होती है।","बन्धुरात्मात्मनस्तस्य…","जिसने मन को जीत लिया, उसका मन मित्र है। और जिसने मन को नहीं जीता, उसका मन शत्रु है।","डाइट शुरू करोगे, मन बोलेगा — ‘बस आज जंक फूड खा ले।’ यहीं पर आप जीतते/हारते हो।","यतो यतो निश्चरति मनश्चञ्चलमस्थिरम्…","मन जहाँ-जहाँ भागे, उसे बार-बार वापस लाओ।","पढ़ाई करते समय मन बार-बार मोबाइल में जाना चाहता है। उसे लौटाना ही योग है।"],[[6,6,2,14,0,1,2,[15,17,56,40,19]],[6,6,2,21,3,4,5,[15,16,30,32,37]],[7,7,11,33,6,7,8,[20,19,23,36,43]],[7,7,18,48,9,10,11,[18,20,51,16,9]],[7,7,18,78,12,13,14,[18,19,31,56,3]],[8,8,4,11,15,16,17,[22,23,24,44,53]],[8,8,9,22,18,19,20,[21,23,24,44,20]],[8,8,9,34,21,22,23,[22,21,24,18,31]],[8,8,18,66,24,25,26,[69,23,22,21,34]],[9,9,5,18,27,28,29,[27,28,26,46,54]],[9,9,5,19,30,31,32,[28,25,27,61,68]],[9,9,6,32,33,34,35,[25,28,26,45,33]],[9,9,9,29,36,37,38,[46,25,26,27,7]],[10,10,6,5,39,40,41,[30,32,31,28,37]],[10,10,6,6,42,43,44,[29,32,31,42,36]],[10,10,6,26,45,46,47,[32,30,29,20,9]]]);
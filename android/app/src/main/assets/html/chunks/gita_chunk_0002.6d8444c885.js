@@ -0,0 +1 @@
+GITA_CHUNK(2,["असंशयं महाबाहो मनो दुर्निग्रहं चलम्… अभ्यासेन तु कौन्तेय","मन चंचल है, पर अभ्यास और वैराग्य से उसे जीता जा सकता है।","10 दिन तक ध्यान करना मुश्किल लगता है, 30 दिन बाद वही काम आसान बन जाता है।","दम्भो दर्पोऽभिमानश्च… आसुरी सम्पदा","दंभ, घमंड और अभिमान — ये आसुरी गुण हैं।","कामयाबी के बाद दूसरों को छोटा समझना, और फिर धीरे-धीरे सबको खो देना।","इदमस्तीदमपि मे… अहं बलवान्","अहंकारी व्यक्ति कहता है — यह मेरा है, यह भी मेरा है, मैं बलवान हूँ।","‘मुझे सब आता है’ सोचकर सीखना बंद कर देना।","रागद्वेषफलप्रेप्सुः कर्ता… राजसः","जो अहंकार से काम करता है, वह रजोगुणी कर्ता कहलाता है।","टीम में काम करते समय श्रेय अकेले लेना चाहना।","मच्चित्तः सर्वदुर्गाणि मत्प्रसादात्तरिष्यसि","अगर मेरा स्मरण करोगे तो मेरी कृपा से सब कठिनाइयाँ पार कर लोगे।","अत्यधिक आत्मविश्वास से गलत फैसले होने लगते हैं। विनम्रता असर दिखाती है।","नियतं कुरु कर्म त्वं कर्म ज्यायो ह्यकर्मणः","अपने नियत कर्म करो, क्योंकि कर्म न करने से कर्म करना श्रेष्ठ है।","सुबह उठने में आलस — लेकिन उठकर काम शुरू करते ही ऊर्जा बढ़ जाती है।","कर्मणाैव हि संसिद्धिमास्थिता जनकादयः","जनक जैसे राजाओं ने भी कर्म करते हुए सिद्धि पाई।","सफल लोग रोज थोड़ा काम बढ़ाते हैं — आलसी लोग 'कल से शुरू करूँगा' कहते रह जाते हैं।","नात्यश्नतस्तु योगोऽस्ति न चैकान्तमनश्नतः","अति भोजन, उपवास, सोना या जागना — इनमें से कोई भी अधिक हो तो योग नहीं होता।","बहुत ज्यादा सोना → शरीर और मन दोनों सुस्त; संतुलित नींद → सक्रियता।","यदग्रे चानुबन्धे च सुखं मोहनमात्मनः","जो सुख पहले मीठा लगे और बाद में दुःख दे, वह तामसिक (आलसी) सुख है।","अभी मोबाइल स्क्रॉल करना अच्छा लगता है, लेकिन बाद में समय बर्बाद होने का पछतावा होता है।","काम एष क्रोध एष रजोगुणसमुद्भवः","काम (वासना) और क्रोध — दोनों रजोगुण से उत्पन्न होते हैं।","अनावश्यक आकर्षण रिश्तों को तोड़ देता है।","तस्मात्त्वमिन्द्रियाण्यादौ नियम्य भरतर्षभ","इच्छाओं को जीतने के लिए पहले इंद्रियों को नियंत्रित करना चाहिए।","अनुचित वेबसाइट, कंटेंट, कल्पनाएँ — मन को कमजोर बनाती हैं। नियंत्रण शक्ति बढ़ाता है।","एवं बुद्धेः परं बुद्ध्वा संस्थभ्यात्मानमात्मना","बुद्धि के बल से मन को रोककर वासना पर विजय प्राप्त करो।","जैसे शराब का ज्ञान होने पर व्यक्ति उससे दूर रहता है।","ये हि संस्पर्शजा भोगा दुःखयोनय एव ते","इंद्रिय भोगों से मिलने वाला सुख दुःख का कारण बनता है।","कुछ मिनट का बुरा आकर्षण → जीवनभर की समस्या।","यो मां पश्यति सर्वत्र तस्याहं न प्रणश्यामि","जो हर जगह मुझे देखता है, मैं भी उसके लिए कभी दूर नहीं होता।","ध्यान करते समय मन शांत होकर भीतर एक साथी का अनुभव करता है।","समोऽहं सर्वभूतेषु","भगवान सबमें समान हैं।","दूसरों के साथ प्रेमपूर्वक रहना अकेलापन दूर करता है।","अविभक्तं च भूतेषु विभक्तमिव च स्थितम्","ईश्वर सब जगह एक साथ स्थित है।","प्रकृति में घूमते समय ईश्वर का अनुभव— मन तुरंत भर जाता है।"],[[10,10,6,35,0,1,2,[30,31,29,40,58]],[11,11,16,4,3,4,5,[34,35,36,27,46]],[11,11,16,"13-14",6,7,8,[36,33,35,13,24]],[11,11,18,26,9,10,11,[33,36,34,49,8]],[11,11,18,58,12,13,14,[34,35,33,24,18]],[12,12,3,8,15,16,17,[15,39,38,40,18]],[12,12,3,20,18,19,20,[40,37,39,60,73]],[12,12,6,16,21,22,23,[37,38,40,15,58]],[12,12,18,39,24,25,26,[38,37,44,39,16]],[13,13,3,37,27,28,29,[43,44,71,42,5]],[13,13,3,41,30,31,32,[49,50,41,43,44]],[13,13,3,43,33,34,35,[41,44,60,42,18]],[13,13,5,22,36,37,38,[41,43,40,42,22]],[14,14,6,30,39,40,41,[47,46,48,27,67]],[14,14,9,29,42,43,44,[28,45,47,48,25]],[14,14,13,16,45,46,47,[45,46,48,67,24]]]);
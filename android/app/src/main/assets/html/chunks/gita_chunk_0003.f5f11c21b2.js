@@ -0,0 +1 @@
+GITA_CHUNK(3,["ज्योतिषामपि तज्ज्योतिः","ईश्वर सभी ज्योतियों का प्रकाश है।","अंधेरी रात में दीपक जले तो डर और अकेलापन दोनों खत्म हो जाते हैं।","यततो ह्यपि कौन्तेय पुरुषस्य विपश्चितः इन्द्रियाणि प्रमाथीनि हरन्ति प्रसभं मनः","इंद्रियाँ बुद्धिमान व्यक्ति का मन भी बलपूर्वक खींच लेती हैं।","शॉपिंग मॉल में अनावश्यक चीजें खरीद लेना।","तानी सर्वाणि संयम्य युक्त आसीत मत्परः","जो इंद्रियों को नियंत्रित करके मन को भगवान में लगाता है, वही स्थिर रहता है।","लक्ष्य स्पष्ट हो तो मन बहकता नहीं।","आपूर्यमाणम् अचलप्रतिष्ठं समुद्रमापः प्रविशन्ति यद्वत्","जैसे नदियाँ समुद्र में गिरती हैं और समुद्र नहीं भरता— वैसे ही इच्छाएँ आएँ पर मन विचलित न हो।","जितना भी पैसा आए — संतोष रखने वाला ही सुखी होता है।","दैवी ह्येषा गुणमयी मम माया दुरत्यया","मेरी मायाशक्ति (इच्छाएँ, लोभ, आकर्षण) पार करना कठिन है। पर जो मेरी शरण में आते हैं, वह इसे जीत लेते हैं।","जो व्यक्ति मन को भगवान/सत्य पर टिकाता है, वह लोभ में नहीं फँसता।","देहिनोऽस्मिन्यथा देहे कौमारं यौवनं जरा तथा देहान्तरप्राप्तिर्धीरस्तत्र न मुह्यति","जिस प्रकार शरीर में बाल्य, युवावस्था, और वृद्धावस्था आती है, उसी प्रकार मृत्यु के बाद आत्मा दूसरा शरीर प्राप्त करती है।","जैसे बच्चा बड़ा होकर नया स्कूल लेता है— आत्मा नया शरीर लेती है।","न जायते म्रियते वा कदाचित्","आत्मा न जन्म लेती है, न कभी मरती है।","बिजली का बल्ब बदल जाता है, लेकिन बिजली नहीं मरती।","वासांसि जीर्णानि यथा विहाय नवानि गृह्णाति नरोऽपराणि","मनुष्य पुराने वस्त्र छोड़कर नए लेता है; इसी तरह आत्मा पुराना शरीर छोड़ देती है।","पुरानी टी-शर्ट फट जाए तो नई पहनना ही स्वाभाविक है।","अव्यक्षोऽयं… अचलोऽयं सनातनः","आत्मा अदृश्य, अविचल और सनातन है।","जैसे हवा दिखती नहीं लेकिन होती है— वैसे आत्मा रहती है।","जातस्य हि ध्रुवो मृत्युर्ह ध्रुवं जन्म मृतस्य च","जो जन्मा है, उसकी मृत्यु निश्चित है। और जो मरा है, उसका जन्म निश्चित है।","सूर्योदय–सूर्यास्त की तरह जीवन–मृत्यु चलता रहता है।","नास्ति बुद्धिरयुक्तस्य न चायतन मनः शान्तिः","जिसका मन नियंत्रण में नहीं है, उसे शांति नहीं मिल सकती।","ज्यादा सोच, चिंता, डर → मन परेशान; ध्यान, अनुशासन → मन शांत।","विहाय कामान्यः सर्वान् शान्तिमाप्नोति निश्चलम्","जो इच्छाओं को छोड़ देता है, वह स्थिर शांति पाता है।","नए फोन की इच्छा न होने से मन शांत रहता है।","श्रद्धावाँल्लभते ज्ञानं तत्परः संयतेन्द्रियः","श्रद्धा और संयम रखने वाला ज्ञान पाता है और फिर शांति।","योग सीखने वाले लोग शांत होते हैं क्योंकि वे अपने मन को समझते हैं।","भोक्तारं यज्ञतपसां… शान्तिं ऋच्छति","जो ईश्वर को सर्वश्रेष्ठ मानता है, वह शांति पाता है।","जिन्हें आध्यात्मिकता का सहारा होता है, वे कठिन समय में भी शांत रहते हैं।","एतद्विदित्वा योगी परां शान्तिमधिगच्छति","योगी ज्ञान और समझ से परम शांति प्राप्त करता है।","जो व्यक्ति अपनी इच्छाओं पर नियंत्रण रखता है, वह अधिक शांत रहता है।","अपि चेत्सुदुराचारो सर्वं ज्ञानप्लवेनैव…","अगर तुमने बहुत बुरे कर्म भी किए हों, ज्ञान उन्हें नष्ट कर देता है।","गलती का एहसास → सीखना → सुधार — यही मोक्ष का मार्ग है।"],[[14,14,13,18,0,1,2,[46,45,47,10,3]],[15,15,2,60,3,4,5,[50,52,51,42,35]],[15,15,2,61,6,7,8,[51,49,52,42,10]],[15,15,2,70,9,10,11,[50,52,49,19,41]],[15,15,7,14,12,13,14,[51,50,49,10,24]],[16,16,2,13,15,16,17,[56,55,54,57,21]],[16,16,2,20,18,19,20,[56,53,55,57,12]],[16,16,2,22,21,22,23,[53,56,57,54,59]],[16,16,2,25,24,25,26,[53,55,54,57,16]],[16,16,2,27,27,28,29,[55,53,56,54,11]],[17,17,2,66,30,31,32,[62,61,60,59,42]],[17,17,2,71,33,34,35,[62,61,60,58,55]],[17,17,4,39,36,37,38,[61,62,58,59,43]],[17,17,5,29,39,40,41,[60,58,59,62,69]],[17,17,8,28,42,43,44,[58,59,60,61,73]],[18,18,4,36,45,46,47,[66,65,68,64,67]]]);
@@ -0,0 +1 @@
+GITA_CHUNK(4,["यथैधांसि समिद्धोऽग्निर्भस्मसात्कुरुते","जैसे आग लकड़ी को राख कर देती है, ज्ञान सभी पापों को जला देता है।","खुद को माफ करने वाला आगे बेहतर जीवन जी सकता है।","ब्रह्मण्याधाय कर्माणि संगं त्यक्त्वा करोति यः","जो अपने कर्म ईश्वर को अर्पित करता है, वह पाप से मुक्त रहता है।","किसी की मदद बिना स्वार्थ के करना।","अपि चेत्सुदुराचारो भजते मामनन्यभाक्","यदि अत्यंत पापी व्यक्ति भी एकाग्र भाव से मेरा स्मरण करे, तो वह शीघ्र धर्मात्मा हो जाता है।","किसी अपराधी ने आध्यात्मिकता अपनाकर जीवन बदल लिया।","यो मामजमनादिं च वेत्ति","जो मुझे अजन्मा और अनादि समझता है वह पाप से मुक्त हो जाता है।","‘ईश्वर हर जगह है’ यह समझ गलत आदतें छोड़ने में मदद करती है।","तत्र सत्त्वं निर्मलत्वात् प्रकाशकम्","सत्त्वगुण मन को शुद्ध और उज्ज्वल करता है।","साधना, योग, ध्यान पाप-पुण्य के बंधन को कम करते हैं।","सर्वधर्मान्परित्यज्य मामेकं शरणं व्रज","ईश्वर की शरण से सभी पाप मिट जाते हैं।","मन भारी हो तो ईश्वर को समर्पण मन हल्का कर देता है।","दुःखेष्वनुद्विग्नमनाः… रागद्वेषविरोधि:","जो दुःख में विचलित नहीं होता और जिसका मन राग-द्वेष से मुक्त है, वही स्थिरबुद्धि है।","किसी ने आपको कुछ कह दिया, अगर आप प्रतिक्रिया न दें, तो क्रोध नहीं आएगा।","ध्यानात् विषयेभूतेषु संगस्तेषूपजायते संगात् संजायते कामः कामात्क्रोधोऽभिजायते","विषयों के चिंतन से आसक्ति उत्पन्न होती है, आसक्ति से इच्छा, इच्छा से क्रोध।","जैसे आप चाहते थे कि सब आपकी तारीफ करें, लेकिन नहीं की — इसीलिए क्रोध आया।","क्रोधाद् भवति संमोहः संमोहात् स्मृतिविभ्रमः स्मृतिभ्रंशाद् बुद्धिनाशः बुद्धिनाशात्प्रणश्यति","क्रोध से भ्रम होता है, भ्रम से स्मृति नष्ट, स्मृति नष्ट होने से बुद्धि नष्ट, और बुद्धि नष्ट होने से मनुष्य गिर जाता है।","गुस्से में गाड़ी तेज चलाना और दुर्घटना हो जाना।","कामक्रोधवियुक्तानां यतीनां… परा शान्तिः","जो व्यक्ति काम और क्रोध से मुक्त है वह परम शांति प्राप्त करता है।","शांत स्वभाव के लोग कम गलतियाँ करते हैं।"],[[18,18,4,37,0,1,2,[66,63,69,65,67]],[18,18,5,10,3,4,5,[67,68,69,63,64]],[18,18,9,30,6,7,8,[63,64,67,65,68]],[18,18,10,3,9,10,11,[65,68,69,63,66]],[18,18,14,6,12,13,14,[65,67,69,63,7]],[18,18,18,66,15,16,17,[24,65,68,67,63]],[19,19,2,56,18,19,20,[71,73,72,44,9]],[19,19,2,62,21,22,23,[70,73,72,41,44]],[19,19,2,63,24,25,26,[71,73,70,6,14]],[19,19,5,26,27,28,29,[71,70,72,62,58]]]);
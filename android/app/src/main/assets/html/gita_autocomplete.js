@@ -0,0 +1 @@
+var GITA_AUTOCOMPLETE = {"k":8,"completions":[["1. विस्मृति / अर्थ भूल जाना",0],["अध्याय 15 • श्लोक 15",0],["अध्याय 18 • श्लोक 61",1],["2. डर लगना",2],["अध्याय 4 • श्लोक 10",2],["अध्याय 11 • श्लोक 50",3],["अध्याय 18 • श्लोक 30",4],["3. लालच क्यों होता है",5],["अध्याय 14 • श्लोक 17",5],["अध्याय 16 • श्लोक 21",6],["अध्याय 17 • श्लोक 25",7],["4. क्षमा का अभ्यास करें",8],["अध्याय 11 • श्लोक 44",8],["अध्याय 12 • श्लोक 13-14",9],["अध्याय 16 • श्लोक 1-3",10],["5. जन्म, ईश्वर क्या है",11],["अध्याय 16 • श्लोक 19",11],["अध्याय 18 • श्लोक 71",12],["6. भ्रम क्या है",13],["अध्याय 2 • श्लोक 7",13],["अध्याय 3 • श्लोक 2",14],["7. सुस्ती, थकावट",15],["अध्याय 2 • श्लोक 3",15],["अध्याय 2 • श्लोक 14",16],["अध्याय 2 • श्लोक 21",17],["8. हतोत्साहित हो जाना",18],["अध्याय 11 • श्लोक 33",18],["अध्याय 18 • श्लोक 48",19],["अध्याय 18 • श्लोक 78",20],["9. उम्मीद खो देना",21],["अध्याय 4 • श्लोक 11",21],["अध्याय 9 • श्लोक 22",22],["अध्याय 9 • श्लोक 34",23],["अध्याय 18 • श्लोक 66",24],["10. भेदभाव (Discrimination / Equality)",25],["अध्याय 5 • श्लोक 18",25],["अध्याय 5 • श्लोक 19",26],["अध्याय 6 • श्लोक 32",27],["अध्याय 9 • श्लोक 29",28],["11. अनियंत्रित मन",29],["अध्याय 6 • श्लोक 5",29],["अध्याय 6 • श्लोक 6",30],["अध्याय 6 • श्लोक 26",31],["अध्याय 6 • श्लोक 35",32],["12. गर्व",33],["अध्याय 16 • श्लोक 4",33],["अध्याय 16 • श्लोक 13-14",34],["अध्याय 18 • श्लोक 26",35],["अध्याय 18 • श्लोक 58",36],["13. आलस्य (Laziness)",37],["अध्याय 3 • श्लोक 8",37],["अध्याय 3 • श्लोक 20",38],["अध्याय 6 • श्लोक 16",39],["अध्याय 18 • श्लोक 39",40],["14. वासना (Lust / Desire)",41],["अध्याय 3 • श्लोक 37",41],["अध्याय 3 • श्लोक 41",42],["अध्याय 3 • श्लोक 43",43],["अध्याय 5 • श्लोक 22",44],["15. अकेलापन (Loneliness)",45],["अध्याय 6 • श्लोक 30",45],["अध्याय 13 • श्लोक 16",47],["अध्याय 13 • श्लोक 18",48],["16. लोभ उत्पन्न करना (Greed)",49],["अध्याय 2 • श्लोक 60",49],["अध्याय 2 • श्लोक 61",50],["अध्याय 2 • श्लोक 70",51],["अध्याय 7 • श्लोक 14",52],["17. प्रियजन की मृत्यु (Death of Loved Ones)",53],["अध्याय 2 • श्लोक 13",53],["अध्याय 2 • श्लोक 20",54],["अध्याय 2 • श्लोक 22",55],["अध्याय 2 • श्लोक 25",56],["अध्याय 2 • श्लोक 27",57],["18. शांति की तलाश (Searching for Peace)",58],["अध्याय 2 • श्लोक 66",58],["अध्याय 2 • श्लोक 71",59],["अध्याय 4 • श्लोक 39",60],["अध्याय 5 • श्लोक 29",61],["अध्याय 8 • श्लोक 28",62],["19. पापी महसूस करना (Feeling Guilty / Sinful)",63],["अध्याय 4 • श्लोक 36",63],["अध्याय 4 • श्लोक 37",64],["अध्याय 5 • श्लोक 10",65],["अध्याय 9 • श्लोक 30",66],["अध्याय 10 • श्लोक 3",67],["अध्याय 14 • श्लोक 6",68],["20. क्रोध आना (Anger)",70],["अध्याय 2 • श्लोक 56",70],["अध्याय 2 • श्लोक 62",71],["अध्याय 2 • श्लोक 63",72],["अध्याय 5 • श्लोक 26",73]],"nodes":[[["1","2","3","4","5","6","7","8","9 ","a","bh","d","equality","f","g","h","ishvar kya hai","jan","k","l","m","o","p","s","t","u","v","अ","आ","इश्वर क्या है","उ","क","खो देना","गर्व","ज","डर लगना","तलाश searching for peace","थकावट","देना","प","भ","म","ल","व","श","सुस्ति थकावट","ह"],[1,111,167,194,217,241,267,276,282,298,307,311,318,319,322,326,333,334,337,354,364,369,372,376,381,384,387,390,495,498,499,502,518,519,520,523,524,525,526,527,530,534,538,542,545,598,599],[0,3,7,11,15,18,21,25]],[[" ","0","1","2 ","3","4","5","6","7","8","9"],[2,6,12,23,28,39,48,54,71,77,107],[0,34,39,44,49,54,59,63]],[["3","vismriti arth bhul jana","विस्मृति अर्थ भुल जाना"],[3,4,5],[0,14]],[[],[],[14]],[[],[],[0]],[[],[],[0]],[[" "],[7],[34,4,83,85]],[["3","bhedbhav discrimination equality","भेदभाव discrimination equality","श्लोक 3"],[8,9,10,11],[34,85]],[[],[],[85]],[[],[],[34]],[[],[],[34]],[[],[],[85]],[[" "],[13],[39,5,12,26,30]],[["33","44","50","aniyantrit man","अनियत्रित मन","श्लोक "],[14,15,16,17,18,19],[39,5,12,26]],[[],[],[26]],[[],[],[12]],[[],[],[5]],[[],[],[39]],[[],[],[39]],[["33","44","50"],[20,21,22],[5,12,26]],[[],[],[26]],[[],[],[12]],[[],[],[5]],[["13 14","garv","गर्व","श्लोक 13 14"],[24,25,26,27],[44,13]],[[],[],[13]],[[],[],[44]],[[],[],[44]],[[],[],[13]],[[" "],[29],[49,13,46,61,62,69]],[["1","alasy lazines","आलस्य lazines","श्लोक 1"],[30,34,35,36],[49,13,46,61,62]],[["4","6","8"],[31,32,33],[13,46,61,62]],[[],[],[13,46]],[[],[],[61]],[[],[],[62]],[[],[],[49]],[[],[],[49]],[["6","8"],[37,38],[61,62]],[[],[],[61]],[[],[],[62]],[[" "],[40],[54,8,13,23,46,67,86]],[["17","6","vasna lust desire","वासना lust desire","श्लोक "],[41,42,43,44,45],[54,8,86]],[[],[],[8]],[[],[],[86]],[[],[],[54]],[[],[],[54]],[["17","6"],[46,47],[8,86]],[[],[],[8]],[[],[],[86]],[[" "],[49],[59,1]],[["15","akelapan lonelines","अकेलापन lonelines","श्लोक 15"],[50,51,52,53],[59,1]],[[],[],[1]],[[],[],[59]],[[],[],[59]],[[],[],[1]],[[" "],[55],[63,9,14,16,45,46,52,61]],[["1","21","4","lobh utpan karna gred","लोभ उत्पन करना gred","श्लोक "],[56,60,61,62,63,64],[63,9,14,16,45,46]],[[" 3","3 14","9"],[57,58,59],[14,16,46]],[[],[],[14]],[[],[],[46]],[[],[],[16]],[[],[],[9]],[[],[],[45]],[[],[],[63]],[[],[],[63]],[["1","21","4"],[65,69,70],[9,14,16,45,46]],[[" 3","3 14","9"],[66,67,68],[14,16,46]],[[],[],[14]],[[],[],[46]],[[],[],[16]],[[],[],[9]],[[],[],[45]],[[" "],[72],[68,8,10]],[["25","priyjan ki mrityu death of loved ones","प्रियजन कि मृत्यु death of loved ones","श्लोक 25"],[73,74,75,76],[68,10]],[[],[],[10]],[[],[],[68]],[[],[],[68]],[[],[],[10]],[[" "],[78],[74,2,6,17,27,28,33,35]],[["26","3","48","58","6","7","shanti ki talash searching for peace","श"],[79,80,83,84,85,88,91,92],[74,2,6,17,27,28,33,47]],[[],[],[47]],[["0","9"],[81,82],[6,53]],[[],[],[6]],[[],[],[53]],[[],[],[27]],[[],[],[48]],[["1","6"],[86,87],[2,33]],[[],[],[2]],[[],[],[33]],[["1","8"],[89,90],[17,28]],[[],[],[17]],[[],[],[28]],[[],[],[74]],[["ाति कि तलाश searching for peace","्लोक "],[93,94],[74,2,6,17,27,28,33,47]],[[],[],[74]],[["26","3","48","58","6","7"],[95,96,99,100,101,104],[2,6,17,27,28,33,47,48]],[[],[],[47]],[["0","9"],[97,98],[6,53]],[[],[],[6]],[[],[],[53]],[[],[],[27]],[[],[],[48]],[["1","6"],[102,103],[2,33]],[[],[],[2]],[[],[],[33]],[["1","8"],[105,106],[17,28]],[[],[],[17]],[[],[],[28]],[[" "],[108],[80,16,36]],[["papi mahsus karna feling guilty sinful","पापि महसुस करना feling guilty sinful"],[109,110],[80]],[[],[],[80]],[[],[],[80]],[[" ","0","1","2","5","6","7","8","9"],[112,156,160,161,162,163,164,165,166],[3,87,9,10,19,20,22,23]],[["1","2","3","56","6","7","dar lagna","डर लगना","श्लोक "],[113,116,122,123,124,130,133,134,135],[3,19,22,23,24,64,65,66]],[["3","4"],[114,115],[23,69]],[[],[],[69]],[[],[],[23]],[["0","1","2","5","7"],[117,118,119,120,121],[24,70,71,72,73]],[[],[],[70]],[[],[],[24]],[[],[],[71]],[[],[],[72]],[[],[],[73]],[[],[],[22]],[[],[],[88]],[["0","1","2","3","6"],[125,126,127,128,129],[64,65,75,89,90]],[[],[],[64]],[[],[],[65]],[[],[],[89]],[[],[],[90]],[[],[],[75]],[["0","1"],[131,132],[19,66,76]],[[],[],[66]],[[],[],[76]],[[],[],[3]],[[],[],[3]],[["1","2","3","56","6","7"],[136,139,145,146,147,153],[19,22,23,24,64,65,66,69]],[["3","4"],[137,138],[23,69]],[[],[],[69]],[[],[],[23]],[["0","1","2","5","7"],[140,141,142,143,144],[24,70,71,72,73]],[[],[],[70]],[[],[],[24]],[[],[],[71]],[[],[],[72]],[[],[],[73]],[[],[],[22]],[[],[],[88]],[["0","1","2","3","6"],[148,149,150,151,152],[64,65,75,89,90]],[[],[],[64]],[[],[],[65]],[[],[],[89]],[[],[],[90]],[[],[],[75]],[["0","1"],[154,155],[19,66,76]],[[],[],[66]],[[],[],[76]],[[" "],[157],[87,51,70]],[["krodh ana anger","क्रोध आना anger"],[158,159],[87]],[[],[],[87]],[[],[],[87]],[[],[],[9,24]],[[],[],[31,58,71]],[[],[],[10,72]],[[],[],[42,47,91]],[[],[],[73]],[[],[],[79]],[[],[],[38,78]],[[" ","0","2","3","4","5","6","7","9"],[168,186,187,188,189,190,191,192,193],[7,6,14,20,22,26,32,37]],[["2","37","4","8","lalach kyon hota hai","लालच क्यो होता है","श्लोक "],[169,171,172,175,176,177,178],[7,20,50,51,55,56,57]],[["0"],[170],[20,51]],[[],[],[51]],[[],[],[55]],[["1","3"],[173,174],[56,57]],[[],[],[56]],[[],[],[57]],[[],[],[50]],[[],[],[7]],[[],[],[7]],[["2","37","4","8"],[179,181,182,185],[20,50,51,55,56,57]],[["0"],[180],[20,51]],[[],[],[51]],[[],[],[55]],[["1","3"],[183,184],[56,57]],[[],[],[56]],[[],[],[57]],[[],[],[50]],[[],[],[6,60,84]],[[],[],[37]],[[],[],[26]],[[],[],[32]],[[],[],[43]],[[],[],[81]],[[],[],[55,82]],[[],[],[53,77]],[[" ","1","3","4","8"],[195,213,214,215,216],[11,4,12,27,30,45,56,57]],[["1","3","kshama ka abhyas karen","क्षमा का अभ्यास करे","श्लोक "],[196,199,203,204,205],[11,4,30,77,81,82]],[["0","1"],[197,198],[4,30]],[[],[],[4]],[[],[],[30]],[["6","7","9"],[200,201,202],[77,81,82]],[[],[],[81]],[[],[],[82]],[[],[],[77]],[[],[],[11]],[[],[],[11]],[["1","3"],[206,209],[4,30,77,81,82]],[["0","1"],[207,208],[4,30]],[[],[],[4]],[[],[],[30]],[["6","7","9"],[210,211,212],[77,81,82]],[[],[],[81]],[[],[],[82]],[[],[],[77]],[[],[],[56]],[[],[],[57]],[[],[],[12]],[[],[],[27]],[[" ","0","6","8"],[218,238,239,240],[15,5,35,36,40,48,58,78]],[["1","2","janm ishvar kya hai","जम इश्वर क्या है","श्लोक "],[219,223,227,228,229],[15,35,36,58,78,83,91]],[["0","8","9"],[220,221,222],[35,36,83]],[[],[],[83]],[[],[],[35]],[[],[],[36]],[["2","6","9"],[224,225,226],[58,78,91]],[[],[],[58]],[[],[],[91]],[[],[],[78]],[[],[],[15]],[[],[],[15]],[["1","2"],[230,234],[35,36,58,78,83,91]],[["0","8","9"],[231,232,233],[35,36,83]],[[],[],[83]],[[],[],[35]],[[],[],[36]],[["2","6","9"],[235,236,237],[58,78,91]],[[],[],[58]],[[],[],[91]],[[],[],[78]],[[],[],[5]],[[],[],[88]],[[],[],[48]],[[" ","0","1","2","3","6"],[242,262,263,264,265,266],[18,2,33,37,40,41,42,43]],[["16","26","3","5","6","bhram kya hai","भ्रम क्या है","श्लोक "],[243,244,245,249,250,251,252,253],[18,37,40,41,42,43,52,60]],[[],[],[52]],[[],[],[42]],[["0","2","5"],[246,247,248],[37,43,60]],[[],[],[60]],[[],[],[37]],[[],[],[43]],[[],[],[40]],[[],[],[41]],[[],[],[18]],[[],[],[18]],[["16","26","3","5","6"],[254,255,256,260,261],[37,40,41,42,43,52,60]],[[],[],[52]],[[],[],[42]],[["0","2","5"],[257,258,259],[37,43,60]],[[],[],[60]],[[],[],[37]],[[],[],[43]],[[],[],[40]],[[],[],[41]],[[],[],[64]],[[],[],[2,65]],[[],[],[89]],[[],[],[90]],[[],[],[33,75]],[[" ","0","1","8"],[268,273,274,275],[21,17,19,28,66,67,76]],[["14","susti thakavat","श्लोक 14","सुस्ति थकावट"],[269,270,271,272],[21,67]],[[],[],[67]],[[],[],[21]],[[],[],[67]],[[],[],[21]],[[],[],[66]],[[],[],[17,76]],[[],[],[28]],[[" "],[277],[25,50,79]],[["28","hatotsahit ho jana","श्लोक 28","हतोत्साहित हो जाना"],[278,279,280,281],[25,79]],[[],[],[79]],[[],[],[25]],[[],[],[79]],[[],[],[25]],[["2","3","umid kho dena","उमिद खो देना","श्लोक "],[283,286,289,290,291],[29,31,32,38,84]],[["2","9"],[284,285],[31,38]],[[],[],[31]],[[],[],[38]],[["0","4"],[287,288],[32,84]],[[],[],[84]],[[],[],[32]],[[],[],[29]],[[],[],[29]],[["2","3"],[292,295],[31,32,38,84]],[["2","9"],[293,294],[31,38]],[[],[],[31]],[[],[],[38]],[["0","4"],[296,297],[32,84]],[[],[],[84]],[[],[],[32]],[["bhyas karen","kelapan lonelines","lasy lazines","n","rth bhul jana"],[299,300,301,302,306],[0,11,39,49,59,87]],[[],[],[11]],[[],[],[59]],[[],[],[49]],[["a anger","ger","iyantrit man"],[303,304,305],[39,87]],[[],[],[87]],[[],[],[87]],[[],[],[39]],[[],[],[0]],[["edbhav discrimination equality","ram kya hai","ul jana"],[308,309,310],[0,18,34]],[[],[],[34]],[[],[],[18]],[[],[],[0]],[["ar lagna","e","iscrimination equality"],[312,313,317],[3,29,34,54,68]],[[],[],[3]],[["ath of loved ones","na","sire"],[314,315,316],[29,54,68]],[[],[],[68]],[[],[],[29]],[[],[],[54]],[[],[],[34]],[[],[],[34]],[["eling guilty sinful","or peace"],[320,321],[74,80]],[[],[],[80]],[[],[],[74]],[["arv","red","uilty sinful"],[323,324,325],[44,63,80]],[[],[],[44]],[[],[],[63]],[[],[],[80]],[["a","o"],[327,330],[7,15,18,25]],[["i","totsahit ho jana"],[328,329],[7,15,18,25]],[[],[],[7,15,18]],[[],[],[25]],[[" jana","ta hai"],[331,332],[7,25]],[[],[],[25]],[[],[],[7]],[[],[],[15]],[["a","m ishvar kya hai"],[335,336],[0,15,25]],[[],[],[0,25]],[[],[],[15]],[["a","ho dena","i ","rodh ana anger","shama ka abhyas karen","y"],[338,345,346,349,350,351],[7,11,15,18,29,63,68,74]],[[" abhyas karen","r"],[339,340],[11,63,80]],[[],[],[11]],[["en","na "],[341,342],[11,63,80]],[[],[],[11]],[["feling guilty sinful","gred"],[343,344],[63,80]],[[],[],[80]],[[],[],[63]],[[],[],[29]],[["mrityu death of loved ones","talash searching for peace"],[347,348],[68,74]],[[],[],[68]],[[],[],[74]],[[],[],[87]],[[],[],[11]],[["a hai","on hota hai"],[352,353],[7,15,18]],[[],[],[15,18]],[[],[],[7]],[["a","o","ust desire"],[355,359,363],[3,7,49,54,59,63,68]],[["gna","lach kyon hota hai","zines"],[356,357,358],[3,7,49]],[[],[],[3]],[[],[],[7]],[[],[],[49]],[["bh utpan karna gred","nelines","ved ones"],[360,361,362],[59,63,68]],[[],[],[63]],[[],[],[59]],[[],[],[68]],[[],[],[54]],[["a","rityu death of loved ones"],[365,368],[39,68,80]],[["hsus karna feling guilty sinful","n"],[366,367],[39,80]],[[],[],[80]],[[],[],[39]],[[],[],[68]],[["f loved ones","nes"],[370,371],[68]],[[],[],[68]],[[],[],[68]],[["api mahsus karna feling guilty sinful","eace","riyjan ki mrityu death of loved ones"],[373,374,375],[68,74,80]],[[],[],[80]],[[],[],[74]],[[],[],[68]],[["earching for peace","hanti ki talash searching for peace","inful","usti thakavat"],[377,378,379,380],[21,74,80]],[[],[],[74]],[[],[],[74]],[[],[],[80]],[[],[],[21]],[["alash searching for peace","hakavat"],[382,383],[21,74]],[[],[],[74]],[[],[],[21]],[["mid kho dena","tpan karna gred"],[385,386],[29,63]],[[],[],[29]],[[],[],[63]],[["asna lust desire","ismriti arth bhul jana"],[388,389],[0,54]],[[],[],[54]],[[],[],[0]],[["केलापन lonelines","ध्याय ","नियत्रित मन","भ्यास करे","र्थ भुल जाना"],[391,392,492,493,494],[0,11,39,59,1,2,4,5]],[[],[],[59]],[["1","2 श्लोक ","3 श्लोक ","4 श्लोक ","5 श्लोक ","6 श्लोक ","7 श्लोक 14","8 श्लोक 28","9 श्लोक "],[393,428,449,457,465,474,483,484,485],[1,2,4,5,6,8,9,10]],[["0 श्लोक 3","1 श्लोक ","2 श्लोक 13 14","3 श्लोक 1","4 श्लोक ","5 श्लोक 15","6 श्लोक ","7 श्लोक 25","8 श्लोक "],[394,395,399,400,403,406,407,414,415],[1,2,5,6,8,9,10,12]],[[],[],[85]],[["33","44","50"],[396,397,398],[5,12,26]],[[],[],[26]],[[],[],[12]],[[],[],[5]],[[],[],[13]],[["6","8"],[401,402],[61,62]],[[],[],[61]],[[],[],[62]],[["17","6"],[404,405],[8,86]],[[],[],[8]],[[],[],[86]],[[],[],[1]],[["1","21","4"],[408,412,413],[9,14,16,45,46]],[[" 3","3 14","9"],[409,410,411],[14,16,46]],[[],[],[14]],[[],[],[46]],[[],[],[16]],[[],[],[9]],[[],[],[45]],[[],[],[10]],[["26","3","48","58","6","7"],[416,417,420,421,422,425],[2,6,17,27,28,33,47,48]],[[],[],[47]],[["0","9"],[418,419],[6,53]],[[],[],[6]],[[],[],[53]],[[],[],[27]],[[],[],[48]],[["1","6"],[423,424],[2,33]],[[],[],[2]],[[],[],[33]],[["1","8"],[426,427],[17,28]],[[],[],[17]],[[],[],[28]],[["1","2","3","56","6","7"],[429,432,438,439,440,446],[19,22,23,24,64,65,66,69]],[["3","4"],[430,431],[23,69]],[[],[],[69]],[[],[],[23]],[["0","1","2","5","7"],[433,434,435,436,437],[24,70,71,72,73]],[[],[],[70]],[[],[],[24]],[[],[],[71]],[[],[],[72]],[[],[],[73]],[[],[],[22]],[[],[],[88]],[["0","1","2","3","6"],[441,442,443,444,445],[64,65,75,89,90]],[[],[],[64]],[[],[],[65]],[[],[],[89]],[[],[],[90]],[[],[],[75]],[["0","1"],[447,448],[19,66,76]],[[],[],[66]],[[],[],[76]],[["2","37","4","8"],[450,452,453,456],[20,50,51,55,56,57]],[["0"],[451],[20,51]],[[],[],[51]],[[],[],[55]],[["1","3"],[454,455],[56,57]],[[],[],[56]],[[],[],[57]],[[],[],[50]],[["1","3"],[458,461],[4,30,77,81,82]],[["0","1"],[459,460],[4,30]],[[],[],[4]],[[],[],[30]],[["6","7","9"],[462,463,464],[77,81,82]],[[],[],[81]],[[],[],[82]],[[],[],[77]],[["1","2"],[466,470],[35,36,58,78,83,91]],[["0","8","9"],[467,468,469],[35,36,83]],[[],[],[83]],[[],[],[35]],[[],[],[36]],[["2","6","9"],[471,472,473],[58,78,91]],[[],[],[58]],[[],[],[91]],[[],[],[78]],[["16","26","3","5","6"],[475,476,477,481,482],[37,40,41,42,43,52,60]],[[],[],[52]],[[],[],[42]],[["0","2","5"],[478,479,480],[37,43,60]],[[],[],[60]],[[],[],[37]],[[],[],[43]],[[],[],[40]],[[],[],[41]],[[],[],[67]],[[],[],[79]],[["2","3"],[486,489],[31,32,38,84]],[["2","9"],[487,488],[31,38]],[[],[],[31]],[[],[],[38]],[["0","4"],[490,491],[32,84]],[[],[],[84]],[[],[],[32]],[[],[],[39]],[[],[],[11]],[[],[],[0]],[["ना anger","लस्य lazines"],[496,497],[49,87]],[[],[],[87]],[[],[],[49]],[[],[],[15]],[["त्पन करना gred","मिद खो देना"],[500,501],[29,63]],[[],[],[63]],[[],[],[29]],[["र","ा अभ्यास करे","ि ","्"],[503,508,509,512],[7,11,15,18,63,68,74,80]],[["ना ","े"],[504,507],[11,63,80]],[["feling guilty sinful","gred"],[505,506],[63,80]],[[],[],[80]],[[],[],[63]],[[],[],[11]],[[],[],[11]],[["तलाश searching for peace","मृत्यु death of loved ones"],[510,511],[68,74]],[[],[],[74]],[[],[],[68]],[["य","रोध आना anger","षमा का अभ्यास करे"],[513,516,517],[7,11,15,18,87]],[["ा है","ो होता है"],[514,515],[7,15,18]],[[],[],[15,18]],[[],[],[7]],[[],[],[87]],[[],[],[11]],[[],[],[29]],[[],[],[44]],[["म इश्वर क्या है","ाना"],[521,522],[0,15,25]],[[],[],[15]],[[],[],[0,25]],[[],[],[3]],[[],[],[74]],[[],[],[21]],[[],[],[29]],[["ापि महसुस करना feling guilty sinful","्रियजन कि मृत्यु death of loved ones"],[528,529],[68,80]],[[],[],[80]],[[],[],[68]],[["ुल जाना","ेदभाव discrimination equality","्रम क्या है"],[531,532,533],[0,18,34]],[[],[],[0]],[[],[],[34]],[[],[],[18]],[["न","हसुस करना feling guilty sinful","ृत्यु death of loved ones"],[535,536,537],[39,68,80]],[[],[],[39]],[[],[],[80]],[[],[],[68]],[["गना","ालच क्यो होता है","ोभ उत्पन करना gred"],[539,540,541],[3,7,63]],[[],[],[3]],[[],[],[7]],[[],[],[63]],[["ासना lust desire","िस्मृति अर्थ भुल जाना"],[543,544],[0,54]],[[],[],[54]],[[],[],[0]],[["ाति कि तलाश searching for peace","्लोक "],[546,547],[74,1,2,4,5,6,8,9]],[[],[],[74]],[["1","2","3","4","5","6","7","8"],[548,560,569,578,583,587,593,597],[1,2,4,5,6,8,9,10]],[[" 3","0","1","3","4","5","6","7","8","9"],[549,550,551,552,554,555,556,557,558,559],[1,4,8,13,14,16,23,30]],[[],[],[14]],[[],[],[4,83]],[[],[],[30]],[[" 14"],[553],[13,46,69]],[[],[],[13,46]],[[],[],[23,67]],[[],[],[1]],[[],[],[52,61]],[[],[],[8]],[[],[],[35,62]],[[],[],[16,36]],[["0","1","2","5","6","7","8","9"],[561,562,563,564,565,566,567,568],[9,10,20,24,31,38,42,47]],[[],[],[51,70]],[[],[],[9,24]],[[],[],[31,58,71]],[[],[],[10,72]],[[],[],[42,47,91]],[[],[],[73]],[[],[],[79]],[[],[],[38,78]],[["0","2","3","4","5","6","7","9"],[570,571,572,573,574,575,576,577],[6,22,26,32,37,43,53,55]],[[],[],[6,60,84]],[[],[],[37]],[[],[],[26]],[[],[],[32]],[[],[],[43]],[[],[],[81]],[[],[],[55,82]],[[],[],[53,77]],[["1","3","4","8"],[579,580,581,582],[12,27,45,56,57]],[[],[],[56]],[[],[],[57]],[[],[],[12]],[[],[],[27]],[["0","6","8"],[584,585,586],[5,40,48,88]],[[],[],[5]],[[],[],[88]],[[],[],[48]],[["0","1","2","3","6"],[588,589,590,591,592],[2,33,41,64,65,75,86,89]],[[],[],[64]],[[],[],[2,65]],[[],[],[89]],[[],[],[90]],[[],[],[33,75]],[["0","1","8"],[594,595,596],[17,19,28,66,76]],[[],[],[66]],[[],[],[17,76]],[[],[],[28]],[[],[],[50]],[[],[],[21]],[["तोत्साहित हो जाना","ै","ो"],[600,601,602],[7,15,18,25]],[[],[],[25]],[[],[],[7,15,18]],[[" जाना","ता है"],[603,604],[7,25]],[[],[],[25]],[[],[],[7]]]};
@@ -0,0 +1 @@
+var GITA_SEARCH_INDEX = "R1NJWAEAAADDCAAASgAAAM8UAABzZwAAzxQAAAAAAAAAAAAABgAAAAwAAAAQAAAAFAAAABgAAAAcAAAAIAAAACUAAAAqAAAAMQAAADQAAAA4AAAAOwAAADwAAAA/AAAAQQAAAEMAAABGAAAASQAAAE0AAABPAAAAUAAAAFEAAABSAAAAVgAAAFcAAABYAAAAWQAAAFoAAABbAAAAXAAAAF0AAABgAAAAYQAAAGIAAABjAAAAZAAAAGcAAABpAAAAagAAAGsAAABtAAAAbgAAAHcAAAB4AAAAeQAAAHoAAAB7AAAAfgAAAH8AAACAAAAAgQAAAIQAAACFAAAAhwAAAIsAAACMAAAAjwAAAJMAAACVAAAAlgAAAJoAAACbAAAAnAAAAJ0AAACfAAAAoQAAAKIAAACjAAAApAAAAKgAAACuAAAArwAAALEAAACyAAAAtAAAALUAAAC2AAAAuAAAALoAAAC7AAAAvAAAAMEAAADDAAAAxAAAAMUAAADGAAAAyAAAAMwAAADNAAAA1AAAANcAAADYAAAA2QAAANoAAADbAAAA4AAAAOEAAADjAAAA5AAAAOUAAADmAAAA5wAAAOgAAADpAAAA6gAAAOsAAADtAAAA7gAAAPQAAAD2AAAA+wAAAAIBAAAEAQAABQEAAAYBAAAJAQAACgEAAAsBAAAMAQAADQEAAA4BAAAPAQAAEAEAABEBAAASAQAAEwEAABsBAAAcAQAAHgEAAB8BAAAgAQAAIQEAACIBAAArAQAALAEAAC8BAAAwAQAAMQEAADIBAAAzAQAANAEAADUBAAA2AQAANwEAADkBAAA6AQAAOwEAADwBAAA+AQAAQAEAAEEBAABCAQAAQwEAAEUBAABSAQAAVAEAAFUBAABWAQAAVwEAAFgBAABaAQAAWwEAAFwBAABfAQAAYAEAAGEBAABiAQAAYwEAAGUBAABmAQAAaAEAAGkBAABqAQAAawEAAG0BAABuAQAAcgEAAHQBAACHAQAAiAEAAIkBAACKAQAAiwEAAIwBAACNAQAAjgEAAI8BAACQAQAAkQEAAJIBAACTAQAAmAEAAJkBAACaAQAAmwEAAJwBAACdAQAAogEAAKMBAACkAQAApQEAAKYBAACnAQAAqAEAAKkBAACrAQAArAEAAK0BAACuAQAArwEAALYBAAC3AQAAuwEAALwBAAC/AQAAwAEAAMEBAADCAQAAwwEAAMQBAADFAQAAxwEAAMgBAADJAQAAygEAAMsBAADMAQAAzQEAAM4BAADPAQAA0AEAANIBAADUAQAA1QEAANcBAADYAQAA2QEAANoBAADdAQAA4gEAAOMBAADlAQAA6QEAAOsBAADsAQAA7QEAAO4BAADvAQAA8AEAAPEBAADyAQAA8wEAAPgBAAD5AQAA+gEAAPsBAAD8AQAA/gEAAP8BAAAAAgAABQIAAAYCAAAHAgAACAIAAAkCAAALAgAADwIAABACAAAZAgAAGwIAAB0CAAAhAgAALAIAAC8CAAAxAgAAMgIAADMCAAA0AgAANQIAADYCAAA3AgAAOAIAADkCAAA6AgAAPgIAAEACAABBAgAARAIAAEUCAABGAgAASAIAAEkCAABKAgAASwIAAEwCAABRAgAAUgIAAFMCAABUAgAAWAIAAFkCAABaAgAAWwIAAFwCAABdAgAAXgIAAGECAABiAgAAYwIAAGQCAABlAgAAZwIAAGgCAABsAgAAbQIAAG4CAABvAgAAcgIAAHMCAAB0AgAAeAIAAHkCAAB6AgAAewIAAH0CAAB+AgAAgQIAAIICAACDAgAAhQIAAIYCAACNAgAAkgIAAJMCAACYAgAAmQIAAJoCAACeAgAAoQIAAKICAACjAgAApAIAAKUCAACnAgAAqwIAAKwCAACwAgAAsQIAALICAACzAgAAtAIAALgCAAC5AgAAwAIAAMECAADCAgAAxQIAAMYCAADJAgAAygIAAMsCAADNAgAAzwIAANMCAADUAgAA2wIAANwCAADdAgAA3gIAAN8CAADgAgAA4wIAAOQCAAArAwAASgMAAFkDAABaAwAAWwMAAHIDAAB0AwAAdwMAAHoDAACDAwAAlwMAAJ8DAACmAwAAqAMAAKkDAACqAwAArAMAAK0DAAC0AwAAtQMAALYDAAC3AwAAugMAAL0DAADBAwAAwgMAAMMDAADEAwAAxQMAAMYDAADHAwAAygMAAMsDAADMAwAAzgMAAM8DAADQAwAA0QMAANIDAADWAwAA4gMAAOMDAADsAwAA7QMAAO4DAADxAwAA8gMAAPMDAAD1AwAA9gMAAPcDAAD4AwAAAgQAAAMEAAAEBAAABQQAAAYEAAAKBAAADAQAAA4EAAAXBAAAGAQAAB4EAAAjBAAAJAQAAC4EAAAvBAAAMAQAADEEAAAyBAAAMwQAADYEAAA4BAAAOQQAADoEAAA7BAAAQAQAAEEEAABCBAAAQwQAAEQEAABKBAAASwQAAEwEAABNBAAAVQQAAFYEAABXBAAAWAQAAHMEAAB0BAAAdQQAAHcEAAB6BAAAewQAAHwEAAB9BAAAfgQAAJsEAAChBAAAogQAAKMEAAClBAAApgQAAKcEAACoBAAArAQAALAEAACxBAAAsgQAAL8EAADABAAAwQQAAMIEAADEBAAAxQQAAMYEAADHBAAAyAQAAMkEAADKBAAA1AQAANYEAADXBAAA3AQAAN0EAADeBAAA4AQAAOkEAADqBAAA6wQAAOwEAAD/BAAAAwUAAAcFAAAJBQAACgUAAAsFAAAMBQAAHAUAAB0FAAAnBQAAKQUAACoFAAArBQAALQUAAC4FAAAvBQAAMQUAADIFAAAzBQAANAUAADcFAAA4BQAAOQUAAE4FAABPBQAAUAUAAFEFAABrBQAAbQUAAG4FAAB3BQAAeAUAAHkFAAChBQAAowUAAKQFAACnBQAAqAUAAKkFAACqBQAAqwUAALMFAAC0BQAAtQUAALYFAAC3BQAAugUAALsFAAC8BQAAvQUAAMMFAADHBQAAyAUAAMkFAADOBQAA0QUAANgFAADZBQAA2gUAANsFAADcBQAA3QUAAN4FAADfBQAA4gUAAOYFAADnBQAA6wUAAOwFAADuBQAA8QUAAPIFAADzBQAA9QUAAPYFAAD+BQAAAAYAAAIGAAADBgAABwYAAAsGAAAOBgAAEAYAABcGAAAaBgAAGwYAAB8GAAAgBgAAJQYAACkGAAAqBgAAKwYAAC4GAAAvBgAAMAYAADEGAAAyBgAAMwYAADoGAAA8BgAAPQYAAD8GAABABgAAQQYAAGQGAABlBgAAZgYAAGcGAABoBgAAaQYAAGoGAABsBgAAcgYAAHMGAAB2BgAAdwYAAHgGAAB6BgAAewYAAIEGAACCBgAAgwYAAIUGAACGBgAAiAYAAIoGAAC1BgAAuwYAALwGAADBBgAAwgYAAMMGAADFBgAAxwYAAMkGAADKBgAAywYAAMwGAADPBgAA0QYAANQGAADVBgAA1gYAANcGAADYBgAA2QYAANoGAADbBgAA3AYAAOEGAADiBgAA4wYAAOQGAADqBgAA6wYAAPIGAADzBgAA9AYAAPUGAAAFBwAABgcAAAgHAAAnBwAAKAcAACkHAAAqBwAAKwcAACwHAAAtBwAALgcAAC8HAAAyBwAAMwcAADQHAAA1BwAANwcAADsHAAA8BwAAPQcAAD4HAABDBwAARAcAAEUHAABGBwAARwcAAEgHAABLBwAATAcAAE0HAABOBwAAUAcAAFEHAABWBwAAWAcAAFkHAABaBwAAWwcAAGAHAABlBwAAiAcAAIkHAACLBwAAjAcAAI0HAACOBwAAkAcAAJEHAACSBwAAkwcAAJQHAACWBwAAmwcAAKIHAACkBwAAswcAALQHAAC2BwAAuAcAALkHAAC6BwAAvAcAAL4HAAC/BwAAwgcAAMMHAADEBwAAxgcAAMwHAADNBwAA0gcAANUHAADWBwAA1wcAANkHAADbBwAA3AcAAN0HAADfBwAA4QcAAOIHAADkBwAA5QcAAOYHAADnBwAA6AcAAOkHAADqBwAA8QcAAPIHAADzBwAA9AcAAPUHAAD2BwAA9wcAAPgHAAD5BwAA/gcAAAAIAAABCAAAAggAAAMIAAAFCAAABggAAAcIAAAICAAACggAAAsIAAAMCAAADQgAAA4IAAAPCAAAEAgAABEIAAATCAAAHAgAAB0IAAAfCAAAIAgAACIIAAAkCAAAJQgAACYIAAAnCAAAKAgAACkIAAAqCAAAKwgAADAIAAAxCAAAMggAADUIAAA3CAAAOAgAADkIAAA6CAAAOwgAADwIAAA9CAAAPggAAD8IAABACAAAQQgAAEIIAABDCAAARQgAAEcIAABNCAAAVAgAAFUIAABYCAAAWggAAFsIAABcCAAAXQgAAF4IAABfCAAAZQgAAGYIAABrCAAAbAgAAG0IAABuCAAAcwgAAHcIAAB7CAAAfAgAAH0IAAB/CAAAgAgAAIMIAACECAAAhQgAAIoIAACLCAAAjQgAAI4IAACXCAAAmAgAAJkIAACaCAAAmwgAAJwIAACeCAAAnwgAAKAIAAChCAAAoggAAKMIAACkCAAApQgAAKYIAACnCAAAqAgAAKkIAACqCAAAqwgAAKwIAACtCAAArggAAK8IAACwCAAAsQgAALMIAAC0CAAAtQgAALYIAAC3CAAAwggAAMkIAADKCAAAywgAAMwIAADNCAAAzggAANAIAADRCAAA0ggAANMIAADUCAAA1wgAANgIAADfCAAA4QgAAOIIAADkCAAA5ggAAOgIAADpCAAA6wgAAOwIAADtCAAA7ggAAPAIAAD1CAAA9ggAAPgIAAD5CAAA+ggAAPsIAAD8CAAA/QgAAAAJAAArCQAAMAkAADEJAAAyCQAANAkAADUJAAA2CQAANwkAAD4JAABACQAAQQkAAEIJAABDCQAARAkAAEcJAABJCQAASgkAAEsJAABMCQAATQkAAE4JAABPCQAAUAkAAFEJAABSCQAAUwkAAFYJAABYCQAAWQkAAFoJAABdCQAAXgkAAF8JAABgCQAAYQkAAGQJAABlCQAAaAkAAGkJAABqCQAAawkAAGwJAABuCQAAbwkAAHAJAABzCQAAdAkAAHUJAAB2CQAAdwkAAH0JAAB+CQAAfwkAAIAJAACBCQAAhAkAAIgJAACJCQAAigkAAIsJAACOCQAAjwkAAJMJAACUCQAAlQkAAJcJAACYCQAAmwkAAKAJAAChCQAAowkAAKQJAAClCQAApgkAAKcJAACoCQAAqQkAAKsJAACsCQAArQkAAK4JAACvCQAAsAkAALEJAACyCQAAswkAALUJAAC2CQAAtwkAALgJAAC5CQAAugkAALsJAAC8CQAAvQkAAL4JAAC/CQAA0gkAANQJAADVCQAA1gkAANcJAADYCQAA2QkAANoJAADbCQAA3AkAAN0JAADeCQAA3wkAAOAJAADhCQAA4gkAAOMJAADkCQAA5QkAAOYJAADnCQAA6AkAAOwJAADvCQAA8AkAAPIJAAD0CQAA9QkAAPYJAAD6CQAAAgoAAAQKAAAJCgAACgoAAAsKAAAMCgAADQoAAA4KAAAQCgAAEQoAABMKAAAUCgAAFgoAAB0KAAAeCgAAHwoAADIKAAAzCgAANAoAADsKAAA8CgAAPQoAAEQKAABGCgAARwoAAEkKAABKCgAASwoAAE8KAABQCgAAUQoAAFUKAABWCgAAVwoAAFgKAABaCgAAWwoAAFwKAABfCgAAYAoAAGEKAABiCgAAZAoAAGgKAABpCgAAawoAAGwKAABtCgAAbwoAAHAKAABxCgAAcgoAAHMKAAB1CgAAdgoAAIQKAACFCgAAhgoAAIcKAACQCgAAkQoAAJMKAACUCgAAlgoAAJcKAACYCgAAngoAAKAKAACiCgAAowoAAKQKAAClCgAApgoAAKcKAACpCgAAqgoAAKsKAACtCgAArgoAALIKAACzCgAAtgoAALoKAAC7CgAAvAoAAL4KAAC/CgAAwAoAAMEKAADCCgAAwwoAAMQKAADGCgAAygoAAMsKAADUCgAA1QoAANYKAADXCgAA2AoAANkKAADaCgAA2woAANwKAADeCgAA3woAAOAKAADhCgAA5AoAAOUKAADmCgAA6AoAAOsKAADsCgAA7QoAAO4KAADvCgAA8QoAAPcKAAD4CgAA+goAAPsKAAD9CgAA/goAAAALAAAECwAABQsAAAgLAAAPCwAAEAsAABELAAATCwAAFAsAABULAAAWCwAAGgsAABsLAAAcCwAAIQsAACMLAAAkCwAAJQsAACYLAAAnCwAAKAsAACkLAAArCwAALAsAAC0LAAAuCwAALwsAADILAAAzCwAANQsAADcLAAA4CwAAOQsAADoLAAA7CwAAPgsAAD8LAABACwAAQQsAAEcLAABLCwAATQsAAE8LAABQCwAAVwsAAFgLAABZCwAAWgsAAFsLAABeCwAAXwsAAGMLAABkCwAAaQsAAGoLAABrCwAAbAsAAG4LAABvCwAAcAsAAHELAAB0CwAAdgsAAHoLAAB7CwAAfAsAAH0LAAB+CwAAfwsAAIALAACDCwAAhgsAAIoLAACMCwAAjQsAAI4LAACPCwAAkAsAAJELAACUCwAAlQsAAJYLAACiCwAAowsAAKcLAACoCwAAqQsAAKoLAACrCwAArAsAAK0LAACvCwAAsAsAALELAACyCwAAtAsAALYLAAC3CwAAvgsAAL8LAADACwAAwQsAAMILAADECwAAxgsAAMcLAADICwAAzAsAANALAADRCwAA1gsAANcLAADYCwAA2QsAANsLAADdCwAA4wsAAOYLAADnCwAA6AsAAOsLAADsCwAA7QsAAO4LAADvCwAA8gsAAPMLAAD0CwAA9QsAAPcLAAAZDAAAGgwAABwMAAAdDAAAHgwAAB8MAAAgDAAAIQwAACIMAAAjDAAAJAwAACUMAAArDAAALgwAADAMAAAxDAAAOwwAAD0MAABNDAAATwwAAFkMAABsDAAAcAwAAHEMAAByDAAAdAwAAHUMAAB7DAAAfwwAAIEMAACCDAAAgwwAAIQMAACFDAAAjgwAAI8MAACQDAAAkQwAAJIMAACTDAAAlQwAAJkMAACdDAAAngwAAJ8MAACgDAAAvAwAAMYMAADIDAAAyQwAAMoMAADLDAAAzAwAAM0MAADODAAA0AwAANEMAADSDAAA7AwAAO4MAADvDAAA+AwAAP4MAAD/DAAAAA0AAAENAAACDQAAAw0AAAQNAAAZDQAAGg0AABsNAAAcDQAAQQ0AAEMNAABGDQAARw0AAEwNAABPDQAAVg0AAFcNAABYDQAAYA0AAGENAABiDQAAYw0AAGQNAABnDQAAaA0AAGkNAABsDQAAbQ0AAG4NAABvDQAAcw0AAHkNAAB6DQAAfQ0AAH8NAACDDQAAhw0AAIoNAACLDQAAjA0AAI0NAACODQAAjw0AAJANAACRDQAAkg0AAJUNAACWDQAAmQ0AAJoNAACbDQAAnA0AAJ0NAACeDQAAnw0AAKYNAACnDQAAqA0AAKkNAACqDQAAqw0AAK0NAACuDQAArw0AALANAACxDQAAsg0AALMNAAC0DQAAtw0AALgNAAC5DQAAvQ0AAL8NAADADQAAwQ0AAMMNAADEDQAAxQ0AAMcNAADIDQAAyQ0AAMoNAADLDQAAzA0AAM0NAADQDQAA1Q0AANYNAADYDQAA3A0AAN0NAADgDQAA4Q0AAOINAADjDQAA7A0AAPANAADxDQAA8g0AAPMNAAD0DQAA9Q0AAPcNAAD4DQAA+g0AAPsNAAD8DQAA/Q0AAAYOAAALDgAAEQ4AABMOAAAUDgAAHg4AAB8OAAAgDgAAIw4AACQOAAAlDgAAJg4AACkOAAAqDgAAKw4AACwOAAAtDgAAMw4AADQOAAA1DgAANg4AADgOAAA5DgAAOg4AADsOAAA+DgAAPw4AAEEOAABLDgAATA4AAGcOAABvDgAAcA4AAHEOAAB0DgAAdQ4AAHYOAAB3DgAAeA4AAHkOAAB6DgAAew4AAHwOAAB9DgAAfg4AAH8OAACADgAAhQ4AAIcOAACIDgAAiQ4AAIoOAACLDgAAjA4AAI0OAACODgAAkA4AAJEOAACSDgAAlg4AAJcOAACZDgAAng4AAJ8OAACgDgAAoQ4AAKIOAACjDgAApA4AAKUOAACmDgAApw4AAKgOAACpDgAAqg4AAKsOAACsDgAArQ4AAK4OAACvDgAAsA4AALEOAACyDgAAsw4AALQOAADHDgAAyA4AAMkOAADKDgAAyw4AAMwOAADNDgAAzg4AAM8OAADQDgAA0w4AANQOAADVDgAA1g4AANcOAADYDgAA2Q4AANoOAADbDgAA3A4AAN0OAADeDgAA3w4AAOAOAADhDgAA4g4AAOMOAADkDgAA5Q4AAOcOAADoDgAA7A4AAO0OAADuDgAA7w4AAPAOAAD0DgAA9Q4AAPYOAAD3DgAA+A4AAPkOAAD6DgAA+w4AAP4OAAD/DgAAAQ8AAAIPAAAEDwAACA8AAAkPAAAUDwAAFw8AAB8PAAAhDwAAIg8AACMPAAAkDwAAJg8AACkPAAAqDwAALA8AAC0PAAAuDwAALw8AADAPAAAyDwAAMw8AADQPAAA1DwAANg8AADcPAAA5DwAAPQ8AAD4PAAA/DwAAQA8AAE8PAABQDwAAUg8AAFMPAABUDwAAVg8AAFcPAABYDwAAWQ8AAFoPAABbDwAAXA8AAF8PAAB+DwAAfw8AAIAPAACBDwAAgg8AAIMPAACEDwAAhQ8AAIYPAACHDwAAjA8AAI4PAACQDwAAkQ8AAJQPAACWDwAAlw8AAJgPAACZDwAAmg8AAJsPAACfDwAAoA8AAKEPAAClDwAApg8AAKcPAACpDwAAqw8AAKwPAACtDwAArg8AAK8PAACyDwAAwA8AAMIPAADEDwAAxg8AAMgPAADJDwAAyg8AAMwPAADNDwAAzw8AANAPAADRDwAA0w8AANQPAADXDwAA2A8AAN0PAADkDwAA5g8AAOgPAADpDwAA6g8AAOsPAADtDwAA7w8AAPAPAADxDwAA8g8AAPQPAAD1DwAA9g8AAPcPAAD6DwAA+w8AAP0PAAD/DwAAABAAAAIQAAADEAAABBAAAAUQAAAGEAAABxAAAAgQAAAKEAAACxAAAAwQAAANEAAADhAAAA8QAAAQEAAAERAAABgQAAAZEAAAHhAAAB8QAAAgEAAAIxAAACQQAAApEAAAKhAAACwQAAAtEAAALhAAAC8QAAAwEAAAMRAAADQQAAA2EAAANxAAADgQAAA5EAAAOhAAADsQAAA9EAAAPxAAAEAQAABBEAAAQxAAAEQQAABGEAAASBAAAEkQAABKEAAASxAAAEwQAABNEAAAThAAAE8QAABQEAAAURAAAFIQAABTEAAAVRAAAFYQAABZEAAAWhAAAFsQAABjEAAAZBAAAGkQAABqEAAAaxAAAGwQAABtEAAAchAAAHMQAAB0EAAAdRAAAHYQAAB3EAAAeBAAAHkQAAB6EAAAexAAAHwQAAB+EAAAfxAAAIAQAACBEAAAghAAAIMQAACEEAAAjRAAAI4QAACPEAAAkBAAAJEQAACTEAAAlBAAAJUQAACWEAAAlxAAAJkQAACaEAAAmxAAAJwQAACdEAAAnhAAAJ8QAACgEAAAoRAAAKIQAACkEAAApRAAAKYQAACnEAAAuhAAALsQAAC8EAAAvRAAAL8QAADDEAAAxBAAAMUQAADGEAAAxxAAAMwQAADNEAAAzhAAAM8QAADREAAA0hAAANcQAADYEAAA2RAAANoQAADdEAAA3hAAAAERAAAEEQAABREAAAsRAAAMEQAADREAAA4RAAAQEQAAEREAABIRAAATEQAAGhEAABsRAAAcEQAAIBEAACERAAAjEQAAJBEAACURAAAmEQAAJxEAACkRAAAqEQAAKxEAACwRAAAvEQAAMBEAADERAAAyEQAAMxEAADURAAA2EQAANxEAADkRAAA7EQAAPREAAD4RAAA/EQAARhEAAEcRAABIEQAAThEAAE8RAABQEQAAUREAAFIRAABXEQAAWBEAAHwRAACCEQAAhxEAAIkRAACWEQAAlxEAAJgRAACZEQAAnBEAAJ0RAACeEQAAnxEAAKARAAChEQAAohEAAKMRAACkEQAApREAAKYRAACnEQAAqBEAAKkRAACqEQAArBEAAK0RAACuEQAArxEAALARAACxEQAAtxEAALsRAADDEQAAxREAAMcRAADIEQAAyREAAMoRAADLEQAAzxEAANARAADTEQAA1xEAANgRAADaEQAA2xEAANwRAADdEQAA3hEAAOERAADiEQAA5xEAAOgRAADpEQAA6xEAAOwRAADuEQAA7xEAAPARAADxEQAA8hEAAPsRAAD9EQAA/hEAAAASAAABEgAAAhIAAAMSAAAEEgAABRIAAAcSAAAIEgAACRIAAAoSAAALEgAADBIAAA0SAAAOEgAADxIAABASAAAREgAAEhIAABMSAAAUEgAAFhIAABcSAAAYEgAAGRIAABoSAAAcEgAAIBIAACESAAAkEgAAJRIAACYSAAAnEgAAKRIAACoSAAArEgAALBIAAC0SAAAwEgAANBIAADcSAAA5EgAAOhIAAEISAABEEgAASBIAAEkSAABLEgAATRIAAFASAABREgAAWBIAAFkSAABaEgAAWxIAAFwSAABdEgAAcBIAAHESAAByEgAAeRIAAHoSAAB7EgAAfRIAAIQSAACFEgAAhxIAAIsSAACMEgAAjRIAAJASAACUEgAAlRIAAJYSAACXEgAAmBIAAJkSAACbEgAAnBIAAJ0SAACeEgAAnxIAAKASAAChEgAAohIAAKQSAACmEgAApxIAAKsSAACsEgAArRIAAK4SAACvEgAAsRIAAL8SAADAEgAAwRIAAMISAADEEgAAxxIAAMkSAADKEgAAzRIAAM4SAADVEgAA1hIAAOESAADoEgAA6hIAAOsSAADsEgAA7RIAAO4SAADvEgAA8BIAAPESAADzEgAA+RIAAPoSAAD7EgAA/BIAAP4SAAD/EgAAABMAAAETAAAEEwAABRMAAAoTAAALEwAADBMAAA0TAAAOEwAADxMAABATAAAREwAAEhMAABMTAAAUEwAAFRMAABYTAAAXEwAAGhMAABsTAAAcEwAAHRMAAB4TAAAfEwAAIBMAACYTAAAsEwAALRMAADATAAAxEwAAMhMAADQTAAA1EwAANhMAAD0TAAA+EwAAQhMAAEMTAABGEwAARxMAAEgTAABJEwAASxMAAEwTAABNEwAAVhMAAFgTAABZEwAAXRMAAF4TAABfEwAAYBMAAGETAABiEwAAYxMAAGQTAABlEwAAZhMAAGgTAABpEwAAaxMAAGwTAABtEwAAbhMAAG8TAABxEwAAchMAAHQTAAB2EwAAeBMAAHkTAAB6EwAAexMAAHwTAAB+EwAAfxMAAIATAACBEwAAghMAAIMTAACEEwAAiRMAAIoTAACLEwAAjBMAAJETAACSEwAAkxMAAJQTAACVEwAAlhMAAJgTAACZEwAAmhMAAJwTAACfEwAAoBMAAKETAACiEwAAoxMAAKQTAAClEwAAphMAAKcTAACoEwAAqxMAANYTAADXEwAA2BMAANkTAADaEwAA2xMAANwTAADdEwAA3hMAAN8TAADgEwAA4xMAAOQTAADlEwAA6BMAAOkTAADsEwAA7RMAAPATAADyEwAA8xMAAPQTAAD1EwAA9hMAAPcTAAD7EwAA/hMAAP8TAAAAFAAAARQAAAIUAAAFFAAABxQAAAsUAAARFAAAEhQAABQUAAAVFAAAFhQAABcUAAAYFAAAGRQAACgUAAApFAAAKhQAADEUAAAzFAAANBQAADYUAAA3FAAAOBQAADkUAACCFAAAmhQAAJ0UAACfFAAAsxQAALoUAADCFAAAwxQAAMwUAADNFAAAzhQAAM8UAAAAAAAABgAAAAwAAAAQAAAAFAAAABgAAAAcAAAAIAAAACUAAAAqAAAAMQAAADQAAAA4AAAAOwAAADwAAAA/AAAAQQAAAEMAAABGAAAASQAAAE0AAABPAAAAUAAAAFEAAABSAAAAVgAAAFcAAABYAAAAWQAAAFoAAABbAAAAXAAAAF0AAABgAAAAYQAAAGIAAABjAAAAZAAAAGcAAABpAAAAagAAAGsAAABtAAAAbgAAAHcAAAB4AAAAeQAAAHoAAAB7AAAAfgAAAH8AAACAAAAAgQAAAIQAAACFAAAAhwAAAIsAAACMAAAAjwAAAJMAAACVAAAAlgAAAJoAAACbAAAAnAAAAJ0AAACfAAAAoQAAAKIAAACjAAAApAAAAKgAAACuAAAArwAAALEAAACyAAAAtAAAALUAAAC2AAAAuAAAALoAAAC7AAAAvAAAAMEAAADDAAAAxAAAAMUAAADGAAAAyAAAAMwAAADNAAAA1AAAANcAAADYAAAA2QAAANoAAADbAAAA4AAAAOEAAADjAAAA5AAAAOUAAADmAAAA5wAAAOgAAADpAAAA6gAAAOsAAADtAAAA7gAAAPQAAAD2AAAA+wAAAAIBAAAEAQAABQEAAAYBAAAJAQAACgEAAAsBAAAMAQAADQEAAA4BAAAPAQAAEAEAABEBAAASAQAAEwEAABsBAAAcAQAAHgEAAB8BAAAgAQAAIQEAACIBAAArAQAALAEAAC8BAAAwAQAAMQEAADIBAAAzAQAANAEAADUBAAA2AQAANwEAADkBAAA6AQAAOwEAADwBAAA+AQAAQAEAAEEBAABCAQAAQwEAAEUBAABSAQAAVAEAAFUBAABWAQAAVwEAAFgBAABaAQAAWwEAAFwBAABfAQAAYAEAAGEBAABiAQAAYwEAAGUBAABmAQAAaAEAAGkBAABqAQAAawEAAG0BAABuAQAAcgEAAHQBAACHAQAAiAEAAIkBAACKAQAAiwEAAIwBAACNAQAAjgEAAI8BAACQAQAAkQEAAJIBAACTAQAAmAEAAJkBAACaAQAAmwEAAJwBAACdAQAAogEAAKMBAACkAQAApQEAAKYBAACnAQAAqAEAAKkBAACrAQAArAEAAK0BAACuAQAArwEAALYBAAC3AQAAuwEAALwBAAC/AQAAwAEAAMEBAADCAQAAwwEAAMQBAADFAQAAxwEAAMgBAADJAQAAygEAAMsBAADMAQAAzQEAAM4BAADPAQAA0AEAANIBAADUAQAA1QEAANcBAADYAQAA2QEAANoBAADdAQAA4gEAAOMBAADlAQAA6QEAAOsBAADsAQAA7QEAAO4BAADvAQAA8AEAAPEBAADyAQAA8wEAAPgBAAD5AQAA+gEAAPsBAAD8AQAA/gEAAP8BAAAAAgAABQIAAAYCAAAHAgAACAIAAAkCAAALAgAADwIAABACAAAZAgAAGwIAAB0CAAAhAgAALAIAAC8CAAAxAgAAMgIAADMCAAA0AgAANQIAADYCAAA3AgAAOAIAADkCAAA6AgAAPgIAAEACAABBAgAARAIAAEUCAABGAgAASAIAAEkCAABKAgAASwIAAEwCAABRAgAAUgIAAFMCAABUAgAAWAIAAFkCAABaAgAAWwIAAFwCAABdAgAAXgIAAGECAABiAgAAYwIAAGQCAABlAgAAZwIAAGgCAABsAgAAbQIAAG4CAABvAgAAcgIAAHMCAAB0AgAAeAIAAHkCAAB6AgAAewIAAH0CAAB+AgAAgQIAAIICAACDAgAAhQIAAIYCAACNAgAAkgIAAJMCAACYAgAAmQIAAJoCAACeAgAAoQIAAKICAACjAgAApAIAAKUCAACnAgAAqwIAAKwCAACwAgAAsQIAALICAACzAgAAtAIAALgCAAC5AgAAwAIAAMECAADCAgAAxQIAAMYCAADJAgAAygIAAMsCAADNAgAAzwIAANMCAADUAgAA2wIAANwCAADdAgAA3gIAAN8CAADgAgAA4wIAAOQCAAArAwAASgMAAFkDAABaAwAAWwMAAHIDAAB0AwAAdwMAAHoDAACDAwAAlwMAAJ8DAACmAwAAqAMAAKkDAACqAwAArAMAAK0DAAC0AwAAtQMAALYDAAC3AwAAugMAAL0DAADBAwAAwgMAAMMDAADEAwAAxQMAAMYDAADHAwAAygMAAMsDAADMAwAAzgMAAM8DAADQAwAA0QMAANIDAADWAwAA4gMAAOMDAADsAwAA7QMAAO4DAADxAwAA8gMAAPMDAAD1AwAA9gMAAPcDAAD4AwAAAgQAAAMEAAAEBAAABQQAAAYEAAAKBAAADAQAAA4EAAAXBAAAGAQAAB4EAAAjBAAAJAQAAC4EAAAvBAAAMAQAADEEAAAyBAAAMwQAADYEAAA4BAAAOQQAADoEAAA7BAAAQAQAAEEEAABCBAAAQwQAAEQEAABKBAAASwQAAEwEAABNBAAAVQQAAFYEAABXBAAAWAQAAHMEAAB0BAAAdQQAAHcEAAB6BAAAewQAAHwEAAB9BAAAfgQAAJsEAAChBAAAogQAAKMEAAClBAAApgQAAKcEAACoBAAArAQAALAEAACxBAAAsgQAAL8EAADABAAAwQQAAMIEAADEBAAAxQQAAMYEAADHBAAAyAQAAMkEAADKBAAA1AQAANYEAADXBAAA3AQAAN0EAADeBAAA4AQAAOkEAADqBAAA6wQAAOwEAAD/BAAAAwUAAAcFAAAJBQAACgUAAAsFAAAMBQAAHAUAAB0FAAAnBQAAKQUAACoFAAArBQAALQUAAC4FAAAvBQAAMQUAADIFAAAzBQAANAUAADcFAAA4BQAAOQUAAE4FAABPBQAAUAUAAFEFAABrBQAAbQUAAG4FAAB3BQAAeAUAAHkFAAChBQAAowUAAKQFAACnBQAAqAUAAKkFAACqBQAAqwUAALMFAAC0BQAAtQUAALYFAAC3BQAAugUAALsFAAC8BQAAvQUAAMMFAADHBQAAyAUAAMkFAADOBQAA0QUAANgFAADZBQAA2gUAANsFAADcBQAA3QUAAN4FAADfBQAA4gUAAOYFAADnBQAA6wUAAOwFAADuBQAA8QUAAPIFAADzBQAA9QUAAPYFAAD+BQAAAAYAAAIGAAADBgAABwYAAAsGAAAOBgAAEAYAABcGAAAaBgAAGwYAAB8GAAAgBgAAJQYAACkGAAAqBgAAKwYAAC4GAAAvBgAAMAYAADEGAAAyBgAAMwYAADoGAAA8BgAAPQYAAD8GAABABgAAQQYAAGQGAABlBgAAZgYAAGcGAABoBgAAaQYAAGoGAABsBgAAcgYAAHMGAAB2BgAAdwYAAHgGAAB6BgAAewYAAIEGAACCBgAAgwYAAIUGAACGBgAAiAYAAIoGAAC1BgAAuwYAALwGAADBBgAAwgYAAMMGAADFBgAAxwYAAMkGAADKBgAAywYAAMwGAADPBgAA0QYAANQGAADVBgAA1gYAANcGAADYBgAA2QYAANoGAADbBgAA3AYAAOEGAADiBgAA4wYAAOQGAADqBgAA6wYAAPIGAADzBgAA9AYAAPUGAAAFBwAABgcAAAgHAAAnBwAAKAcAACkHAAAqBwAAKwcAACwHAAAtBwAALgcAAC8HAAAyBwAAMwcAADQHAAA1BwAANwcAADsHAAA8BwAAPQcAAD4HAABDBwAARAcAAEUHAABGBwAARwcAAEgHAABLBwAATAcAAE0HAABOBwAAUAcAAFEHAABWBwAAWAcAAFkHAABaBwAAWwcAAGAHAABlBwAAiAcAAIkHAACLBwAAjAcAAI0HAACOBwAAkAcAAJEHAACSBwAAkwcAAJQHAACWBwAAmwcAAKIHAACkBwAAswcAALQHAAC2BwAAuAcAALkHAAC6BwAAvAcAAL4HAAC/BwAAwgcAAMMHAADEBwAAxgcAAMwHAADNBwAA0gcAANUHAADWBwAA1wcAANkHAADbBwAA3AcAAN0HAADfBwAA4QcAAOIHAADkBwAA5QcAAOYHAADnBwAA6AcAAOkHAADqBwAA8QcAAPIHAADzBwAA9AcAAPUHAAD2BwAA9wcAAPgHAAD5BwAA/gcAAAAIAAABCAAAAggAAAMIAAAFCAAABggAAAcIAAAICAAACggAAAsIAAAMCAAADQgAAA4IAAAPCAAAEAgAABEIAAATCAAAHAgAAB0IAAAfCAAAIAgAACIIAAAkCAAAJQgAACYIAAAnCAAAKAgAACkIAAAqCAAAKwgAADAIAAAxCAAAMggAADUIAAA3CAAAOAgAADkIAAA6CAAAOwgAADwIAAA9CAAAPggAAD8IAABACAAAQQgAAEIIAABDCAAARQgAAEcIAABNCAAAVAgAAFUIAABYCAAAWggAAFsIAABcCAAAXQgAAF4IAABfCAAAZQgAAGYIAABrCAAAbAgAAG0IAABuCAAAcwgAAHcIAAB7CAAAfAgAAH0IAAB/CAAAgAgAAIMIAACECAAAhQgAAIoIAACLCAAAjQgAAI4IAACXCAAAmAgAAJkIAACaCAAAmwgAAJwIAACeCAAAnwgAAKAIAAChCAAAoggAAKMIAACkCAAApQgAAKYIAACnCAAAqAgAAKkIAACqCAAAqwgAAKwIAACtCAAArggAAK8IAACwCAAAsQgAALMIAAC0CAAAtQgAALYIAAC3CAAAwggAAMkIAADKCAAAywgAAMwIAADNCAAAzggAANAIAADRCAAA0ggAANMIAADUCAAA1wgAANgIAADfCAAA4QgAAOIIAADkCAAA5ggAAOgIAADpCAAA6wgAAOwIAADtCAAA7ggAAPAIAAD1CAAA9ggAAPgIAAD5CAAA+ggAAPsIAAD8CAAA/QgAAAAJAAArCQAAMAkAADEJAAAyCQAANAkAADUJAAA2CQAANwkAAD4JAABACQAAQQkAAEIJAABDCQAARAkAAEcJAABJCQAASgkAAEsJAABMCQAATQkAAE4JAABPCQAAUAkAAFEJAABSCQAAUwkAAFYJAABYCQAAWQkAAFoJAABdCQAAXgkAAF8JAABgCQAAYQkAAGQJAABlCQAAaAkAAGkJAABqCQAAawkAAGwJAABuCQAAbwkAAHAJAABzCQAAdAkAAHUJAAB2CQAAdwkAAH0JAAB+CQAAfwkAAIAJAACBCQAAhAkAAIgJAACJCQAAigkAAIsJAACOCQAAjwkAAJMJAACUCQAAlQkAAJcJAACYCQAAmwkAAKAJAAChCQAAowkAAKQJAAClCQAApgkAAKcJAACoCQAAqQkAAKsJAACsCQAArQkAAK4JAACvCQAAsAkAALEJAACyCQAAswkAALUJAAC2CQAAtwkAALgJAAC5CQAAugkAALsJAAC8CQAAvQkAAL4JAAC/CQAA0gkAANQJAADVCQAA1gkAANcJAADYCQAA2QkAANoJAADbCQAA3AkAAN0JAADeCQAA3wkAAOAJAADhCQAA4gkAAOMJAADkCQAA5QkAAOYJAADnCQAA6AkAAOwJAADvCQAA8AkAAPIJAAD0CQAA9QkAAPYJAAD6CQAAAgoAAAQKAAAJCgAACgoAAAsKAAAMCgAADQoAAA4KAAAQCgAAEQoAABMKAAAUCgAAFgoAAB0KAAAeCgAAHwoAADIKAAAzCgAANAoAADsKAAA8CgAAPQoAAEQKAABGCgAARwoAAEkKAABKCgAASwoAAE8KAABQCgAAUQoAAFUKAABWCgAAVwoAAFgKAABaCgAAWwoAAFwKAABfCgAAYAoAAGEKAABiCgAAZAoAAGgKAABpCgAAawoAAGwKAABtCgAAbwoAAHAKAABxCgAAcgoAAHMKAAB1CgAAdgoAAIQKAACFCgAAhgoAAIcKAACQCgAAkQoAAJMKAACUCgAAlgoAAJcKAACYCgAAngoAAKAKAACiCgAAowoAAKQKAAClCgAApgoAAKcKAACpCgAAqgoAAKsKAACtCgAArgoAALIKAACzCgAAtgoAALoKAAC7CgAAvAoAAL4KAAC/CgAAwAoAAMEKAADCCgAAwwoAAMQKAADGCgAAygoAAMsKAADUCgAA1QoAANYKAADXCgAA2AoAANkKAADaCgAA2woAANwKAADeCgAA3woAAOAKAADhCgAA5AoAAOUKAADmCgAA6AoAAOsKAADsCgAA7QoAAO4KAADvCgAA8QoAAPcKAAD4CgAA+goAAPsKAAD9CgAA/goAAAALAAAECwAABQsAAAgLAAAPCwAAEAsAABELAAATCwAAFAsAABULAAAWCwAAGgsAABsLAAAcCwAAIQsAACMLAAAkCwAAJQsAACYLAAAnCwAAKAsAACkLAAArCwAALAsAAC0LAAAuCwAALwsAADILAAAzCwAANQsAADcLAAA4CwAAOQsAADoLAAA7CwAAPgsAAD8LAABACwAAQQsAAEcLAABLCwAATQsAAE8LAABQCwAAVwsAAFgLAABZCwAAWgsAAFsLAABeCwAAXwsAAGMLAABkCwAAaQsAAGoLAABrCwAAbAsAAG4LAABvCwAAcAsAAHELAAB0CwAAdgsAAHoLAAB7CwAAfAsAAH0LAAB+CwAAfwsAAIALAACDCwAAhgsAAIoLAACMCwAAjQsAAI4LAACPCwAAkAsAAJELAACUCwAAlQsAAJYLAACiCwAAowsAAKcLAACoCwAAqQsAAKoLAACrCwAArAsAAK0LAACvCwAAsAsAALELAACyCwAAtAsAALYLAAC3CwAAvgsAAL8LAADACwAAwQsAAMILAADECwAAxgsAAMcLAADICwAAzAsAANALAADRCwAA1gsAANcLAADYCwAA2QsAANsLAADdCwAA4wsAAOYLAADnCwAA6AsAAOsLAADsCwAA7QsAAO4LAADvCwAA8gsAAPMLAAD0CwAA9QsAAPcLAAAZDAAAGgwAABwMAAAdDAAAHgwAAB8MAAAgDAAAIQwAACIMAAAjDAAAJAwAACUMAAArDAAALgwAADAMAAAxDAAAOwwAAD0MAABNDAAATwwAAFkMAABsDAAAcAwAAHEMAAByDAAAdAwAAHUMAAB7DAAAfwwAAIEMAACCDAAAgwwAAIQMAACFDAAAjgwAAI8MAACQDAAAkQwAAJIMAACTDAAAlQwAAJkMAACdDAAAngwAAJ8MAACgDAAAvAwAAMYMAADIDAAAyQwAAMoMAADLDAAAzAwAAM0MAADODAAA0AwAANEMAADSDAAA7AwAAO4MAADvDAAA+AwAAP4MAAD/DAAAAA0AAAENAAACDQAAAw0AAAQNAAAZDQAAGg0AABsNAAAcDQAAQQ0AAEMNAABGDQAARw0AAEwNAABPDQAAVg0AAFcNAABYDQAAYA0AAGENAABiDQAAYw0AAGQNAABnDQAAaA0AAGkNAABsDQAAbQ0AAG4NAABvDQAAcw0AAHkNAAB6DQAAfQ0AAH8NAACDDQAAhw0AAIoNAACLDQAAjA0AAI0NAACODQAAjw0AAJANAACRDQAAkg0AAJUNAACWDQAAmQ0AAJoNAACbDQAAnA0AAJ0NAACeDQAAnw0AAKYNAACnDQAAqA0AAKkNAACqDQAAqw0AAK0NAACuDQAArw0AALANAACxDQAAsg0AALMNAAC0DQAAtw0AALgNAAC5DQAAvQ0AAL8NAADADQAAwQ0AAMMNAADEDQAAxQ0AAMcNAADIDQAAyQ0AAMoNAADLDQAAzA0AAM0NAADQDQAA1Q0AANYNAADYDQAA3A0AAN0NAADgDQAA4Q0AAOINAADjDQAA7A0AAPANAADxDQAA8g0AAPMNAAD0DQAA9Q0AAPcNAAD4DQAA+g0AAPsNAAD8DQAA/Q0AAAYOAAALDgAAEQ4AABMOAAAUDgAAHg4AAB8OAAAgDgAAIw4AACQOAAAlDgAAJg4AACkOAAAqDgAAKw4AACwOAAAtDgAAMw4AADQOAAA1DgAANg4AADgOAAA5DgAAOg4AADsOAAA+DgAAPw4AAEEOAABLDgAATA4AAGcOAABvDgAAcA4AAHEOAAB0DgAAdQ4AAHYOAAB3DgAAeA4AAHkOAAB6DgAAew4AAHwOAAB9DgAAfg4AAH8OAACADgAAhQ4AAIcOAACIDgAAiQ4AAIoOAACLDgAAjA4AAI0OAACODgAAkA4AAJEOAACSDgAAlg4AAJcOAACZDgAAng4AAJ8OAACgDgAAoQ4AAKIOAACjDgAApA4AAKUOAACmDgAApw4AAKgOAACpDgAAqg4AAKsOAACsDgAArQ4AAK4OAACvDgAAsA4AALEOAACyDgAAsw4AALQOAADHDgAAyA4AAMkOAADKDgAAyw4AAMwOAADNDgAAzg4AAM8OAADQDgAA0w4AANQOAADVDgAA1g4AANcOAADYDgAA2Q4AANoOAADbDgAA3A4AAN0OAADeDgAA3w4AAOAOAADhDgAA4g4AAOMOAADkDgAA5Q4AAOcOAADoDgAA7A4AAO0OAADuDgAA7w4AAPAOAAD0DgAA9Q4AAPYOAAD3DgAA+A4AAPkOAAD6DgAA+w4AAP4OAAD/DgAAAQ8AAAIPAAAEDwAACA8AAAkPAAAUDwAAFw8AAB8PAAAhDwAAIg8AACMPAAAkDwAAJg8AACkPAAAqDwAALA8AAC0PAAAuDwAALw8AADAPAAAyDwAAMw8AADQPAAA1DwAANg8AADcPAAA5DwAAPQ8AAD4PAAA/DwAAQA8AAE8PAABQDwAAUg8AAFMPAABUDwAAVg8AAFcPAABYDwAAWQ8AAFoPAABbDwAAXA8AAF8PAAB+DwAAfw8AAIAPAACBDwAAgg8AAIMPAACEDwAAhQ8AAIYPAACHDwAAjA8AAI4PAACQDwAAkQ8AAJQPAACWDwAAlw8AAJgPAACZDwAAmg8AAJsPAACfDwAAoA8AAKEPAAClDwAApg8AAKcPAACpDwAAqw8AAKwPAACtDwAArg8AAK8PAACyDwAAwA8AAMIPAADEDwAAxg8AAMgPAADJDwAAyg8AAMwPAADNDwAAzw8AANAPAADRDwAA0w8AANQPAADXDwAA2A8AAN0PAADkDwAA5g8AAOgPAADpDwAA6g8AAOsPAADtDwAA7w8AAPAPAADxDwAA8g8AAPQPAAD1DwAA9g8AAPcPAAD6DwAA+w8AAP0PAAD/DwAAABAAAAIQAAADEAAABBAAAAUQAAAGEAAABxAAAAgQAAAKEAAACxAAAAwQAAANEAAADhAAAA8QAAAQEAAAERAAABgQAAAZEAAAHhAAAB8QAAAgEAAAIxAAACQQAAApEAAAKhAAACwQAAAtEAAALhAAAC8QAAAwEAAAMRAAADQQAAA2EAAANxAAADgQAAA5EAAAOhAAADsQAAA9EAAAPxAAAEAQAABBEAAAQxAAAEQQAABGEAAASBAAAEkQAABKEAAASxAAAEwQAABNEAAAThAAAE8QAABQEAAAURAAAFIQAABTEAAAVRAAAFYQAABZEAAAWhAAAFsQAABjEAAAZBAAAGkQAABqEAAAaxAAAGwQAABtEAAAchAAAHMQAAB0EAAAdRAAAHYQAAB3EAAAeBAAAHkQAAB6EAAAexAAAHwQAAB+EAAAfxAAAIAQAACBEAAAghAAAIMQAACEEAAAjRAAAI4QAACPEAAAkBAAAJEQAACTEAAAlBAAAJUQAACWEAAAlxAAAJkQAACaEAAAmxAAAJwQAACdEAAAnhAAAJ8QAACgEAAAoRAAAKIQAACkEAAApRAAAKYQAACnEAAAuhAAALsQAAC8EAAAvRAAAL8QAADDEAAAxBAAAMUQAADGEAAAxxAAAMwQAADNEAAAzhAAAM8QAADREAAA0hAAANcQAADYEAAA2RAAANoQAADdEAAA3hAAAAERAAAEEQAABREAAAsRAAAMEQAADREAAA4RAAAQEQAAEREAABIRAAATEQAAGhEAABsRAAAcEQAAIBEAACERAAAjEQAAJBEAACURAAAmEQAAJxEAACkRAAAqEQAAKxEAACwRAAAvEQAAMBEAADERAAAyEQAAMxEAADURAAA2EQAANxEAADkRAAA7EQAAPREAAD4RAAA/EQAARhEAAEcRAABIEQAAThEAAE8RAABQEQAAUREAAFIRAABXEQAAWBEAAHwRAACCEQAAhxEAAIkRAACWEQAAlxEAAJgRAACZEQAAnBEAAJ0RAACeEQAAnxEAAKARAAChEQAAohEAAKMRAACkEQAApREAAKYRAACnEQAAqBEAAKkRAACqEQAArBEAAK0RAACuEQAArxEAALARAACxEQAAtxEAALsRAADDEQAAxREAAMcRAADIEQAAyREAAMoRAADLEQAAzxEAANARAADTEQAA1xEAANgRAADaEQAA2xEAANwRAADdEQAA3hEAAOERAADiEQAA5xEAAOgRAADpEQAA6xEAAOwRAADuEQAA7xEAAPARAADxEQAA8hEAAPsRAAD9EQAA/hEAAAASAAABEgAAAhIAAAMSAAAEEgAABRIAAAcSAAAIEgAACRIAAAoSAAALEgAADBIAAA0SAAAOEgAADxIAABASAAAREgAAEhIAABMSAAAUEgAAFhIAABcSAAAYEgAAGRIAABoSAAAcEgAAIBIAACESAAAkEgAAJRIAACYSAAAnEgAAKRIAACoSAAArEgAALBIAAC0SAAAwEgAANBIAADcSAAA5EgAAOhIAAEISAABEEgAASBIAAEkSAABLEgAATRIAAFASAABREgAAWBIAAFkSAABaEgAAWxIAAFwSAABdEgAAcBIAAHESAAByEgAAeRIAAHoSAAB7EgAAfRIAAIQSAACFEgAAhxIAAIsSAACMEgAAjRIAAJASAACUEgAAlRIAAJYSAACXEgAAmBIAAJkSAACbEgAAnBIAAJ0SAACeEgAAnxIAAKASAAChEgAAohIAAKQSAACmEgAApxIAAKsSAACsEgAArRIAAK4SAACvEgAAsRIAAL8SAADAEgAAwRIAAMISAADEEgAAxxIAAMkSAADKEgAAzRIAAM4SAADVEgAA1hIAAOESAADoEgAA6hIAAOsSAADsEgAA7RIAAO4SAADvEgAA8BIAAPESAADzEgAA+RIAAPoSAAD7EgAA/BIAAP4SAAD/EgAAABMAAAETAAAEEwAABRMAAAoTAAALEwAADBMAAA0TAAAOEwAADxMAABATAAAREwAAEhMAABMTAAAUEwAAFRMAABYTAAAXEwAAGhMAABsTAAAcEwAAHRMAAB4TAAAfEwAAIBMAACYTAAAsEwAALRMAADATAAAxEwAAMhMAADQTAAA1EwAANhMAAD0TAAA+EwAAQhMAAEMTAABGEwAARxMAAEgTAABJEwAASxMAAEwTAABNEwAAVhMAAFgTAABZEwAAXRMAAF4TAABfEwAAYBMAAGETAABiEwAAYxMAAGQTAABlEwAAZhMAAGgTAABpEwAAaxMAAGwTAABtEwAAbhMAAG8TAABxEwAAchMAAHQTAAB2EwAAeBMAAHkTAAB6EwAAexMAAHwTAAB+EwAAfxMAAIATAACBEwAAghMAAIMTAACEEwAAiRMAAIoTAACLEwAAjBMAAJETAACSEwAAkxMAAJQTAACVEwAAlhMAAJgTAACZEwAAmhMAAJwTAACfEwAAoBMAAKETAACiEwAAoxMAAKQTAAClEwAAphMAAKcTAACoEwAAqxMAANYTAADXEwAA2BMAANkTAADaEwAA2xMAANwTAADdEwAA3hMAAN8TAADgEwAA4xMAAOQTAADlEwAA6BMAAOkTAADsEwAA7RMAAPATAADyEwAA8xMAAPQTAAD1EwAA9hMAAPcTAAD7EwAA/hMAAP8TAAAAFAAAARQAAAIUAAAFFAAABxQAAAsUAAARFAAAEhQAABQUAAAVFAAAFhQAABcUAAAYFAAAGRQAACgUAAApFAAAKhQAADEUAAAzFAAANBQAADYUAAA3FAAAOBQAADkUAACCFAAAmhQAAJ0UAACfFAAAsxQAALoUAADCFAAAwxQAAMwUAADNFAAAzhQAAM8UAACMjIyMjIxDjIyMjEOhoaGhoaGhoaGhoaGhoaGhoaGhoZaWlpaWlpaWlpaFhYWFhYWFsLCwoaGhobCwsHCwsLDFxcXFsLCwsLCwoaGhoV5vcHCdt6GhbHBwcHBwcIRjdlSdcHBwVFRUb15whF6EnTk5OTk5OVFROXBwcHCWdmOdcJ1UVHadb2+7t6HLcFSWY6G7oaFeu3ChoaGhnZ2EXl5vb3BwcKGhoaGMjIyMT09wb29wqF6dcIRvb16EnUdHR0dHXl7RnXBeXmxNW1twS1lrWVk/WVRUVIRwcISJZGRkZJ3FxdHqcHCEcHCEhG/WT09PT09DXoRUZEdkZD9Zfnl+fpJvb3BwY1RUnZ2dcJ1wcHBwhDw8PDw8i0dVhF6ohISdcFFRUURRRFFyOXBjVHZwnXCdcJ3WnV5vcHCEXl67XnCEnYSEOlMxMVNTZ1yLMTExOl5ecHBwhF6EcHBUVFSdcIRwXoSEb2+EcHCEXp27u6G7Xl4pOjEpTykpOjFNOjo6OjopKVI6vXBwcHCdnXBwnXBwVEfPrpadcHBwcKpUZGSWnXBwcHBwneDgcHCdcD9rPz9rPz9wTVtbbHB2VGNwnXBwcIReXnCdnXCdhHBwhF5eb29wXl6dnYRUdnZHZFRUZHBvXmxbW1teXr1wnXBw1p1wvduuR0fRnYRwXl5wnZaWlpaWcHBwcF5emWxsW4Q5eHh4eDk5OTlehLteoaGhoT4+Sj41Pj5KSko1Y3Z2tF6dcJ1wvXBwvXChoaGhhG9wVHZUcJ1eb3CdcHBHZGRkZHBwnWxNbE1wcHCEnYR2VFSdhJ1whLtwTU1NTXBwcGNUdp2Eobuhob2dcF5ecGN2Y3BwXl5whYWFhYWFhUdHR0dkcJaWlpaWhHBsTU1NVFRUcHCdcF5eu7u7oXBsbGxbhJ2dnaGhoaFwhYWFhYWFhYRwY5Z2cHZ2Y3Bwb15vb1tNW1twPz9LWUtLP3BwcJ2dsLCwcCo1MSk3OC0sKTswNzk8OisjMyEhJSUSEhYlIycSKycfMDknEjAzEhISJSshKxojLSkjNDExMzkaLBosKissJyU0GhInGicnLCUlLEIlTSUlLCU/ICwgICwgNT8gLCAsP0I1ICAsIFguLjYuLi5BLi4uUlguLnCdLCU0ViwsJSxHJVtOWzQlNENDNDQ0JSVen1RUVGN2djk5OTk5OUQ5eC9uVFQvKC84KDgoOC8vLygoLzg4VUdVRzw8VTxLSz8/Sz9ZhIRwcF6EnVlZWVl+WVlwcHBjVMxjp3ZbbLVNcHBwnZ1wp2N2nYReXnCdnXBNbGxbYnx8PDw8YkhlSFtinURERERERERERHBwdnZUnYS7xZ2EcI9zNzdzc3NBNzedvXBwu8tst167Xm9RZzk5OTlRUVFwXk9eQ0NeR2RHR1RwN01NTTdNNzdNN3BwnXCdY2NjhISEhOpUR5ZkZHBwnXB4T0NPQ0NwnYR4bEdseFV4VXBwnTAwMDAwMEQwMCgwMDAwKCgwKEFIMDAiMDAwMHCdb4RUVGOEcHCdIUohJ05FRSEnJy4hISchIT87IS4uJzsnJz0hNyd+Xl5eT15wcF5ecJ2dTWxsbGxbW01wcF5TMToxMV4xMV5YMV5wcHBvXoRwcHBwhDc3N003N01NTTeEb52WlpZUR3BwXoRERERuRK9yUXJwcMgpKSkxKTopOlZWVmdWVmJWVlZWiVtsTVtbbGxehHBwcD8/NS0/Pz81NWotLT8/Pz+dNzdNNzc3TTc3N4RecJ2EXp1whF6EnXBUVGNwnTdiN2ZOJzcuWi4nNzcuJzcuJyc3J4Rw1ilJPiMpKTEjKSMpKUlJSUlTSVNJSUkjMUsptISdOTk5OUREOTk5hHAgJjAmIDQmGzY2GyZJOUQ5IBs+ICZCIC4gIBtBJiA5GyYbNkEmIDQbXoRwVFRUnZ2dcFVVPHOfr6WlcHCdcPPe/51whEORQ09DQ01bW01wnUeWlrOWsLCwP0s/P1lLP9ZwnZ2EnXCwsLBbTU1NcKGhoaGdXl7m3siEnW9ecDw8PDxsPDw8Xl5ehJ1NbE1srWxsbHZ2VF6Ej3mSmpqauLVUVJ2hoaGhcJaWlpaWoaGhoXBwVFRUcHBw0XCFhYWFhYWFXm9wXl5wcEE0HSM0IyMjIyM7NEs4W2dVSR00KTIdI0REKR1WHR0jRTIpcJ1wcHCEb4RPT15PXl6dY3ZUhIRetIRDXkNPXk9wcKjRnV5eqF4+MhouGhokPEEfHzIaGhoyNCQ2GiQ6JBoxGiQaGkMkLi4aJCQyJCQaGiQaXkNejF5ecGRkZGSWnXBehG9vb29wcIR2Y3aEhFRUVHBwhHBwcHBww5aurs9wcHCMXkNDXl6dWVlZWVlZWYRwcC0tLUwtLS0/LS0/LWotLS2dhF4lOCVCLD8lJUQsJTsgLCUsLCUlJSAsICU4IEIlJTwgcHBwnXBwcJ1jdupwcHBen2xsTU1wnXBUVFRkVHBwcHBwY3awhHBwXm9whp9UjkeEhJ1wcJaWlpaWlpaWlpY7KSkpPjsjTjcdIyk7KSk7KSk4HSkpHSkpKSk+KSMpKSk4KYReb52EcISEcHBwhIRvVI5kn2SFhYWehYWFhIQuLi5BLi4uQVxWWEF6Li5whIReXnBwb15eXp1jVGNwhF5eT15DXl5ecJaWlpaWY2NjhHBvb29vhISExW+7cIRehHBwcHBwWVlZWVlZWXBwcHBwhHCdlq6WlpafXp2dcIRvcJ1whLtwcHCEcJ2dXl5RRDlEUTk5OVFwhKidXl60hHCdnXCdhIRHVFRHZJ2ddmNUXl5wcHBwhHCEcHCdcIS7hJ9eXrF4Xl5DWVlZWUtZWZ1UVGOEhNFwcHBwT09PQ09PcFSoZFRUcHBwR0dkR1RbW01sW5BsTYRwb16EdmN2cJ2JZEeJZIRvqHA5OTk5OTk5OTlwnXCdnV5ecJ1w6nBw1oRwcJ1wcHBwcHBwcISEcHBwcF5lNV41NTU1NTU1S7iera2tknBwcHBwb7twcHBwdnZ2cFlLP5dLWUteXnBeXl5eXl5wXl5wnXBeXlRUVEdkcISEcJ1wnXBUY1QaNB8kNBoaLC48JCQfHzE9GiQyGiQfJDI9GiQkJCQfHxo0HyQkNCQkQUgklpaWlpadnV5ecHBwhYWFhYWFhW9vcHBwcGN2doTFcHBwcHBwcNZwcHZ2VLuEcHB2dnZwcJ1wdmN2nXZ2dnBwnXBvu8iEdrB2cHCdnUNDQ0NDT4RwcHDMsLBsW2xNcIRwdnZ2cFtbW1twcIRecLDMyJaWlpaWnW9ehHBwcHBwhF5wcHBwcHBwcF5ecJ1wcIRwcJ1wcE0pKTEpKTEpKSkxOjopKSk6KSleXnBwcHCEnZ2dcIRwcNFwcHCEcJ1wobu7oXZ2doSEb4RvhJ2JTU1bcTxVPHNVPFWEhFRHZJZknZ2dnXBeXoRvXnCEhFlZhYWFhVlwcDo6Uk8xMTE6OjExTzo6KTo6Ojpw3j8/WT9ZS1mEcGs/P1k/WT9vXoRvhHBw0qHAoXCdbGxNTXBwnYRecHBjdnZwcIReXmyTmVtwb29wnevFnXCdcF5enS9DOFtVQ184L0MvL0NDcHBwREQ5UVE5UVE5cF6EcG9vnXBDQ0NDjENeXl5ecHCdcHBeXnBwn169bE1sTXBUVFRNbE1NcHCEtHBwcHCdnW9vu7ehy3A5OTk5OTlRUTlwcHBwcHBwnW9vcJ2dY1RUnXBvb2N2VHBwhJ1eXoyMjIxPT3CoXp1vXoSEb2xNW1twVFRUS1lrWVk/WYRwXl5wcJ23oaFscHCJZGRkZMXFnZ2dcHCEhG9whHBwlnZjnV5vqLRwhJ1wVFR2nXBwT09PT09DW2xNbF6Eb29wP1l+eX5+knBwhHBUVFSdoaGhoXBHR0dHR9FwnV5ecHCEVJZjXruhu6GhndHqcHDWY1TMY6d2W2y1TV5ecHCdnXCnY3adcEh8fDw8PGJIZUhbYnBNbGxbhJ1wnXCdb15wnXBeXoSEhFlZhYWFhVlwhHBwhG+Eb52Eobu7oYlNTVtwVEdklmSdnZ1eXoSEfl5DgF5ednZ2hHBjVHaEnXBwVFRUvXCdb4Q8KioqPzwjTyMeIyo8KjwqKjkeKioeKioqKj8qIyoqKjkqcIRehJ1wcHBwcIRwfl5eXk9eVJZUb16ENzc3TTc3TU1NN16EPz81LT8/PzU1Py0tPz8/P4ReNzdNNzc3TTc3NykpKTEpOik6VlZWZ1ZWYlZWVlaJW2xNcHCEXp2MjIxPXkNbW2xsXoRwcJ3WREREbkSvclFycHDIcHBeXk1sbGxsW1tNnZ1wIUshJ1BGRiEnJy8hJyEhQDwhLy8nPCcnPyE5J01dQTc3aTc3aU1eXnBwcHBwnYRvcJ0pST4jKSkxIykjKSlJSUlJU0lTSUlJIzFLKbSEhDk5OTlERDk5OUORQ09DQ51wnZ2dcDdiN2ZOJzcuWi4nNzcuJzcuJyc3J4TWcCIoMygiNigcOTkcKDUoIhxCIihFIhwiIhxEKDwcKBw5RCgiNhxehFRUVHBHlpazlrCwsD9LPz9ZSz+dcFVVPHOfr6WlcHBwhPPe/51wVFRjcHCdTVtbTYyMjIxDT3B2dmNeXru7u6FsTU1NVFRUcHBwnYSdnZ1jlnZwdnZjcHBwnXCEP2s/P2s/P52dhHCEXl5wcJ1wcJ1wdlRjcHBNW1tsb29wnV5enXBeXoRwcHBwvVR2dkdkVFRkcG9ebFtbW3B2dlSEnXBERERERERERES7y2yTnXCdcIS7xZ1eXoSdcFFnOTk5OVFRUUdkR0dUXk9eQ0NeXru9j3M3N3Nzc0E3N3BwVHZ2cHCdY3Z2cJ2EcHhPQ09DQ3CdnYSEhOqEY2NjcG+EN01NTTdNNzdNN3AwMDAwMDBEMDAoMDAwMCgoMChBSDAwIjAwMDB4bEdsi1V4VXCdVFRjhHCdcJ1wcHCEcHCEvduuR0deXnBwcHBwcHBvXoRwW1tbW3CEXpaWlpaWcHBwcHBwnXBwcJ1wcJ2dcISdcHCdcE0pKTEpKTEpKSkxOjopKSk6KSlwcHDRcHBwnXCwzMhwcHCdnXBw0XBwcJ1wnb1wcHCEb3BsbGxscHBwnWxNbE1wcHCEnZ2EdlRUnYRecF5emWxsW4Q+Pko+NT4+SkpKNWN2djx+fn5+PDw8XoRwcHC0XlR2VJ1eb3CE1nCEu51wnYS9u15NTU1NcHBwLi5OLi4uQS4uQS5uLi4ucIRenXBen3CdcHBwcGN26iU4JUIsPyUlRCwlOyAsJSwsJSUlICwgJTggQiUlPCBwcHCdcJ1wcNaGn1SOR4SEXm9wY2N2b29wcHBwcE1bbKGEcGxsTU1whF5vb29wnXBwY3ZULy8vQy8vL0M4WWtDbi+EhF5eb15eXnBwXl5whIRwnYRvhHZ2doRUjmSfZIWFhZ6FhYWEhISEcHCEb2+fXp1wnYRvcHCdY2NjcITFb7twhF6EcHBwcHBvb3CEcHBwcIRZWVlZWVlZnZaulpaWcHBjdmNwR0dHR2RwXl5wcIRwcJ1UY15ecHBwcJ1eXl6ohIS7XnBeb4SEcHCEhJ1wnZ2dcHBeXnBjVHZwcDw8PDw8i0dVhHl5eZbJnXC9cJZUiWSWcHBwnXBwcHBwnV5ecHCdcHBwUVFRRFFEUXI5cJ1whIRenXBwnW9ehHBwhJ1wcHCdb2+EcHApOjEpTykpOjFNOjo6OjopKVI6cJ1w4OC7u6G7cHCdnVRHz66WnXBwXm9wZEdUZFRwcHBUVFRwQTQdIzQjIyMjIzsjRClbZ1VJHTQpHR0jO0QpHVEdHSNFMilUVFRwT09eT15ecHBwXrSdhHCFhYWFhYWF0XBNTU1NnW+EhHBwcF5ecPidY3ZUhJ2EnYSEcJ1vb29vXoRwcFlZWVlZWVmEnYxeQ0NeXnBwcHDDlq6uz3A3NzQdHUM9IjQ3HR0dHSkdKTc2HR0dHUs0NB0pKTcpKR0dKR1eQ16MXl5kZGRklqheRTFFRUViRUUxRTFFRXBwcFRUVHBwcIRwcHBwcHBwvb1wXl5wcJ1wcENDQ0OMQ01NTU1HRzxVVTxVVV6Eb2+dcHCdbE1sTXBUVFRNbE1NcIS0cHBwnXZjVIRHVFRHZISdXl5wtIRwnXBwUUQ5RFE5OTlRhKhwXl6EnZ1wnYS7cHBwndZwcIRwcIRwhLuEnXBwnV5eW01NTXCwsLCdnYRehHCdhNbm3sitbGxsdnZUb15wPDw8PGw8PDxehE1sTWydXl5ehLVUVJ2PWZKampq4cHCEcJ06OlJPMTExOjoxMU86Oik6Ojo63nA/P1k/WUtZcHBvhGs/P1k/WT+Eb17SocChcHBjdnZsbJlbcHBwcHBvb3CEcJ2dcJ3rxV5enWxsTU1wcHCdhF4vQzhbVUNfOC9DLy9DQ3BwcF5eY2NUhIRwoXahcFlLP5dLWUtwXmU1XjU1NTU1NTVLrZ6tuK1+Xl5wcJ1wcJ1wb7tDQ0NDQ0+EcHC7hHBwcHZ2dnBHR2RHVJ1wcHBwcJ1wcHBwcJ1UY1RwnXBwcHBPT09DT09esXheXkOdVFRjhHCEhNFwWVlZWUtZWXBbkGxNcHZjdp1whG9ehHA5OTk5OTk5OTlvqHCTbJNshHDqcJ1wnXBwXl5wb7twcHBwXl5wXl5eXl5enXBwcISEcHBwcHBwVKhkVFS9nXBUVFRHZHBwcJ1wXl5wnW9vdsh2cJ2EyJ1wcHBwzLCwGjQfJDQaGiwuPCQkHx8xPRokMhokHyQyPRokJCQkHx8aNB8kJDQkJEFIJHBwcHBw1nBwcJ12oXZwnXZjdp12dlRwY3Z2hMVwcHBwhGxbbE12dnZwcJ1wsLCwb29bTVtbQ09eT09DcG9ecHCdcHBYLi42Li4uQS4uLlJYLi6dcFlZWVl+WVlehJ2EhHBwnTA0NC42NzI1KDwvPjs7OSgrMiggJCQqEiAkKysfKiYfLxk3Jh8vHzIqHxIkKioqIyssMzEzMDAyOBkrKS8pKismJDMjIyYZJisrJDNUKyskK0YkWUxkMyQzQUEzMzMzJCRUVFReny9uVFQvKC84KDgoOC8vLygoLzg4S0s/P0s/WVVHVUc8PFU8hDk5OTk5OUQ5eHBwcAABHAEBAQ4LAQEBBCEBAQElAQEBKQEBAS0BAQExAQEBNQEBAQE6AQEBAT8BAQEBAQECAQFGAQEBBQEBIAgBAQsBDQEPAQESAQEVAQEBAB4KKCEIAQEWICgAFDM4DgIlFzhDCQwaIwUTIEYkEyBAAQEJCgIECRsHQBIXIggbASIeQykDCAQuAS0BAQEjDxYCJQEBASYCGUYBAQFDEjMpCAomAzAQRgEBAR0BAQEJHho1AxktAhAqAQonEycYFQYDKAE/Ax0ORxYwAwUTE0IRAgkBCBcFEwEqQEIzKAMKAQEFQQABFUcgIDokMhEHPSEAAgEHAhYDMQ8BARYODAUIHAEBATQMJBsFAR5CAhYvODhHNRwzBwsECgEHBAkPNgw3NR8QAwYCBwICGAQCMgIlGBUWQis2MSI1IAkKKg8YChoqHiYPHQ8FBAIEAwEEBgIGCgYKEBomKEUkCSoqFxwBAQ0BOgoXKwIIGgEISAIBAxkBAQEWKgUFBgIBAwEEAQEFBAEGBAIKAgM2DUEtLCwnPR4ZGUEBAgoBOg4BEA0rBAIIHR0xDkhIOisDAAEsCz8vAAQBIwcKCgAFAhUOIwkWCUcLCyBIJAQ1GCAZKAMQOidIPwMDLDEBORhHIBAnBAgQDAIRExMwEwMCMQgZCg0NHiEHIRQCAQEsChtCAyEECAooNQEBAQE1NTURDg0ZAhICAwgNAQEBAwYBJAkKEAMpAQEBCwUFDgYEBAoEAQUBNgkKKhMkAzggFjAhExkBAQECCEYnAgcREwgVBBo5OQEPGAQaRiwYAygCATRIIB01GxsGDQsNBgYJPQsgDQ0KRwA/GBUCQi8ZAQEBKQ8+BScrCwoONDcCFSQ/AQEBAQEBAAUODhs7OgEBAQEaHgQCHh8IATZJDyFIGQIhAQEBGQMKDB0DSDMMMQEBATc/AQEBAQEBAS8JARc0AQkBFEgJPAIBAxEEIBEEGQIOAhMBMR4ZERkSAQE4AAEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAgEBAQMBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEAAgEDAQICAQMBAgQCAgEBBQMCAwEEAgECAQgBBwEEAAMFBAMDAQoCBgEGBwQCCwkAAQEBAQEEBAEDAQEBBgQJCQIBDwECAwITBCkIBw0rAw8FDQQDAQ8NAAUBAQICAgQKDAEFAgIBAQoGAwIAAgUEDQQNEwABEAwIEw8AAQEAAg8mAAgDCgEGBiUxNCwPDCkKAQUlEQMiCBosMTEqBwEnQgIQCDQ3RwcBChQBCgEQCAkCAQ0EAgIgAAIBAgMFASICNwctAhQnCBQLQA4wAAECCwQBAQoBKSYEHiYLASoDDAU1EgIBBhcPBwwBBTkHBQ4MChUPAQoLBDYRAwERBQgCAwgHQD0aNzUBCAE6DAQiHhEDCgIUHjMqEgsaFAUCAiwBPgAMAh0RAgEBPD8ZAgIDAgIBBQQBAwIIBQUBAQMBAQUCAgEDAgMDDQgCEScTCiwlMDACAQICAQEBAQEEAgcFBQUDAQECAQEBBAEBAwICBwEQBhYBCDYSCD4dIw4CCwEUCwcEECYqBgoBAgMKAwIBAxsDAkk7RwAqDyEOKhs3CQcBBwUFAhsBBSwaQggBAQ0wMQ0KKAcIAwEQAgEZAiZBCwcDDwMEBQMCBwEBAQsBAQEBAQEPCQ0bEhIBBh4GD0ENAQEEBQEJAQMDBwoBEAMDBQQADwcJBAIBBxcFNQ4NCRcPBxE0CRMkCwMtAggPAAEFAQQHCAEBAgMJAQECBwYGAwMCMhsHBgEBAQMDAQcKCwEEBAEBAQEBAQEBAQMEAgEHODEHAhEBASMCAQQmDwEBAQECAgEBAgUBAQIBAQEBAQEBAQEBAgEBBgEBBgECBwEBAwECAQELHDUTDREkDRQUAgQEHx0BAQFIBgsLCAEBCQksABUBAhQaEhACHCUZAgkBAQEFAQECAggPCgEWBxIXMhMoGAIBAQQXBQgkJQEBAUARIQUBAR8fDBIGDwEMCQMOAg8jDjUCNAwlBAEHFQ4DAxskEAIFAQEqAQEBJhYNJC0BAQEfNQEBAQEpAQEBDyQHOgICQCAmAT8BAQEBAQEKDTQYLUNCAAEBAwQBAwEBAQEEAgMDAQEBBwMBAgIBAQEBAQYBAQcBAQEfCBEXID0iGwwQAQYUETkECTIUNgwqIAAPAQIBAzIkATM0DhQUAgABAQEDAQECAQIBAQECAQIBAQEBAQEBAQEBAwECAwUCAQEBAQEBBQMGAwINCAEMAh4RDgkBDBA6BxYWFRcTAhYsHygFGB0BBRoJKA4YFj8xDDk1AQEBATk2NQ0IBgcLFgACFgInAgMDRSATBAMDCQMDAQsCBgYCAQQBCzM3BAQDAwIBBAIBAQICAwEBBQQGAQEBAgEBAQECAgEGBQEXDAsGBjcGEQY5CTonNwUwAyMcBDcLJxICAQIBRAY7HwQSAiVBEQQENSoeDAcJBCoIJSUGNQEBAQE1AQEBAQABAQEBAgMCAQIBAwICAQYBAgEGAQEHAwIDAQMCAQQBAgIBKCgEJjs3KAIICRkjEjc/AgIBAT8BAQEBAQEYKAoEAgMDAQcCBAYBCAEKCx8+CysTHDoCCQoSDw4BHxQEGxIECQQqAQEKOgEBAQEFCCQDMx8cAQogJRUgCiZEAS45MQgtCBUAAgofCgkLCDFGMwQTLgk1AQEBAQc9Nzc3FhYRFDECRCNGJgwXDgkWGAEkBgUCBwIDAz0QKCYFHgUkKSMSEkAXHgwEBR4JEBYLAzAaAgMYMD1IEgkpJisDJQMBBA0AGAoCCxgAARsUCwUFCRwFDRkVHRpEEyYSAQEDBwY9AwEJBw8TFicBHAMgAhEHEhAECDIFPgMbBkMMIhU8BBkBAQESQD0ILAQJBA4EBQUCDhkDQAoIHBIhEhIzMxo4BgoXAUFHRwBHSEgDCw8LJiwrAAMGDhYNAQEBAQsGNAEBAQELOz49MycrETI8KwoYHBEaCAgXDgEBARgtNwEIHBIYLSQ7BDI9ABsSEAYGEgEtHQESREQEBAooAgACAQEBAQIBAgEBAQEBAQIDAgIDAwIBAQEBAQICAQUCCAMBAgEBAgEBAQE6AQEBASZCIh08Ghw/AQEBAQEBFCQQKDUPACQeAEhIAEg6IhUbJzEIBAklDDAMPAwPCiMMDBMyAQhGABoVLxoLJQc9PwkQGAQoMwMMDw4BBwECITk5Jw8BAQ0EAjY3Q0EWBQINAgYFIxgwEQ8QDwEBOgEBAQEoAQgAGwsyFQc3AkcIKhItNTxELBtICBo3GDQjBgEQAAEBAwYGAgICBAEIAwkCBQsDASYDEAQGIBYYFz8vCAglOxNBHQcPRAEVAQEBAQo0JhYgHQUtJw8CFAIEAw4GBAELDxUgBAcGDRstORMdEgYMEBITJQ8DBSQIAQEBExI2AgIFAwUICQEFBgEFBwIBAwEBBhYUABYFBRIBEzEOBAEHIAcJBBUnGAAfAzcpAQEBFTcHEyIBKhEgMwVDLwAzEw4ZHjcEEgIXCSQhJzEPAAEDR0cCGC01AQEEBgILCQYDBgMKBAcOBg8AAgIDBQEEFhoNABUoAAFCMwUCBAIVIRolHQEHPQUBEhUiQEkfEhQGDwwLGgwhFh8IFQgWFBsjJzUyDjUELgEtAQEBIwEBCQoCBAkbBxIXMzgAKBRDNQMZJ0IFAR44CQomAiUXMAMzQykIHQEBAQkeKi0CECcTJwEKAwUTE0ITASoRAgkBCBcFQEI/AwooIQgBARYgGQMKAQEFAAFBAjgvODoHPSQRICIIGwEiAB4TIEYkGBopAwhAQB4AAgEHAhYPAQEkAzE0DCQMBQgcAQEBG0MODBojBRJGAQEBEBUGAygBHUcOFjAzRygPFgImAiUBAQEWFUcgMiEsDwwpCgEFJREDAhAIIiwxMSoHAScIAQoBEAgJAgENBAICAQcBChRCN0c0GkQSEyUdEgYMDwMQBSQIAQEBExIHHQ8WIB0FJy0VAQEBDwIUAgEEBwYNGzktEwckFSAEEQYEARoBCjQmPRgVAi9CAD4FJgEpPw8MCwABAQEBAgMCAQIBAwICBwECAQYBAQcDAgMBAwIBBAECAgEqNAkTJAsREjYbNw4BEAYWAQgRMwUAKg8JBwEHBQUCGwEFCigBAQQFAQkBAwMHCgEQAwMFNQ4ADwcJBAIBBxcFBwMPAwQFAwIHAQEBCwEBAQEBAQ8JDRsNDRcPCQgBAQ0rBRISAQYeBkEPBCMHCAMBEAIBGQImQQsmKgg+AgsBFAsHBBAOIx0CAQICAQEBAQEEAgcKBQMBAQIBAQEEAQEDAgIHBgoDAwoDAgEDIAZBSSFHOwgPLBoNBwYBAQEDAwEHCgsBBAQBAQEBAQEBAQEDBAIBBzgmBwIRAQEjAgEEABUBAhQaGSUNJBQUAAEFAQQHCAEBAgMJAQECBwYGAwMCMgcbAQEBAQICAQECBQEBAgICAQEBAQEBAgEBBgEBBwIHAQEDAQIBAQscEw0RNQIJAQEBBQEBAgIIDwoBFgsLAgQEHx0BAQEGSA8sCAEBCQkDLQIxHjESEAIcFQEBAQkQDwMKKRkCIQEBAQQCHh8IATZJGUgZAwxIMwkBFzQBCQEUSDchLwEABAEjBwoKCyAQGCQENSBIGSg6AwAJFglHIwUCFQ4DLDFHATkYDT8DSCcICyEKECcECBAMAhETEzATAwIxHi0CFEcmJgACAQIDBQEiAgsBKgM5NUAwDhQLIAcwCCc5AgEGFw8HDAEFDwEKCwQHBQ4MChUMBQQAAQILBAEBCgEpNkAUChYeMyoRDQISGj43CxoUBQICLAE1OgwEHiIBCAE9AhERAwERBQgCAwgHDQICAwICAQUEAQMCCAUFAQEDAQEFAgIBAwIDAwAMAh0RAgEBPxknEwosJTAwCDc0IwgEGxgCAQEsCgQIHgQgMDxENQEIAAcCBgUjGDcCOgEBAQEIKhItCzIoRxUQBgEgFz8vFhgsSAgaAAEBAwYGAgICBAEIAwkCBQsDASlBEzsGJQgREA8BAUcmEA0hIQobIQc4EyQDIBYwRgIIExAYBBosRgEYAygCATRIIB0LNRsbBg0aKB4RDg0ZAhICAwsFBQ4GBAQKBAEFATYJCA0BAQEDBgEJCjU1NQoqJwIHEwgVEQ0GCwk9BxRCAyEQAyANDQpHOTkHAwkDAwELAgYGAgEEAQs3NwQzFwUwDAYGCzc3BjkJBAMDAgEEAgEBAgIDAQEFBAYBAQECAQEBAQICAQYFAQQnBhE6CxEnJR4MBwkEKggENSoSAwIUBAZEBB87BA4CJUEGAyMcBAkoKAQOIBkPHxwECQQKBAIDAwEHAgQGAQgBCj4LPgsCCQoSOgobEjcoAggmEjc7OwEBIz8CAgEBPwEBAQEBARgoJBAPFAQfHAc9Nzc3FhYRMRQFCCQzFSAKJkQBLiUILQhGFQEKMRMzBDEIOQACCh8KCQsJNQEBAQEuNwsKDjQABQ4OGx4CFSQ7MzUcHRgKDxYJFyomDRgKNgw3NRoqHiAJHQ8KKg8mDygrMSIiNh0BMgIlGAEKBwsECgEHBAkPCQkBBAg1DTZBBAIIHR0ESEgxOisrLAs/FioeQRkZDRADBgIHAgIYBAJCFhU6AgEDLyozBQYkF0gCHxAQRUIIGgEIHAUFBgIBAwEEAQEFBAEGBAIKAgMtAy8AARkBAQE9LCwnAQIKAToOASQKDREPAQIBAwAyJAc6AgIAAQEDBAEDAQEBAQQCAwMBAQEHAwECAgEBAQEBBgEBBwEBARoXCR8MEAEGFBEgNBcMKjk2AT8BAQEBAQEmIA8GAhYIIhs9QENCGC0BNDQECTIURS0oHQEsOhUXEwIWFhYHAhYCJwIDA0UADQgGBwsWIBM1OTUBAQEBOQABAgMBAwECAQEBAgECAwEBAQMBAwECAwcBAQEBAQEFAwYDAg0IAQwCHg4JAQwQFAIAAgYDCgEBAQMBAQULETE/BRoJKA4WGAxBDQc9MUkfFAEVIkAoQjMSBQIEAhUhGgMBIQACAgMFAQQWABUAAQUyDjUGDwwLGgwhFh8IFQgWGyMUJzUWCwMwHgwEBR4JFxAaAgUFJCkjAyYBJAYFAgcCAwMQKD0WGAwOCRdAAkQjRiMmEjAYSBI2CSklAwErJgNAESEEFwUIJAIBARcyExgQEh8fBwUBAQcVDgMDGyQMEgYPAQwJAw4CDzUCDCUEATQjDhACJhYNJAUBASoBAQEGHzEDNwICBQMFCAkBBQYBBQcCAQMBAQYUFgAWBQUSARM2DgAfBAEHIAcJBBgVJykBAQE3FQAzExICFwkUDgIZJCEnMR4vDwNHRwABNwQ1BxMiAUMRKiAzBQEBBAYCCwkGAwYDCgQHBg4PGC0RBxIdARIYHBErCAgXDgEBATcAAwYOFg0BAQEBCwY0AQEBAQs6Dz47ChwaQhAHPQ8OAQcBAiEMMQwwDDwjDA8KEQEcAyACOhYnQUdHARpHJzNERAooAhM4OAAhJhIBAQMHBgAYCgILGAkcBQ0GChkVHRcAARsUCwUFGwQIMgUDDCIVBDw+GwZDGQQJBA4EBQUCDj0ILBkBAhJAQDMzEhIDSEgcEjwrETIKGj8bEiQYLQEIHBI9ADI7Cw8LJissEz0DAQkHDwQEBBAGBhIBLUQDCBoiHTwmFCQQGAQzAwk/DCU5OScPAQEAAgEBAQECAQIBAQEBAQECAwICAwMCAQEBAQECAgEFAggDAQIBAQIBAQEBCDoiGxUnNSgTDAAaFS8LMgEIRgQJJQ8AJB4ASEgASA1DDQQCNhYFAjdBERESAQECAQMRBCAEGw4CEwExCTw4GRkdHgADBQQDAwEKAgYBBgcEAgkLAAgDCgEGBgIPJgABAAEPAAEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAgEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQABAQEBAQQEAQMBAQEGBAkJAgEMAwECAwQpCAITAAUBAQICAgQKDAEFAgIBAQoGAwIAARAMCBMPAAIFBA0EDRMHAw8FDQQDAQ8NJTE0MQoxMAoxMgoxMwoxNAoxNQoxNgoxNwoxOAoxOQoyCjIwCjMKMzAKNAo1CjYKNwo4CjkKYQphYmF5CmFiaQphYmltYW4KYWJ5YXMKYWJ5YXNlbgphYwphY2FuYWsKYWNlCmFjbGFwcmF0aXN0YW4KYWNsb3lhbgphZAphZGlrCmFkcmlzeQphZHRlbgphZHZlc3QKYWR5YXRtaWsKYWR5YXRtaWt0CmFlCmFlZwphZWdpCmFlbgphZwphZ2FyCmFnZQphZ2wKYWdsaQphaGFuCmFoYW5rYXIKYWhhbmthcmkKYWoKYWphbm0KYWthcnNhbgpha2FydGF2eQpha2VsCmFrZWxhcGFuCmFrZWxlCmFsYXMKYWxhc3kKYWxzaQphbWlyCmFuCmFuYWRpCmFuYW5kCmFuYW50CmFuYXZhc3lhawphbmRha2FyCmFuZGVyZQphbmRlcmkKYW5lCmFuZ2VyCmFuaXlhbnRyaXQKYW5rYW4KYW50CmFudGFyCmFudWJhdgphbnVidXRpeWFuCmFudWNpdAphbnVzYXIKYW51c2FzYW4KYW51c2FzYW5oaW50CmFvCmFwCmFwaQphcGsKYXBrZQphcGtpCmFwa28KYXBuCmFwbmFrYXIKYXBuZQphcG5pCmFwcmFkYm9kCmFwcmFkaQphcHVyeWFtYW5hbQphcmFtCmFyanVuCmFycGl0CmFydAphcwphc2FrdGkKYXNhbgphc2Fuc2F5YW4KYXNhbnRpCmFzYXIKYXNpdAphc2xpCmFzdWQKYXN1cmkKYXQKYXRlCmF0aQphdG0KYXRtYWpuYW4KYXRtYXZpc3ZhcwphdG1vcGFteWVuCmF0eWFkaWsKYXR5YW50CmF2YXN0CmF2YXN5YWt0CmF2aWJha3RhbgphdmljYWwKYXZ5YWtzb3lhbgpheQpiYWMKYmFjZQpiYWN0CmJhZApiYWRhZW4KYmFkYWwKYmFkYWxuCmJhZGxhdgpiYWdlCmJhZ28KYmFndmFuCmJhaGFrdApiYWh1dApiYWphbXlhaGFtCmJhamFuCmJhanRlCmJhbApiYWxiCmJhbHB1cnZhawpiYWx2YW4KYmFseQpiYW4KYmFuYXQKYmFuYXRpCmJhbmF2dGkKYmFuZApiYW5kYW4KYmFuZHVyYXRtYXRtYW5hc3Rhc3kKYmFuZQpiYW5vCmJhbnQKYmFyCmJhcmF0CmJhcmF0ZQpiYXJiYWQKYmFyaQpiYXJvcwpiYXJ0CmJhcnRhcnNhYgpiYXJ0aQpiYXMKYmF0YW8KYmF0ZW4KYmF0awpiYXRvbgpiYXYKYmF2aXN5CmJhdm4KYmF2bmFlbgpiYXZuYW9uCmJhdnRpCmJheQpiYXlhbmFrCmJlZGJhdgpiZWh0YXIKYmkKYmlqbGkKYmlqbmVzCmJpbgpiaXRhcgpib2cKYm9nb24KYm9qYW4KYm9rdGFyYW4KYm9sZWcKYnJhaG1hbgpicmFobWFuZQpicmFobWFueWFkYXkKYnJhbQpicmFtaXQKYnJhbXlhbnNhcnZhYnV0YW5pCmJyZWsKYnJ1aGkKYnVkZQpidWRpCmJ1ZGltYW4KYnVkaW4KYnVkaW5hcwpidWRpbmFzYXRwcmFuYXN5YXRpCmJ1ZGlyeXVrdGFzeQpidWR2CmJ1agpidWwKYnVyCmJ1cmFlaQpidXJlCmJ1dGVzdQpjYQpjYWhhbgpjYWhpZQpjYWhuCmNhaHQKY2FodGUKY2FrcgpjYWwKY2FsYW0KY2FsYW4KY2Fsa2FyCmNhbHQKY2FtYXRrYXIKY2FuY2FsCmNhbmRhbApjYW51YmFuZGUKY2FyCmNhcmF2CmNheXRhbgpjZWthbnRhbW5hc25hdApjZW4KY2V0c3VkdXJhY2FybwpjaWoKY2lqZW4KY2ludApjaW50YWVuCmNpbnRhbgpjb250cm9sCmNvcgpjb3JrYXIKY29ybgpjb3JuZQpjb3JvCmNvdApjb3RpCmN1bnRlCmRhYgpkYWV0CmRhbWJvCmRhbgpkYW5iCmRhbnVyZGFyCmRhcgpkYXJkCmRhcm1hdG0KZGFybgpkYXJwb2JpbWFuYXNjCmRhcnQKZGF5CmRlCmRlYXQKZGVoYW50YXJhcHJhcHRpcmRpcmFzdGF0cgpkZWhlCmRlaGlub3NtaW55YXQKZGVrCmRla2FyCmRla3QKZGVrdGUKZGVuCmRlbmUKZGVyeQpkZXNpcmUKZGV0CmRldGkKZGV2aQpkaWthZWkKZGlrYXRpCmRpa2F5CmRpa3RpCmRpbgpkaW5vbgpkaXBhawpkaXJlCmRpcwpkaXNjcmltaW5hdGlvbgpkaXZ5CmRpeQpkb25vbgpkb3J0ZQpkb3MKZG9zdApkcmFldmFyCmRyaXN0aQpkcnV2YW4KZHJ1dm8KZHVrCmR1a2VzdmFudWR2aWduYW1uCmR1a3lvbmF5CmR1bmcKZHVyCmR1cmF0eWF5CmR1cmdhdG4KZHVybmlncmFoYW4KZHVzbWFuCmR1c3IKZHVzcmUKZHVzcm9uCmR1c3QKZHZhbmR2CmR2YXIKZHZhcmFuCmR2ZXMKZHZpc2F0CmR5YW4KZHlhbmF0CmVnamFtCmVoc2FzCmVrCmVrYWdyCmVrdApla3VhbGl0eQplcwplc2kKZXRhZHZpZGl0dgpldgpldmFuCmZhbApmYW5zYXQKZmF0CmZlbApmZXNsZQpmaWxpbmcKZmlyCmZvbgpmb3IKZnJpZG9tCmZ1ZApnYWxhdApnYWx0aQpnYWx0aXlhbgpnYW0KZ2FtYW5kCmdhcmkKZ2FyaWIKZ2FydgpnYXZpCmdheQpnYXlhYgpnaXIKZ2lydGkKZ2l0CmdyaWQKZ3JpaG5hdGkKZ3VpbHR5Cmd1bQpndW10ZQpndW4KZ3VuYW15aQpndW5vbgpndXJ1Cmd1c2UKaGFsawpoYW0KaGFtZXMKaGFudGkKaGFyCmhhcmFudGkKaGFydGUKaGFzdGluaQpoYXRhcwpoYXRpCmhhdG90c2FoaXQKaGF2CmhlCmhlbgpoaQpoaW5zCmhpdApobwpob2cKaG9rYXIKaG9uCmhvbmUKaG90CmhvdGUKaG90aQpocmlkYXkKaHJpZGVzZXJqdW4KaHJpZGkKaHUKaHVlCmh1bgpoeWFrYXJtYW4KaHlhcGkKaHllcwppYwppY2FlbgppY2FvbgppZG1hc3RpZGFtcGkKaWR5YW0KaWhldgppbmRyaXkKaW5kcml5YW4KaW5kcml5YW5pCmluZHJpeW9uCmlubWVuCmluc2FuCmludGFyYXZ5dQppc2FtCmlzZQppc2kKaXNpbGllCmlzbGllCmlzdmFyCmphCmphYgpqYWUKamFlbgpqYWdhaApqYWduCmphZ3RpCmphaGFuCmphbApqYWxkaQpqYWxlCmphbgpqYW5hawpqYW5lCmphbmsKamFua2FkYXkKamFubQpqYW50CmphcgpqYXQKamF0YXN5CmphdGUKamF0aQpqYXl0ZQpqZXNlCmppCmppbmhlbgpqaW5rCmppcm5hbmkKamlzCmppc2UKamlzawpqaXNrZQpqaXNtZW4KamlzbmUKaml0CmppdGUKaml0bgpqaXRuZQpqaXR2CmppdmFuCmppdmFuYmFyCmppdm9uCmppeQpqbmFuCmpuYW5hbgpqbmFuYXBsYXZlbmV2CmpuYW5pCmpvCmpvYgpqdWtha2FyCmp1cmUKanlhZApqeWFkYXRhcgpqeWF5bwpqeW90aXNhbXBpCmp5b3RpeW9uCmthCmthYmkKa2FkYWNpdAprYWRhbQprYWgKa2FoZQprYWhsYXQKa2FobmUKa2FodAprYWh0ZQprYWwKa2FscGFuYWVuCmthbQprYW1ha3JvZHZpeXVrdGFuYW4Ka2FtYW55CmthbWF0a3JvZG9iaWpheXRlCmthbWpvcgprYW1qb3JpCmthbXlhYmkKa2FuZnl1agprYW50ZW50CmthcHIKa2FwcmUKa2FyCmthcmFuCmthcmUKa2FyZW4Ka2FyaWQKa2FyaXlhcgprYXJrZQprYXJtCmthcm1hbmFldgprYXJtYW5pCmthcm1vbgprYXJuCmthcm5lCmthcm8Ka2Fyb2dlCmthcm90ZWoKa2Fyb3RpCmthcnBhbnlhZG9zb3BhaHRhc3ZhYmF2CmthcnQKa2FydGF2eQprYXJ0ZQprYXJ0aQprYXJ1bgprYXJ1bmF2YW4Ka2FydW5nCmthcnkKa2F0YW4Ka2F0aW4Ka2F0aW5hZWkKa2F0aW5hZXlhbgprYXRpbmFleW9uCmthdG0Ka2F5YW4Ka2F5YXJ0CmtlCmtlbmRyCmtlcwprZXZhbApraQpraWUKa2luYwpraXNpCmtpeQprbGVieWFuCmtvCmtvaQprb21hcmFuCmtvbnRleQprcmlwCmtyaXB5CmtyaXNuCmtyaXNubwprcm9kCmtyb2RhZAprcm9kYXN0YXQKa3J1cgprcnVyYW4Ka3NhbQprc2FtYXNpbAprc2FtaQprc2FuaWsKa3VjCmt1ZAprdXJ1Cmt1dApreQpreW9uCmt5b25raQpsYWIKbGFiYXN2CmxhZ2FvCmxhZ2F0CmxhZ2F0YXIKbGFnZQpsYWdlbgpsYWduCmxhZ3QKbGFndGUKbGFqaW5lcwpsYWtyaQpsYWtzeQpsYWxhYwpsYW4KbGFvCmxlCmxla2FyCmxla2luCmxlbgpsZXQKbGV0ZQpsZXRpCmxpZQpsaXkKbG8KbG9iCmxvZwpsb2dlCmxvbmVsaW5lcwpsb3Rhbgpsb3ZlZApsdXN0Cm1hCm1hY2l0Cm1hZGFkCm1hZGJhdmF5b3BhZHlhdGUKbWFmCm1haGFiYWhvCm1haGFuCm1haGF0dmFwdXJuCm1haHN1cwptYWpidXQKbWFtCm1hbWVrYW4KbWFtamFtbmFkaW4KbWFtbmFueWFiYWsKbWFuCm1hbmFzY2FuY2FsbWFzdGlyYW0KbWFuZ2F0Cm1hbmppbAptYW5tYW4KbWFubwptYW5zaWsKbWFudAptYW51c3kKbWFyCm1hcmcKbWFyZ2FkYXJzYW4KbWFyaQptYXJ0aQptYXN0ZXJ5Cm1hdAptYXRwYXIKbWF0cHJhc2FkYXRhcmlzeWFzaQptYXkKbWF5YXNha3RpCm1lCm1laG5hdAptZW4KbWVyCm1lcmF0YW4KbWVyaQptaWwKbWlsZWcKbWlsbmUKbWlsdAptaWx0aQptaWx2YXRpCm1pbmF0Cm1pbmRmdWxuZXMKbWl0Cm1pdHIKbW9iYWVsCm1vaGFubWF0bWFuCm1vaGF5c2l2Cm1vanVkCm1va2UKbW9rcwptb2wKbW90Cm1yaXRhc3kKbXJpdHl1Cm1yaXR5dXIKbXJpeXRlCm11aHlhdGkKbXVqZQptdWpzZQptdWt0Cm11a3RpCm11c2tpbAptdXNraWxlbgpuYQpuYWRpeWFuCm5hZQpuYWhpbgpuYW1hc2t1cnUKbmFyCm5hcmFkbWFuCm5hcmFrCm5hcmthc3llZGFuCm5hcm9wcmFuaQpuYXNhbm1hdG1hbgpuYXNhcml0Cm5hc3QKbmFzdGkKbmF0eWFzbmF0YXN0dQpuYXZhbmkKbmF5Cm5lCm5laQpuaWNlCm5pbmQKbmlyYXMKbmlybWFsYXR2YXQKbmlybmF5Cm5pc2NhbGFtCm5pc2NhcnRpCm5pc2NpbnQKbmlzY2l0Cm5pc2thbQpuaXR5YW4Kbml2cml0aW4Kbml5YW0Kbml5YW15Cm5peWFudHJhbgpuaXlhbnRyaXQKbml5YXQKbml5dGFuCm51a3NhbgpvZgpvbmVzCm9yCnBhY3RhdApwYWN0YXYKcGFlaQpwYWdhbHBhbgpwYWhhbgpwYWhsZQpwYWh1bmNpCnBha2FybmUKcGFuZGl0CnBhbmUKcGFvCnBhcApwYXBpCnBhcG9uCnBhcgpwYXJhZWkKcGFyYW0KcGFyYW4KcGFyYXQKcGFyZXNhbgpwYXJpbmFtCnBhcml2YXIKcGFybwpwYXJ0CnBhcnRvCnBhcwpwYXN5YXRpCnBhdApwYXZpdHJhdApwZWFjZQpwZWQKcGVyY2VwdGlvbgpwZXMKcGljZQpwcmFiYXZpdApwcmFjdGljZQpwcmFndGkKcHJha2FyCnByYWthcwpwcmFrYXNrYW0KcHJha3JpdGkKcHJha3JpdGlrCnByYW1hdGluaQpwcmFuYW15CnByYW5hc3lhbWkKcHJhbmlkYXkKcHJhcGFkeWFudGUKcHJhcHQKcHJhc2FkeWUKcHJhc2JhbgpwcmF0aWtyaXkKcHJhdmlzYW50aQpwcmF2cml0aW4KcHJheWFzCnByZW1wdXJ2YWsKcHJpeQpwcml5amFuCnB1bnkKcHVyYW4KcHVyYW5lCnB1cmFuaQpwdXJpCnB1cnVzCnB1cnVzYXJ0aQpwdXJ1c2FzeQpyYWcKcmFnYWR2ZXNhZmxhcHJlcHN1CnJhZ2FkdmVzdmlyb2RpCnJhaApyYWhhc3kKcmFoZQpyYWhpCnJhaGl0CnJhaG4KcmFodApyYWh0ZQpyYWh0aQpyYWphb24KcmFqYXMKcmFqb2d1bgpyYWpvZ3VuYXNtdWRiYXYKcmFqb2d1bmkKcmFqeQpyYWp5YW4KcmFrCnJha2VuCnJha24KcmFrbmUKcmFrbwpyYWtzCnJha3QKcmFuZwpyYXNpCnJhc3RlCnJhdApyaWNhdGkKcmlla3NhbgpyaWpla3QKcmlzdGUKcmlzdG9uCnJvagpyb2thcgpyb3NuaQpydWsKcnVwCnNhCnNhYgpzYWJpCnNhYmsKc2Fia28Kc2FibWVuCnNhYnNlCnNhY2kKc2FkbgpzYWRvc2FtcGkKc2FmYWwKc2FmYWx0CnNhaGFyCnNhaGkKc2FoamFuCnNha2FyYXRtYWsKc2Frcml5dApzYWt0CnNha3RpCnNhbWFqCnNhbWFqZGFyaQpzYW1hamthcgpzYW1ham4Kc2FtYWpuZQpzYW1hanQKc2FtYWp0ZQpzYW1hanRpCnNhbWFuCnNhbWFwdApzYW1hcnBhbgpzYW1hc3kKc2FtYXkKc2FtZGFyc2luCnNhbWV0CnNhbWlkb2duaXJiYXNtYXNhdGt1cnV0ZQpzYW1pbApzYW1uZQpzYW1vaGFuCnNhbXBhZApzYW1yaWQKc2FtcmlkYW0Kc2FtdWRyCnNhbXVkcmFtYXAKc2FteWUKc2FuYXRhbgpzYW5iYW5kCnNhbmJhbmRvbgpzYW5iYXZuCnNhbmNhbGl0CnNhbmdhbgpzYW5nYXN0ZXN1cGpheXRlCnNhbmdhdApzYW5pdmlzdG8Kc2FuamF5dGUKc2FubW9oCnNhbm1vaGF0CnNhbnAKc2Fuc2FyCnNhbnNhcmVzdQpzYW5zaWRpbWFzdGl0CnNhbnNwYXJzYWoKc2Fuc3RhYnlhdG1hbm1hdG1hbgpzYW50CnNhbnRpCnNhbnRpbWFwbm90aQpzYW50aW1kaWdhY2F0aQpzYW50aW4Kc2FudG9zCnNhbnR1bGl0CnNhbnlhbQpzYW55YW15CnNhbnlhdGVuZHJpeQpzYXJhYgpzYXJhbHQKc2FyYW4Kc2FyZ28Kc2FyaXIKc2FybmFuCnNhcnQKc2FydmFidXRhbmFuCnNhcnZhYnV0ZXN1CnNhcnZhZGFybWFucGFyaXR5YWp5CnNhcnZhZHVyZ2FuaQpzYXJ2YW4Kc2FydmFuaQpzYXJ2YXNyZXN0CnNhcnZhc3kKc2FydmF0cgpzYXQKc2F0aQpzYXRydQpzYXRydW5idW5rc3YKc2F0dmFndW4Kc2F0dmFuCnNhdHZpawpzYXR2aWtpCnNhdHkKc2UKc2VhcmNpbmcKc2lkaQpzaWdyCnNpa24Kc2lrbmUKc2lrcwpzaWtzYWsKc2luZnVsCnNpcmYKc2l0b3NuYXN1a2R1a2QKc2tyb2wKc2t1bApzbQpzbWFyYW4Kc21yaXRpCnNtcml0aWJyYW5zYWQKc21yaXRpcmpuYW5hbXBvaG5hbgpzbXJpdGl2aWJyYW0Kc29jCnNvY2thcgpzb2NvCnNvY3RlCnNvbgpzb3BpbmcKc29yaQpzcGFzdApzcmFkCnNyYWRhdmFuYW5zdXlhc2MKc3JhZGF2YW5sYWJ0ZQpzcmVzdApzcmV5CnNyaW51eWFkcGkKc3RhbgpzdGFydGFwCnN0aXIKc3RpcmJ1ZGkKc3RpdApzdGl0YW0Kc3RpdGFuCnN0aXRpeW9uCnN1YmFoCnN1ZApzdWRhcgpzdWRhcnRlCnN1awpzdWthbgpzdWtpCnN1bmRhcgpzdW50CnN1cnUKc3VydWF0CnN1cnlhc3QKc3VyeW9kYXkKc3VzdApzdXN0aQpzdmFiYXYKc3ZhYmF2aWsKc3ZhYwpzdmFydApzdmF5YW4Kc3lhbmlzY2l0YW4KdGFiCnRhYmkKdGFqeW90aQp0YWsKdGFrYW4KdGFrYXZhdAp0YWxhcwp0YW1zaWsKdGFuYXYKdGFuYXZhZ3Jhc3QKdGFuZAp0YW5oYW4KdGFuaQp0YW5zdGF0ZXYKdGFwCnRhcmFoCnRhcmlmCnRhc21hdAp0YXNtYXR2YW1pbmRyaXlhbnlhZG8KdGFzbWF0dmFtdXRpc3QKdGFzeWFoYW4KdGF0CnRhdHBhcgp0YXRyCnRlCnRlagp0ZXJlCnRlcmppdAp0aQp0aWsKdGlrYXQKdGltCnRpbgp0aXN0YXRpCnRpdGlrc2Fzdgp0bwp0b3IKdG9yaQp0cmVmaWsKdHJpdmlkYW4KdHUKdHVtaGFyZQp0dW1oZW4KdHVta28KdHVtbmUKdHVyYW50CnR1dAp0dmFtaGFtCnR2YW4KdHlhZwp0eWFqZXQKdHlha3R2CnVkYXJlZGF0bWFuYXRtYW5hbgp1ZGVzeQp1ZHlhdAp1anZhbAp1bGoKdW1pZAp1bmhlbgp1bmhvbmUKdW5raQp1cGFyCnVwYXN0aXRpCnVwdmFzCnVyagp1c2UKdXNpCnVzawp1c2tlCnVza2kKdXNtZW4KdXRhZQp1dGFrYXIKdXRhbgp1dGFyCnV0a2FyCnV0bmUKdXRvCnV0cGFuCnV0c2FoCnZhCnZhaAp2YWhhbXlhaGFtCnZhaGFuCnZhaGkKdmFqYWgKdmFreWVuCnZhbAp2YWxlCnZhbGkKdmFwYXMKdmFybmFuCnZhc2Fuc2kKdmFzbgp2YXN0YXYKdmFzdHIKdmUKdmVic2FldAp2ZWRhdmluYXNpbmFuCnZlcmFneQp2ZXNlCnZldGkKdmliYWt0YW1pdgp2aWNsaXQKdmlkaXlvCnZpZHlhdmluYXlzYW5wYW5lCnZpZmFsdAp2aWhheQp2aWpheQp2aW5hbXJhdAp2aW5hcwp2aXBhc2NpdAp2aXIKdmlzbXJpdGkKdmlzdmFydXAKdmlzeWVidXRlc3UKdmlzeW9uCnZpdHJhZ2FieWFrcm9kCnZyYWoKdnJpZGF2YXN0CnZ5YWt0aQp2eWFtaXNyZW5ldgp2eWFwYXIKdnlheWFtCnlhCnlhY3JleQp5YWQKeWFkYWdyZQp5YWRhc3QKeWFkaQp5YWR2YXQKeWFoCnlhaGkKeWFoaW4KeWFqbgp5YWpuYXRhcHNhbgp5YW5pCnlhbnRyYXJ1ZGFuaQp5YXNvCnlhdAp5YXRlZGFuc2kKeWF0aW5hbgp5YXRvCnlhdHIKeWUKeWVzYW4KeW8KeW9nCnlvZ2Frc2VtYW4KeW9nZXN2YXIKeW9naQp5b2dvc3RpCnlvdm5hbgp5dWt0Cnl1dHl1Ygp5dXZhdmFzdArgpIXgpJXgpLDgpY3gpKTgpLXgpY3gpK8K4KSF4KSV4KWH4KSy4KS+CuCkheCkleClh+CksuCkvuCkquCkqArgpIXgpJXgpYfgpLLgpYcK4KSF4KSX4KSwCuCkheCkl+CksuCkvgrgpIXgpJfgpLLgpL8K4KSF4KSa4KSy4KSq4KWN4KSw4KSk4KS/4KS34KWN4KSgCuCkheCkmuCksuCli+CkveCkrwrgpIXgpJrgpL7gpKjgpJUK4KSF4KSa4KWN4KSb4KS+CuCkheCkmuCljeCkm+ClhwrgpIXgpJzgpK7gpL4K4KSF4KSkCuCkheCkpOCksArgpIXgpKTgpL8K4KSF4KSk4KWN4KSv4KSkCuCkheCkpOCljeCkr+Ckp+Ckv+CklQrgpIXgpKbgpYPgpLbgpY3gpK8K4KSF4KSm4KWN4KS14KWH4KS34KWN4KSf4KS+CuCkheCkp+CkleCkvuCksArgpIXgpKfgpL/gpJUK4KSF4KSn4KWH4KSw4KS/CuCkheCkp+Clh+CksOClhwrgpIXgpKjgpKQK4KSF4KSo4KS+4KSm4KS/CuCkheCkqOCkvuCkteCktuCljeCkr+CklQrgpIXgpKjgpL/gpK/gpKTgpY3gpLDgpL/gpKQK4KSF4KSo4KWB4KSa4KS/4KSkCuCkheCkqOClgeCkreCktQrgpIXgpKjgpYHgpK3gpYHgpKTgpL/gpK/gpL4K4KSF4KSo4KWB4KS24KS+4KS44KSoCuCkheCkqOClgeCktuCkvuCkuOCkqOCkueCkv+CkqOCkpOCkvgrgpIXgpKjgpYHgpLjgpL7gpLAK4KSF4KSq4KSo4KS+CuCkheCkquCkqOCkvuCkleCksArgpIXgpKrgpKjgpL8K4KSF4KSq4KSo4KWHCuCkheCkquCksOCkvuCkp+CkrOCli+CkpwrgpIXgpKrgpLDgpL7gpKfgpL8K4KSF4KSq4KS/CuCkheCkreCkrwrgpIXgpK3gpL8K4KSF4KSt4KS/4KSu4KS+4KSoCuCkheCkreCljeCkr+CkvuCkuArgpIXgpK3gpY3gpK/gpL7gpLjgpYfgpKgK4KSF4KSu4KS/4KSwCuCkheCksOCljeCknOClgeCkqArgpIXgpLDgpY3gpKUK4KSF4KSw4KWN4KSq4KS/4KSkCuCkheCkteCkuOCljeCkpeCkvgrgpIXgpLXgpL/gpJrgpLIK4KSF4KS14KS/4KSt4KSV4KWN4KSkCuCkheCkteCljeCkr+CkleCljeCkt+Cli+CkveCkrwrgpIXgpLbgpL7gpKTgpL8K4KSF4KS24KWB4KSm4KWN4KSnCuCkheCkuOCksArgpIXgpLjgpLLgpL8K4KSF4KS44KS24KSvCuCkheCkuQrgpIXgpLngpJXgpL7gpLAK4KSF4KS54KSV4KS+4KSw4KS/CuCkhgrgpIbgpI8K4KSG4KSP4KSX4KS+CuCkhuCkj+Ckl+CkvwrgpIbgpJMK4KSG4KSV4KSo4KS+CuCkhuCkleCksOCljeCkt+CkowrgpIbgpJcK4KSG4KSX4KWHCuCkhuCknArgpIbgpKTgpL4K4KSG4KSk4KS/CuCkhuCkpOClhwrgpIbgpKTgpY3gpK7gpJzgpY3gpJ7gpL7gpKgK4KSG4KSk4KWN4KSu4KS14KS/4KS24KWN4KS14KS+4KS4CuCkhuCkpOCljeCkruCkvgrgpIbgpKTgpY3gpK7gpYzgpKrgpK/gpYfgpKgK4KSG4KSm4KSk4KWHCuCkhuCkp+CkvgrgpIbgpKfgpY3gpK/gpL7gpKTgpY3gpK7gpL/gpJUK4KSG4KSn4KWN4KSv4KS+4KSk4KWN4KSu4KS/4KSV4KSk4KS+CuCkhuCkqOCkpgrgpIbgpKjgpL4K4KSG4KSo4KWHCuCkhuCkqgrgpIbgpKrgpJXgpL4K4KSG4KSq4KSV4KS/CuCkhuCkquCkleClhwrgpIbgpKrgpJXgpYsK4KSG4KSq4KWB4KSw4KWN4KSv4KSu4KS+4KSj4KSu4KWNCuCkhuCkr+CkvgrgpIbgpLDgpL7gpK4K4KSG4KSy4KS4CuCkhuCksuCkuOCkvwrgpIbgpLLgpLjgpY3gpK8K4KSG4KS14KS24KWN4KSv4KSV4KSk4KS+CuCkhuCktuCkvgrgpIbgpLjgpJXgpY3gpKTgpL8K4KSG4KS44KS+4KSoCuCkhuCkuOCkv+CkpArgpIbgpLjgpYHgpLDgpL8K4KSH4KSa4KWN4KSb4KS+CuCkh+CkmuCljeCkm+CkvuCkjwrgpIfgpJrgpY3gpJvgpL7gpJMK4KSH4KSf4KSw4KS14KWN4KSv4KWBCuCkh+CkoeCljeCkr+CkruCljQrgpIfgpKbgpK7gpLjgpY3gpKTgpL/gpKbgpK7gpKrgpL8K4KSH4KSm4KWN4KSw4KS/4KSvCuCkh+CkpuCljeCksOCkv+Ckr+CkvgrgpIfgpKbgpY3gpLDgpL/gpK/gpL7gpKPgpL8K4KSH4KSm4KWN4KSw4KS/4KSv4KWLCuCkh+CkqOCkruClhwrgpIfgpLbgpK7gpY0K4KSH4KS24KWN4KS14KSwCuCkh+CktuCljeCkteCksOCkgwrgpIfgpLjgpLLgpL/gpI8K4KSH4KS44KS+4KSoCuCkh+CkuOCkvwrgpIfgpLjgpL/gpLLgpL/gpI8K4KSH4KS44KWHCuCkh+CkueCliOCktQrgpIngpJzgpY3gpJzgpY3gpLXgpLIK4KSJ4KSg4KSV4KSwCuCkieCkoOCkqOClhwrgpIngpKDgpL7gpI8K4KSJ4KSg4KS+4KSV4KSwCuCkieCkoOCkvuCkqOCkvgrgpIngpKDgpYsK4KSJ4KSk4KS+4KSwCuCkieCkpOCljeCkquCkqArgpIngpKTgpY3gpLjgpL7gpLkK4KSJ4KSm4KWN4KSm4KWH4KS24KWN4KSvCuCkieCkpuCljeCkp+CksOClh+CkpuCkvuCkpOCljeCkruCkqOCkvuCkveCkpOCljeCkruCkvuCkqArgpIngpKbgpY3gpK/gpKTgpY3gpKUK4KSJ4KSo4KSV4KS/CuCkieCkquCksArgpIngpKrgpLXgpL7gpLgK4KSJ4KSq4KS44KWN4KSl4KS/4KSk4KS/CuCkieCkruCkv+CkpgrgpIngpLDgpY3gpJzgpL4K4KSJ4KSy4KSd4KS+CuCkieCkuOCkleCkvgrgpIngpLjgpJXgpL8K4KSJ4KS44KSV4KWHCuCkieCkuOCkruClhwrgpIngpLjgpLjgpYcK4KSJ4KS44KS/CuCkieCkuOClhwrgpIngpLngpYcK4KSJ4KS54KWL4KSo4KWHCuCki+CkmuCljeCkm+CkpOCkvwrgpI/gpJUK4KSP4KSV4KSk4KS+CuCkj+CkleCkvuCkl+CljeCksArgpI/gpJfgpY3gpJzgpL7gpK4K4KSP4KSk4KSm4KWN4KS14KS/4KSm4KS/4KSk4KWN4KS14KS+CuCkj+CktQrgpI/gpLcK4KSP4KS54KS44KS+4KS4CuCkkOCkuOCkvwrgpJPgpLAK4KSU4KSwCuCkleCkn+Clh+CknwrgpJXgpKDgpL/gpKgK4KSV4KSg4KS/4KSo4KS+4KSHCuCkleCkoOCkv+CkqOCkvuCkh+Ckr+CkvgrgpJXgpKDgpL/gpKjgpL7gpIfgpK/gpYsK4KSV4KSlCuCkleCkpuCkrgrgpJXgpKbgpL7gpJrgpL/gpKTgpY0K4KSV4KSq4KSh4KS+CuCkleCkquCkoeClhwrgpJXgpKvgpY3gpK/gpYHgpJwK4KSV4KSt4KS/CuCkleCkrgrgpJXgpK7gpJzgpYvgpLAK4KSV4KSu4KSc4KWL4KSw4KS/CuCkleCksArgpJXgpLDgpJXgpYcK4KSV4KSw4KSk4KS+CuCkleCksOCkpOCkvwrgpJXgpLDgpKTgpYcK4KSV4KSw4KSo4KS+CuCkleCksOCkqOClhwrgpJXgpLDgpL/gpK/gpLAK4KSV4KSw4KWBCuCkleCksOClgeCkl+CkvgrgpJXgpLDgpYHgpKPgpL7gpLXgpL7gpKgK4KSV4KSw4KWHCuCkleCksOCliwrgpJXgpLDgpYvgpJfgpYcK4KSV4KSw4KWL4KSk4KS/CuCkleCksOCli+CkpOCljeCkpOClh+CknOCkgwrgpJXgpLDgpY3gpKTgpLXgpY3gpK8K4KSV4KSw4KWN4KSk4KS+CuCkleCksOCljeCkrgrgpJXgpLDgpY3gpK7gpKPgpL7gpYjgpLUK4KSV4KSw4KWN4KSu4KS+4KSj4KS/CuCkleCksOCljeCkruCliwrgpJXgpLIK4KSV4KSy4KWN4KSq4KSo4KS+4KSPCuCkleCkuQrgpJXgpLngpKTgpL4K4KSV4KS54KSk4KWHCuCkleCkueCkqOClhwrgpJXgpLngpLLgpL7gpKTgpL4K4KSV4KS54KWHCuCkleCkvgrgpJXgpL7gpK4K4KSV4KS+4KSu4KSDCuCkleCkvuCkruCkleCljeCksOCli+Ckp+CkteCkv+Ckr+ClgeCkleCljeCkpOCkvuCkqOCkvgrgpJXgpL7gpK7gpK/gpL7gpKzgpL8K4KSV4KS+4KSu4KS+4KSk4KWN4KSV4KWN4KSw4KWL4KSn4KWL4KS94KSt4KS/4KSc4KS+4KSv4KSk4KWHCuCkleCkvuCkruCkvuCkr+CkgwrgpJXgpL7gpK8K4KSV4KS+4KSv4KSw4KSk4KS+CuCkleCkvuCksOCkowrgpJXgpL7gpLDgpY3gpKrgpK/gpKbgpYvgpLfgpYvgpKrgpLngpKTgpLjgpY3gpLXgpK3gpL7gpLXgpIMK4KSV4KS+4KSw4KWN4KSvCuCkleCkvwrgpJXgpL/gpI8K4KSV4KS/4KSv4KS+CuCkleCkv+CkuOCkvwrgpJXgpYHgpJsK4KSV4KWB4KSk4KWN4KSk4KS+CuCkleClgeCksOClgQrgpJXgpYPgpKrgpK/gpL4K4KSV4KWD4KSq4KS+CuCkleClg+Ckt+CljeCkowrgpJXgpYPgpLfgpY3gpKPgpYsK4KSV4KWHCuCkleClh+CkpuCljeCksArgpJXgpYfgpLXgpLIK4KSV4KWI4KS44KS+CuCkleCliwrgpJXgpYvgpIcK4KSV4KWM4KSk4KWH4KSvCuCkleCljOCkruCkvuCksArgpJXgpY3gpK/gpL4K4KSV4KWN4KSv4KWLCuCkleCljeCkr+Cli+CkleCkvwrgpJXgpY3gpLDgpYHgpLAK4KSV4KWN4KSw4KWB4KSw4KS+4KSo4KWNCuCkleCljeCksOCli+CkpwrgpJXgpY3gpLDgpYvgpKfgpLjgpY3gpKTgpKXgpL4K4KSV4KWN4KSw4KWL4KSn4KS+4KSm4KWNCuCkleCljeCksuCliOCkrOCljeCkrwrgpJXgpY3gpLfgpKPgpL/gpJUK4KSV4KWN4KS34KSu4KS+CuCkleCljeCkt+CkruCkvuCktuCkv+CksgrgpJXgpY3gpLfgpK7gpL8K4KSW4KSk4KWN4KSuCuCkluCksOCkv+CkpgrgpJbgpL4K4KSW4KS/4KSaCuCkluClgeCkpgrgpJbgpYsK4KSX4KSu4KSDCuCkl+Ckr+CkvgrgpJfgpLDgpL/gpKwK4KSX4KSw4KWN4KS1CuCkl+CksuCkpArgpJfgpLLgpKTgpL8K4KSX4KSy4KSk4KS/4KSv4KS+CuCkl+CkteCkvwrgpJfgpL7gpKHgpL8K4KSX4KS+4KSvCuCkl+CkvuCkr+CkrArgpJfgpL/gpKTgpL4K4KSX4KS/4KSwCuCkl+Ckv+CksOCkpOCkvwrgpJfgpYHgpKMK4KSX4KWB4KSj4KSu4KSv4KS/CuCkl+ClgeCko+CliwrgpJfgpYHgpLDgpYEK4KSX4KWB4KS44KWN4KS44KWHCuCkl+Clg+CkueCljeCko+CkvuCkpOCkvwrgpJjgpK7gpKEK4KSY4KWB4KSu4KSk4KWHCuCkmOClgeCkruCkvgrgpJoK4KSa4KSV4KWN4KSwCuCkmuCkmuCksgrgpJrgpKLgpL7gpLUK4KSa4KSu4KSk4KWN4KSV4KS+4KSwCuCkmuCksuCkleCksArgpJrgpLLgpKTgpL4K4KSa4KSy4KSu4KWNCuCkmuCksuCkvuCkqOCkvgrgpJrgpL7gpKHgpL7gpLIK4KSa4KS+4KSo4KWB4KSs4KSn4KWHCuCkmuCkvuCkr+CkpOCkqArgpJrgpL7gpLAK4KSa4KS+4KS5CuCkmuCkvuCkueCkpOCkvgrgpJrgpL7gpLngpKTgpYcK4KSa4KS+4KS54KSo4KS+CuCkmuCkvuCkueCkv+CkjwrgpJrgpL/gpJwK4KSa4KS/4KSc4KWHCuCkmuCkv+CkpOCkqArgpJrgpL/gpKTgpL4K4KSa4KS/4KSk4KS+4KSPCuCkmuClgeCkqOCkpOClhwrgpJrgpYfgpKTgpY3gpLjgpYHgpKbgpYHgpLDgpL7gpJrgpL7gpLDgpYsK4KSa4KWH4KSoCuCkmuCliOCkleCkvuCkpOCkruCkqOCktuCljeCkqOCkpOCkgwrgpJrgpYvgpJ8K4KSb4KSyCuCkm+Cli+Ckn+CkvgrgpJvgpYvgpJ/gpL8K4KSb4KWL4KShCuCkm+Cli+CkoeCkleCksArgpJvgpYvgpKHgpKjgpL4K4KSb4KWL4KSh4KSo4KWHCuCkm+Cli+CkoeCliwrgpJzgpJUK4KSc4KSX4KS5CuCknOCkoQrgpJzgpKjgpJUK4KSc4KSo4KSV4KS+4KSm4KSv4KSDCuCknOCkrArgpJzgpK4K4KSc4KSu4KS+CuCknOCksOCkvgrgpJzgpLLgpL4K4KSc4KSy4KWHCuCknOCksuCljeCkpuCkvwrgpJzgpLngpL4K4KSc4KS+CuCknOCkvuCkjwrgpJzgpL7gpJfgpKTgpL8K4KSc4KS+4KSX4KSo4KS+CuCknOCkvuCkpOCkuOCljeCkrwrgpJzgpL7gpKTgpL4K4KSc4KS+4KSk4KS/CuCknOCkvuCkpOClhwrgpJzgpL7gpKjgpKTgpL4K4KSc4KS+4KSo4KSo4KWHCuCknOCkvuCkqOCkvgrgpJzgpL7gpK/gpKTgpYcK4KSc4KS/CuCknOCkv+CkpArgpJzgpL/gpKTgpKTgpYcK4KSc4KS/4KSk4KSo4KS+CuCknOCkv+CkpOCkqOClhwrgpJzgpL/gpKTgpL4K4KSc4KS/4KSk4KWN4KS14KS+CuCknOCkv+CkqOCkleCkvgrgpJzgpL/gpK/gpL4K4KSc4KS/4KSw4KWN4KSj4KS+4KSo4KS/CuCknOCkv+CkteCkqArgpJzgpL/gpLXgpKjgpK3gpLAK4KSc4KS/4KS14KWLCuCknOCkv+CkuArgpJzgpL/gpLjgpJXgpL4K4KSc4KS/4KS44KSV4KWHCuCknOCkv+CkuOCkqOClhwrgpJzgpL/gpLjgpK7gpYcK4KSc4KS/4KS44KS44KWHCuCknOCkv+CkueClhwrgpJzgpYHgpKHgpYcK4KSc4KWI4KS44KWHCuCknOClieCkrArgpJzgpYsK4KSc4KWN4KSe4KS+4KSoCuCknOCljeCknuCkvuCkqOCkquCljeCksuCkteClh+CkqOCliOCktQrgpJzgpY3gpJ7gpL7gpKjgpL8K4KSc4KWN4KSv4KS+4KSm4KS+CuCknOCljeCkr+CkvuCkpuCkvuCkpOCksArgpJzgpY3gpK/gpL7gpK/gpYsK4KSc4KWN4KSv4KWL4KSk4KS/4KSv4KWLCuCknOCljeCkr+Cli+CkpOCkv+Ckt+CkvuCkruCkquCkvwrgpJ3gpYHgpJXgpL7gpJXgpLAK4KSf4KS/CuCkn+Ckv+CkleCkvuCkpOCkvgrgpJ/gpL/gpK4K4KSf4KWB4KSf4KSk4KS+CuCkn+CljeCksOCliOCkq+Ckv+CklQrgpKDgpKEK4KSg4KS/4KSVCuCkoeCksArgpKHgpLDgpKTgpL4K4KSh4KS+4KSH4KSfCuCkoeCljeCksOCkvuCkh+CkteCksArgpKTgpJUK4KSk4KSc4KWN4KSc4KWN4KSv4KWL4KSk4KS/4KSDCuCkpOCkpOCljeCkquCksOCkgwrgpKTgpKTgpY3gpLAK4KSk4KSl4KS+CuCkpOCkqOCkvuCktQrgpKTgpKjgpL7gpLXgpJfgpY3gpLDgpLjgpY3gpKQK4KSk4KSqCuCkpOCkrArgpKTgpK3gpL8K4KSk4KSw4KS5CuCkpOCksuCkvuCktgrgpKTgpLjgpY3gpK7gpL7gpKTgpY0K4KSk4KS44KWN4KSu4KS+4KSk4KWN4KSk4KWN4KS14KSu4KS/4KSm4KWN4KSw4KS/4KSv4KS+4KSv4KS+4KSm4KWMCuCkpOCkuOCljeCkruCkvuCkpOCljeCkpOCljeCkteCkruClgeCkpOCljeCkpOCkv+Ckt+CljeCkoArgpKTgpLjgpY3gpK/gpL7gpLkK4KSk4KS+4KSo4KS5CuCkpOCkvuCkqOCkvwrgpKTgpL7gpK7gpLjgpL/gpJUK4KSk4KS+4KSw4KS/4KSrCuCkpOCkvuCkuOCljeCkpOCkpeCliOCktQrgpKTgpL/gpKTgpL/gpJXgpY3gpLfgpLjgpY3gpLUK4KSk4KS/4KSoCuCkpOCkv+Ckt+CljeCkoOCkpOCkvwrgpKTgpYEK4KSk4KWB4KSu4KSV4KWLCuCkpOClgeCkruCkqOClhwrgpKTgpYHgpLDgpKQK4KSk4KWB4KS54KS+4KSw4KWHCuCkpOClgeCkueClhwrgpKTgpYcK4KSk4KWH4KScCuCkpOClh+CksOClhwrgpKTgpYjgpLDgpY3gpJzgpL/gpKTgpIMK4KSk4KWLCuCkpOCli+CkoQrgpKTgpY3gpK/gpJXgpY3gpKTgpY3gpLXgpL4K4KSk4KWN4KSv4KSc4KWH4KSk4KWNCuCkpOCljeCkr+CkvuCklwrgpKTgpY3gpLDgpL/gpLXgpL/gpKcK4KSk4KWN4KS1CuCkpOCljeCkteCkvuCkruCkueCkruCljQrgpKXgpJXgpL4K4KSl4KSV4KS+4KSoCuCkpeCkleCkvuCkteCknwrgpKXgpYcK4KSl4KWL4KSh4KS+CuCkpeCli+CkoeCkvwrgpKbgpKwK4KSm4KStCuCkpuCkreCliwrgpKbgpK/gpL4K4KSm4KSw4KWN4KSmCuCkpuCksOCljeCkquCli+CkveCkreCkv+CkruCkvuCkqOCktuCljeCkmgrgpKbgpL7gpKgK4KSm4KS/4KSW4KSk4KS/CuCkpuCkv+CkluCkvuCkhwrgpKbgpL/gpJbgpL7gpKTgpL8K4KSm4KS/4KSW4KS+4KSv4KS+CuCkpuCkv+CkqArgpKbgpL/gpKjgpYsK4KSm4KS/4KSq4KSVCuCkpuCkv+Ckr+CkvgrgpKbgpL/gpLXgpY3gpK8K4KSm4KS/4KS24KS+CuCkpuClgeCkg+CklgrgpKbgpYHgpIPgpJbgpK/gpYvgpKjgpK8K4KSm4KWB4KSD4KSW4KWH4KS34KWN4KS14KSo4KWB4KSm4KWN4KS14KS/4KSX4KWN4KSo4KSu4KSo4KS+4KSDCuCkpuClgeCklgrgpKbgpYHgpJfgpL4K4KSm4KWB4KSwCuCkpuClgeCksOCkpOCljeCkr+Ckr+CkvgrgpKbgpYHgpLDgpY3gpJjgpJ/gpKjgpL4K4KSm4KWB4KSw4KWN4KSo4KS/4KSX4KWN4KSw4KS5CuCkpuClgeCktuCljeCkruCkqArgpKbgpYHgpLfgpY3gpJ8K4KSm4KWB4KS44KSw4KS+CuCkpuClgeCkuOCksOClhwrgpKbgpYHgpLjgpLDgpYsK4KSm4KWD4KS34KWN4KSf4KS/CuCkpuClhwrgpKbgpYfgpJYK4KSm4KWH4KSW4KSV4KSwCuCkpuClh+CkluCkpOCkvgrgpKbgpYfgpJbgpKTgpYcK4KSm4KWH4KSk4KS+CuCkpuClh+CkpOCkvwrgpKbgpYfgpKjgpL4K4KSm4KWH4KSo4KWHCuCkpuClh+CkueCkvuCkpOCksOCkquCljeCksOCkvuCkquCljeCkpOCkv+CksOCljeCkp+Ckv+CksOCkuOCljeCkpOCkpOCljeCksArgpKbgpYfgpLngpL/gpKjgpYvgpL3gpLjgpY3gpK7gpL/gpK/gpKXgpL4K4KSm4KWH4KS54KWHCuCkpuCliOCkteCkvwrgpKbgpYvgpKjgpYsK4KSm4KWL4KS3CuCkpuCli+CkuOCljeCkpArgpKbgpYzgpKHgpKTgpYcK4KSm4KWN4KS14KSm4KWN4KS1CuCkpuCljeCkteCkvuCksArgpKbgpY3gpLXgpL/gpLfgpKTgpIMK4KSm4KWN4KS14KWH4KS3CuCkp+CkqArgpKfgpKjgpYHgpLDgpY3gpKfgpLDgpIMK4KSn4KSw4KWN4KSu4KS+4KSk4KWN4KSu4KS+CuCkp+CkvuCksOCko+CkvgrgpKfgpL/gpLDgpYcK4KSn4KWI4KSw4KWN4KSvCuCkp+CljeCkr+CkvuCkqArgpKfgpY3gpK/gpL7gpKjgpL7gpKTgpY0K4KSn4KWN4KSw4KWB4KS1CuCkp+CljeCksOClgeCkteCliwrgpKgK4KSo4KSHCuCkqOCkjwrgpKjgpKbgpL/gpK/gpL4K4KSo4KSu4KS44KWN4KSV4KWB4KSw4KWBCuCkqOCkr+CkvgrgpKjgpLDgpIMK4KSo4KSw4KSVCuCkqOCksOCkleCkuOCljeCkr+Clh+CkpgrgpKjgpLDgpL7gpKfgpK7gpL7gpKjgpY0K4KSo4KSw4KWL4KS94KSq4KSw4KS+4KSj4KS/CuCkqOCkteCkvuCkqOCkvwrgpKjgpLfgpY3gpJ8K4KSo4KS54KS/CuCkqOCkvgrgpKjgpL7gpKTgpY3gpK/gpLbgpY3gpKjgpKTgpLjgpY3gpKTgpYEK4KSo4KS+4KS24KSo4KSu4KS+4KSk4KWN4KSu4KSo4KSDCuCkqOCkvuCktuCksOCkueCkv+CkpArgpKjgpL7gpLjgpY3gpKTgpL8K4KSo4KS/4KSa4KWHCuCkqOCkv+CkpOCljeCkrwrgpKjgpL/gpKYK4KSo4KS/4KSv4KSkCuCkqOCkv+Ckr+CkpOCljeCksOCkowrgpKjgpL/gpK/gpKTgpY3gpLDgpL/gpKQK4KSo4KS/4KSv4KSuCuCkqOCkv+Ckr+CkrwrgpKjgpL/gpLDgpL7gpLYK4KSo4KS/4KSw4KS+4KS24KS+CuCkqOCkv+CksOCljeCko+CkrwrgpKjgpL/gpLDgpY3gpK7gpLLgpKTgpY3gpLXgpL7gpKTgpY0K4KSo4KS/4KS14KWD4KSk4KWN4KSk4KS/CuCkqOCkv+CktuCljeCkmuCksOCkpOCkvwrgpKjgpL/gpLbgpY3gpJrgpLLgpK7gpY0K4KSo4KS/4KS24KWN4KSa4KS/4KSkCuCkqOCkv+Ckt+CljeCkleCkvuCkrgrgpKjgpYHgpJXgpLjgpL7gpKgK4KSo4KWHCuCkquCkleCkoeCkqOClhwrgpKrgpJvgpKTgpL7gpKTgpL4K4KSq4KSb4KSk4KS+4KS14KS+CuCkquCkoeCkpOCkvgrgpKrgpKHgpL/gpKTgpL7gpIMK4KSq4KSh4KWLCuCkquCkouCkvuCkhwrgpKrgpKLgpL7gpKTgpL4K4KSq4KSk4KS+CuCkquCksArgpKrgpLDgpK4K4KSq4KSw4KS+CuCkquCksOCkv+Cko+CkvuCkrgrgpKrgpLDgpL/gpLXgpL7gpLAK4KSq4KSw4KWH4KS24KS+4KSoCuCkquCkteCkv+CkpOCljeCksOCkpOCkvgrgpKrgpLbgpY3gpK/gpKTgpL8K4KSq4KS54KSo4KSo4KS+CuCkquCkueCksuClhwrgpKrgpLngpYHgpJrgpL8K4KSq4KS+4KSHCuCkquCkvuCkkwrgpKrgpL7gpJfgpLLgpKrgpKgK4KSq4KS+4KSk4KS+CuCkquCkvuCkqOClhwrgpKrgpL7gpKoK4KSq4KS+4KSq4KS/CuCkquCkvuCkquCliwrgpKrgpL7gpLAK4KSq4KS+4KSw4KWN4KSlCuCkquCkvuCksOCljeCkpeCliwrgpKrgpL7gpLgK4KSq4KS/4KSb4KWHCuCkquClgeCkrwrgpKrgpYHgpLDgpL7gpKjgpL4K4KSq4KWB4KSw4KS+4KSo4KS/CuCkquClgeCksOCkvuCkqOClhwrgpKrgpYHgpLDgpL8K4KSq4KWB4KSw4KWB4KS34KSDCuCkquClgeCksOClgeCkt+CkuOCljeCkrwrgpKrgpYHgpLDgpYHgpLfgpL7gpLDgpY3gpKXgpL8K4KSq4KWI4KSm4KS+CuCkquCliOCkuOCkvgrgpKrgpY3gpLDgpJXgpL7gpLAK4KSq4KWN4KSw4KSV4KS+4KS2CuCkquCljeCksOCkleCkvuCktuCkleCkruCljQrgpKrgpY3gpLDgpJXgpYPgpKTgpL8K4KSq4KWN4KSw4KSX4KSk4KS/CuCkquCljeCksOCko+CkrwrgpKrgpY3gpLDgpKPgpLbgpY3gpK/gpL7gpK7gpL8K4KSq4KWN4KSw4KSj4KS/4KSn4KS+4KSvCuCkquCljeCksOCkpOCkv+CkleCljeCksOCkv+Ckr+CkvgrgpKrgpY3gpLDgpKrgpKbgpY3gpK/gpKTgpYcK4KSq4KWN4KSw4KSt4KS+4KS14KS/4KSkCuCkquCljeCksOCkruCkvuCkpeCkv+CkqOCkvwrgpKrgpY3gpLDgpK/gpL7gpLgK4KSq4KWN4KSw4KS14KS/4KS24KSk4KS/CuCkquCljeCksOCkteClg+CkpOCljeCkpOCkvwrgpKrgpY3gpLDgpLjgpK0K4KSq4KWN4KSw4KS44KS+4KSm4KSv4KWHCuCkquCljeCksOCkvuCkleClg+CkpOCkv+CklQrgpKrgpY3gpLDgpL7gpKrgpY3gpKQK4KSq4KWN4KSw4KS/4KSvCuCkquCljeCksOCkv+Ckr+CknOCkqArgpKrgpY3gpLDgpYfgpK7gpKrgpYHgpLDgpY3gpLXgpJUK4KSr4KSfCuCkq+CksgrgpKvgpLjgpKTgpL4K4KSr4KS/4KSwCuCkq+ClgeCkoQrgpKvgpYfgpLIK4KSr4KWI4KS44KSy4KWHCuCkq+Cli+CkqArgpKzgpJrgpKTgpL4K4KSs4KSa4KWN4KSa4KS+CuCkrOCkmuCljeCkmuClhwrgpKzgpKHgpL4K4KSs4KSiCuCkrOCkouCkpOCkvgrgpKzgpKLgpKTgpL8K4KSs4KSi4KS+4KSk4KS+CuCkrOCkouCkvuCkpOClhwrgpKzgpKTgpL7gpJMK4KSs4KSmCuCkrOCkpuCksgrgpKzgpKbgpLLgpKjgpL4K4KSs4KSm4KSy4KS+4KS1CuCkrOCkp+CkqArgpKzgpKfgpYHgpLDgpL7gpKTgpY3gpK7gpL7gpKTgpY3gpK7gpKjgpLjgpY3gpKTgpLjgpY3gpK8K4KSs4KSoCuCkrOCkqOCkpOCkvgrgpKzgpKjgpL7gpKTgpL4K4KSs4KSo4KS+4KSk4KS/CuCkrOCkqOCkvuCkteCkn+CkvwrgpKzgpKjgpYcK4KSs4KSo4KWLCuCkrOCksOCljeCkrOCkvuCkpgrgpKzgpLIK4KSs4KSy4KSq4KWB4KSw4KWN4KS14KSVCuCkrOCksuCkteCkvuCkqArgpKzgpLLgpLXgpL7gpKjgpY0K4KSs4KSy4KWN4KSsCuCkrOCkuArgpKzgpLngpJXgpKTgpL4K4KSs4KS54KWB4KSkCuCkrOCkvuCkpOClhwrgpKzgpL7gpKTgpYsK4KSs4KS+4KSmCuCkrOCkvuCkp+CkvuCkjwrgpKzgpL7gpLAK4KSs4KS+4KSy4KWN4KSvCuCkrOCkv+CknOCkqOClh+CkuArgpKzgpL/gpJzgpLLgpL8K4KSs4KS/4KSo4KS+CuCkrOClgeCkpuCljeCkp+CkvwrgpKzgpYHgpKbgpY3gpKfgpL/gpIMK4KSs4KWB4KSm4KWN4KSn4KS/4KSo4KS+4KS24KSDCuCkrOClgeCkpuCljeCkp+Ckv+CkqOCkvuCktuCkvuCkpOCljeCkquCljeCksOCko+CktuCljeCkr+CkpOCkvwrgpKzgpYHgpKbgpY3gpKfgpL/gpK7gpL7gpKgK4KSs4KWB4KSm4KWN4KSn4KS/4KSw4KSv4KWB4KSV4KWN4KSk4KS44KWN4KSvCuCkrOClgeCkpuCljeCkp+Clh+CkgwrgpKzgpYHgpKbgpY3gpKfgpY3gpLXgpL4K4KSs4KWB4KSw4KS+CuCkrOClgeCksOCkvuCkhwrgpKzgpYHgpLDgpYcK4KSs4KWH4KS54KSk4KSwCuCkrOCli+CksuClh+Ckl+CkvgrgpKzgpY3gpLDgpLngpY3gpK7gpK/gpL7gpKfgpL7gpK8K4KSs4KWN4KSw4KS+4KS54KWN4KSu4KSjCuCkrOCljeCksOCkvuCkueCljeCkruCko+ClhwrgpKzgpY3gpLDgpYHgpLngpL8K4KSs4KWN4KSw4KWH4KSVCuCkreCkl+CkteCkvuCkqArgpK3gpJzgpKTgpYcK4KSt4KSc4KSoCuCkreCknOCkvuCkr+CkueCkruCljQrgpK3gpJ/gpJXgpL4K4KSt4KSvCuCkreCkr+CkvuCkqOCklQrgpK3gpLAK4KSt4KSw4KSk4KSw4KWN4KS34KStCuCkreCksOCkpOCkvgrgpK3gpLDgpL4K4KSt4KSw4KWL4KS44KS+CuCkreCktQrgpK3gpLXgpKTgpL8K4KSt4KS14KS/4KS34KWN4KSvCuCkreCkvuCkl+ClhwrgpK3gpL7gpJfgpYsK4KSt4KS+4KSw4KSkCuCkreCkvuCksOCkvwrgpK3gpL7gpLUK4KSt4KS+4KS14KSo4KS+CuCkreCkvuCkteCkqOCkvuCkjwrgpK3gpL7gpLXgpKjgpL7gpJMK4KSt4KS+4KS34KS+CuCkreCkvwrgpK3gpL/gpKTgpLAK4KSt4KWB4KSc4KS+CuCkreClgeCkpOClh+Ckt+ClgQrgpK3gpYHgpLIK4KSt4KWH4KSm4KSt4KS+4KS1CuCkreCli+CkleCljeCkpOCkvuCksArgpK3gpYvgpJfgpL4K4KSt4KWL4KSX4KWLCuCkreCli+CknOCkqArgpK3gpY3gpLDgpK4K4KSt4KWN4KSw4KSu4KS/4KSkCuCkreCljeCksOCkvuCkruCkr+CkuOCksOCljeCkteCkreClgeCkpOCkvuCkqOCkvwrgpK7gpJrgpY3gpJrgpL/gpKTgpY3gpKTgpIMK4KSu4KSc4KSs4KWB4KSkCuCkruCknOCkv+CksgrgpK7gpKQK4KSu4KSk4KWN4KSk4KSDCuCkruCkpOCljeCkquCksOCkgwrgpK7gpKTgpY3gpKrgpY3gpLDgpLjgpL7gpKbgpL7gpKTgpY3gpKTgpLDgpL/gpLfgpY3gpK/gpLjgpL8K4KSu4KSm4KSmCuCkruCkpuCljeCkreCkvuCkteCkvuCkr+Cli+CkquCkquCkpuCljeCkr+CkpOClhwrgpK7gpKgK4KSu4KSo4KSDCuCkruCkqOCktuCljeCkmuCkmuCksuCkruCkuOCljeCkpeCkv+CksOCkruCljQrgpK7gpKjgpYHgpLfgpY3gpK8K4KSu4KSo4KWLCuCkruCkrgrgpK7gpK7gpKjgpL4K4KSu4KSw4KSk4KS/CuCkruCksOCkvgrgpK7gpLDgpL8K4KSu4KS54KSk4KWN4KS14KSq4KWB4KSw4KWN4KSjCuCkruCkueCkuOClgeCkuArgpK7gpLngpL7gpKgK4KSu4KS54KS+4KSs4KS+4KS54KWLCuCkruCkvgrgpK7gpL7gpJfgpKTgpL4K4KSu4KS+4KSo4KSk4KS+CuCkruCkvuCkqOCkuOCkv+CklQrgpK7gpL7gpKsK4KSu4KS+4KSu4KSc4KSu4KSo4KS+4KSm4KS/CuCkruCkvuCkruCkqOCkr+CkreCkvuCkleCljQrgpK7gpL7gpK7gpYfgpJUK4KSu4KS+4KSv4KSv4KS+CuCkruCkvuCkr+CkvgrgpK7gpL7gpK/gpL7gpLbgpJXgpY3gpKTgpL8K4KSu4KS+4KSw4KWN4KSXCuCkruCkvuCksOCljeCkl+CkpuCksOCljeCktuCkqArgpK7gpL/gpJ8K4KSu4KS/4KSf4KS+CuCkruCkv+CkoOCkvgrgpK7gpL/gpKTgpY3gpLAK4KSu4KS/4KSo4KSfCuCkruCkv+CksgrgpK7gpL/gpLLgpKTgpL4K4KSu4KS/4KSy4KSk4KS/CuCkruCkv+CksuCkqOClhwrgpK7gpL/gpLLgpLXgpL7gpKTgpL8K4KSu4KS/4KSy4KWH4KSX4KS+CuCkruClgeCkleCljeCkpArgpK7gpYHgpJXgpY3gpKTgpL8K4KSu4KWB4KSd4KS44KWHCuCkruClgeCkneClhwrgpK7gpYHgpLbgpY3gpJXgpL/gpLIK4KSu4KWB4KS24KWN4KSV4KS/4KSy4KWHCuCkruClgeCkueCljeCkr+CkpOCkvwrgpK7gpYPgpKTgpLjgpY3gpK8K4KSu4KWD4KSk4KWN4KSv4KWBCuCkruClg+CkpOCljeCkr+ClgeCksOCljeCkuQrgpK7gpYcK4KSu4KWH4KSw4KS+CuCkruClh+CksOCkvwrgpK7gpYfgpLngpKjgpKQK4KSu4KWICuCkruCliOCksOCkvuCkpeCkqArgpK7gpYngpLIK4KSu4KWL4KSV4KWN4KS3CuCkruCli+CkrOCkvuCkh+CksgrgpK7gpYvgpLngpKjgpK7gpL7gpKTgpY3gpK7gpKjgpIMK4KSu4KWL4KS54KSv4KS44KS/4KS1CuCkruCljOCkleClhwrgpK7gpYzgpJzgpYHgpKYK4KSu4KWM4KSkCuCkr+CkgwrgpK/gpJrgpY3gpJvgpY3gpLDgpYfgpK/gpIMK4KSv4KSc4KWN4KSeCuCkr+CknOCljeCknuCkpOCkquCkuOCkvgrgpK/gpKTgpKTgpYsK4KSv4KSk4KS/4KSo4KS+CuCkr+CkpOCliwrgpK/gpKTgpY3gpLAK4KSv4KSk4KWN4KSw4KS+4KSw4KWB4KSi4KS+4KSo4KS/CuCkr+CkpeCkvgrgpK/gpKXgpYjgpKfgpL7gpLjgpL8K4KSv4KSm4KSX4KWN4KSw4KWHCuCkr+CkpuCkvwrgpK/gpKbgpY3gpLXgpKTgpY0K4KSv4KS24KWLCuCkr+CkuQrgpK/gpLngpL8K4KSv4KS+CuCkr+CkvuCkpgrgpK/gpL7gpKbgpKbgpL7gpLbgpY3gpKQK4KSv4KS+4KSo4KS/CuCkr+ClgeCkleCljeCkpArgpK/gpYHgpJ/gpY3gpK/gpYHgpKwK4KSv4KWB4KS14KS+4KS14KS44KWN4KSl4KS+CuCkr+ClhwrgpK/gpYfgpLfgpL4K4KSv4KWLCuCkr+Cli+CklwrgpK/gpYvgpJfgpJXgpY3gpLfgpYfgpK4K4KSv4KWL4KSX4KS/CuCkr+Cli+Ckl+Clh+CktuCljeCkteCksOCkgwrgpK/gpYvgpJfgpYvgpL3gpLjgpY3gpKTgpL8K4KSv4KWM4KS14KSoCuCksOCkleCljeCkt+CkvgrgpLDgpJbgpKTgpL4K4KSw4KSW4KSo4KS+CuCksOCkluCkqOClhwrgpLDgpJbgpYcK4KSw4KSW4KWLCuCksOCklwrgpLDgpJzgpLjgpIMK4KSw4KSc4KWL4KSX4KWB4KSjCuCksOCknOCli+Ckl+ClgeCko+CkuOCkruClgeCkpuCljeCkreCkteCkgwrgpLDgpJzgpYvgpJfgpYHgpKPgpL8K4KSw4KS44KWN4KS44KS/CuCksOCkuQrgpLDgpLngpKTgpL4K4KSw4KS54KSk4KS/CuCksOCkueCkpOClhwrgpLDgpLngpKjgpL4K4KSw4KS54KS44KWN4KSvCuCksOCkueCkvwrgpLDgpLngpL/gpKQK4KSw4KS54KWHCuCksOCkvuCklgrgpLDgpL7gpJcK4KSw4KS+4KSX4KSm4KWN4KS14KWH4KS34KSr4KSy4KSq4KWN4KSw4KWH4KSq4KWN4KS44KWB4KSDCuCksOCkvuCkl+CkpuCljeCkteClh+Ckt+CkteCkv+CksOCli+Ckp+CkvwrgpLDgpL7gpJzgpLjgpIMK4KSw4KS+4KSc4KS+4KSTCuCksOCkvuCknOCljeCkrwrgpLDgpL7gpKQK4KSw4KS+4KS44KWN4KSk4KWHCuCksOCkv+Ckj+CkleCljeCktuCkqArgpLDgpL/gpJzgpYfgpJXgpY3gpJ8K4KSw4KS/4KSv4KSk4KWHCuCksOCkv+CktuCljeCkpOClhwrgpLDgpL/gpLbgpY3gpKTgpYsK4KSw4KWB4KSV4KS+CuCksOClgeCkqgrgpLDgpYvgpJXgpJXgpLAK4KSw4KWL4KScCuCksOCli+CktuCkqOCkvwrgpLLgpJXgpKHgpL8K4KSy4KSV4KWN4KS34KWN4KSvCuCksuCkl+CkpOCkvgrgpLLgpJfgpKTgpYcK4KSy4KSX4KSo4KS+CuCksuCkl+CkvuCkkwrgpLLgpJfgpL7gpKTgpL4K4KSy4KSX4KS+4KSk4KS+4KSwCuCksuCkl+ClhwrgpLLgpK3gpLjgpY3gpLUK4KSy4KS+4KSTCuCksuCkvuCkqOCkvgrgpLLgpL7gpK0K4KSy4KS+4KSy4KSaCuCksuCkv+CkjwrgpLLgpL/gpK/gpL4K4KSy4KWHCuCksuClh+CkleCksArgpLLgpYfgpJXgpL/gpKgK4KSy4KWH4KSk4KS+CuCksuClh+CkpOCkvwrgpLLgpYfgpKTgpYcK4KSy4KWH4KSo4KS+CuCksuCliwrgpLLgpYvgpJcK4KSy4KWL4KSX4KWHCuCksuCli+CkrQrgpLLgpYvgpK3gpIMK4KSy4KWM4KSf4KS+4KSo4KS+CuCkteCknOCkuQrgpLXgpLDgpY3gpKPgpKgK4KS14KS44KWN4KSk4KWN4KSwCuCkteCkuQrgpLXgpLngpL4K4KS14KS54KS+4KSv4KS54KSu4KWNCuCkteCkueCkvwrgpLXgpL4K4KS14KS+4KSV4KWN4KSv4KWH4KSoCuCkteCkvuCkquCkuArgpLXgpL7gpLLgpL4K4KS14KS+4KSy4KS/CuCkteCkvuCksuClhwrgpLXgpL7gpLjgpKjgpL4K4KS14KS+4KS44KS+4KS44KS/CuCkteCkvuCkuOCljeCkpOCktQrgpLXgpL/gpJrgpLLgpL/gpKQK4KS14KS/4KSc4KSvCuCkteCkv+CknOCkr+CkgwrgpLXgpL/gpKHgpL/gpK/gpYsK4KS14KS/4KSk4KSw4KS+4KSX4KSt4KSv4KSV4KWN4KSw4KWL4KSn4KS+CuCkteCkv+CkpuCljeCkr+CkvuCkteCkv+CkqOCkr+CkuOCkquCkqOClhwrgpLXgpL/gpKjgpLDgpKTgpL4K4KS14KS/4KSo4KS+4KS2CuCkteCkv+CkquCktuCljeCkmuCkv+CkpOCkgwrgpLXgpL/gpKvgpLLgpKTgpL4K4KS14KS/4KSt4KSV4KWN4KSk4KSu4KS/4KS1CuCkteCkv+CksArgpLXgpL/gpLbgpY3gpLXgpLDgpYHgpKoK4KS14KS/4KS34KSv4KWH4KSt4KWB4KSk4KWH4KS34KWBCuCkteCkv+Ckt+Ckr+CliwrgpLXgpL/gpLjgpY3gpK7gpYPgpKTgpL8K4KS14KS/4KS54KS+4KSvCuCkteClg+CkpuCljeCkp+CkvuCkteCkuOCljeCkpeCkvgrgpLXgpYcK4KS14KWH4KSk4KWN4KSk4KS/CuCkteClh+CkpuCkvuCkteCkv+CkqOCkvuCktuCkv+CkqArgpLXgpYfgpKzgpLjgpL7gpIfgpJ8K4KS14KWI4KSw4KS+4KSX4KWN4KSvCuCkteCliOCkuOClhwrgpLXgpY3gpK/gpJXgpY3gpKTgpL8K4KS14KWN4KSv4KS+4KSq4KS+4KSwCuCkteCljeCkr+CkvuCkruCkv+CktuCljeCksOClh+Cko+Clh+CktQrgpLXgpY3gpK/gpL7gpK/gpL7gpK4K4KS14KWN4KSw4KScCuCktuCkleCljeCkpOCkvwrgpLbgpKTgpY3gpLDgpYEK4KS24KSk4KWN4KSw4KWB4KSt4KWB4KSV4KWN4KS34KWN4KS1CuCktuCksOCkowrgpLbgpLDgpL7gpKwK4KS24KSw4KS/4KSwCuCktuCksOCljeCknwrgpLbgpL7gpKQK4KS24KS+4KSk4KS/CuCktuCkvuCkpOCkv+CkgwrgpLbgpL7gpKTgpL/gpK7gpKfgpL/gpJfgpJrgpY3gpJvgpKTgpL8K4KS24KS+4KSk4KS/4KSu4KS+4KSq4KWN4KSo4KWL4KSk4KS/CuCktuCkvuCkruCkv+CksgrgpLbgpL/gpJXgpY3gpLfgpJUK4KS24KS/4KSV4KWN4KS34KS+CuCktuCkv+CkmOCljeCksArgpLbgpL/gpKTgpYvgpLfgpY3gpKPgpLjgpYHgpJbgpKbgpYHgpIPgpJbgpKbgpL7gpIMK4KS24KWB4KSm4KWN4KSnCuCktuClgeCksOClgQrgpLbgpYHgpLDgpYHgpIbgpKQK4KS24KWD4KSj4KWB4KSv4KS+4KSm4KSq4KS/CuCktuClieCkquCkv+CklwrgpLbgpY3gpLDgpKbgpY3gpKfgpL4K4KS24KWN4KSw4KSm4KWN4KSn4KS+4KS14KS+4KSo4KSo4KS44KWB4KSv4KS24KWN4KSaCuCktuCljeCksOCkpuCljeCkp+CkvuCkteCkvuCksuCljeCksuCkreCkpOClhwrgpLbgpY3gpLDgpYfgpK8K4KS24KWN4KSw4KWH4KS34KWN4KSgCuCkuArgpLjgpJXgpKTgpL4K4KS44KSV4KSk4KS/CuCkuOCkleCkvuCksOCkvuCkpOCljeCkruCklQrgpLjgpJXgpY3gpLDgpL/gpK/gpKTgpL4K4KS44KSXCuCkuOCkl+CkuOCljeCkpOClh+Ckt+ClgeCkquCknOCkvuCkr+CkpOClhwrgpLjgpJfgpL7gpKTgpY0K4KS44KSa4KS+4KSy4KS/4KSkCuCkuOCkmuCljeCkmuCkvwrgpLjgpJzgpL7gpK/gpKTgpYcK4KS44KSk4KWB4KSy4KS/4KSkCuCkuOCkpOCli+CktwrgpLjgpKTgpY3gpKTgpY3gpLUK4KS44KSk4KWN4KSk4KWN4KS14KSX4KWB4KSjCuCkuOCkpOCljeCkrwrgpLjgpKbgpYvgpLfgpK7gpKrgpL8K4KS44KSo4KS+4KSk4KSoCuCkuOCkqOCkvuCkpOCkqOCkgwrgpLjgpKjgpL/gpLXgpL/gpLfgpY3gpJ/gpYsK4KS44KSq4KSm4KS+CuCkuOCkq+CksgrgpLjgpKvgpLLgpKTgpL4K4KS44KSsCuCkuOCkrOCkleCkvgrgpLjgpKzgpJXgpYsK4KS44KSs4KSnCuCkuOCkrOCkp+CliwrgpLjgpKzgpK7gpYcK4KS44KSs4KS44KWHCuCkuOCkreCkvuCkteCkqOCkvgrgpLjgpK3gpL8K4KS44KSuCuCkuOCkruCknQrgpLjgpK7gpJ3gpJXgpLAK4KS44KSu4KSd4KSk4KS+CuCkuOCkruCkneCkpOCkvwrgpLjgpK7gpJ3gpKTgpYcK4KS44KSu4KSd4KSm4KS+4KSw4KS/CuCkuOCkruCkneCkqOCkvgrgpLjgpK7gpJ3gpKjgpYcK4KS44KSu4KSm4KSw4KWN4KS24KS/4KSo4KSDCuCkuOCkruCkrwrgpLjgpK7gpLDgpY3gpKrgpKMK4KS44KSu4KS44KWN4KSv4KS+CuCkuOCkruCkvuCkqArgpLjgpK7gpL7gpKrgpY3gpKQK4KS44KSu4KS/4KSm4KWN4KSn4KWL4KS94KSX4KWN4KSo4KS/4KSw4KWN4KSt4KS44KWN4KSu4KS44KS+4KSk4KWN4KSV4KWB4KSw4KWB4KSk4KWHCuCkuOCkruClgeCkpuCljeCksArgpLjgpK7gpYHgpKbgpY3gpLDgpK7gpL7gpKrgpIMK4KS44KSu4KWD4KSm4KWN4KSnCuCkuOCkruClg+CkpuCljeCkp+CkruCljQrgpLjgpK7gpYfgpJ8K4KS44KSu4KWL4KS54KSDCuCkuOCkruCli+CkueCkvuCkpOCljQrgpLjgpK7gpYvgpL3gpLkK4KS44KSv4KSk4KWH4KSm4KWN4KSw4KS/4KSv4KSDCuCkuOCkr+CkrgrgpLjgpK/gpK8K4KS44KSw4KSy4KSk4KS+CuCkuOCksOCljeCkl+CliwrgpLjgpLDgpY3gpLUK4KS44KSw4KWN4KS14KSk4KWN4KSwCuCkuOCksOCljeCkteCkpuClgeCksOCljeCkl+CkvuCko+CkvwrgpLjgpLDgpY3gpLXgpKfgpLDgpY3gpK7gpL7gpKrgpLDgpL/gpKTgpY3gpK/gpJzgpY3gpK8K4KS44KSw4KWN4KS14KSt4KWB4KSk4KS+4KSo4KS+CuCkuOCksOCljeCkteCkreClgeCkpOClh+Ckt+ClgQrgpLjgpLDgpY3gpLXgpLbgpY3gpLDgpYfgpLfgpY3gpKAK4KS44KSw4KWN4KS14KS44KWN4KSvCuCkuOCksOCljeCkteCkvuCko+CkvwrgpLjgpLDgpY3gpLXgpL7gpKjgpY0K4KS44KS44KS+4KSwCuCkuOCkuOCkvuCksOClh+Ckt+ClgQrgpLjgpLjgpL/gpKbgpY3gpKfgpL/gpK7gpL7gpLjgpY3gpKXgpL/gpKTgpL4K4KS44KS44KWN4KSl4KSt4KWN4KSv4KS+4KSk4KWN4KSu4KS+4KSo4KSu4KS+4KSk4KWN4KSu4KSo4KS+CuCkuOCkuOCljeCkquCksOCljeCktuCknOCkvgrgpLjgpLngpJwK4KS44KS54KS+4KSw4KS+CuCkuOCkueCkvwrgpLjgpL4K4KS44KS+4KSk4KWN4KSk4KWN4KS14KS/4KSVCuCkuOCkvuCkpOCljeCkpOCljeCkteCkv+CkleCkvwrgpLjgpL7gpKUK4KS44KS+4KSl4KS/CuCkuOCkvuCkp+CkqOCkvgrgpLjgpL7gpKoK4KS44KS+4KSu4KSo4KWHCuCkuOCkvuCkr+ClhwrgpLjgpL/gpJbgpKjgpL4K4KS44KS/4KSW4KSo4KWHCuCkuOCkv+CkpuCljeCkp+CkvwrgpLjgpL/gpLDgpY3gpKsK4KS44KWB4KSWCuCkuOClgeCkluCkvwrgpLjgpYHgpKbgpLAK4KS44KWB4KSn4KSw4KSk4KWHCuCkuOClgeCkp+CkvuCksArgpLjgpYHgpKjgpKTgpL4K4KS44KWB4KSs4KS5CuCkuOClgeCksOCljeCkr+CkvuCkuOCljeCkpArgpLjgpYHgpLDgpY3gpK/gpYvgpKbgpK8K4KS44KWB4KS44KWN4KSkCuCkuOClgeCkuOCljeCkpOCkvwrgpLjgpYcK4KS44KWJ4KSw4KS/CuCkuOCli+CkmgrgpLjgpYvgpJrgpJXgpLAK4KS44KWL4KSa4KSk4KWHCuCkuOCli+CkmuCliwrgpLjgpYvgpKjgpL4K4KS44KWN4KSV4KWB4KSyCuCkuOCljeCkleCljeCksOClieCksgrgpLjgpY3gpJ/gpL7gpLDgpY3gpJ/gpIXgpKoK4KS44KWN4KSl4KS+4KSoCuCkuOCljeCkpeCkv+CkpArgpLjgpY3gpKXgpL/gpKTgpK7gpY0K4KS44KWN4KSl4KS/4KSk4KS/4KSv4KWLCuCkuOCljeCkpeCkv+CksArgpLjgpY3gpKXgpL/gpLDgpKzgpYHgpKbgpY3gpKfgpL8K4KS44KWN4KSq4KS34KWN4KSfCuCkuOCljeCkrgrgpLjgpY3gpK7gpLDgpKMK4KS44KWN4KSu4KWD4KSk4KS/CuCkuOCljeCkruClg+CkpOCkv+CkreCljeCksOCktuCkvuCkpuCljQrgpLjgpY3gpK7gpYPgpKTgpL/gpLDgpY3gpJzgpY3gpJ7gpL7gpKjgpK7gpKrgpYvgpLngpKgK4KS44KWN4KSu4KWD4KSk4KS/4KS14KS/4KSt4KWN4KSw4KSu4KSDCuCkuOCljeCkr+CkvuCkqOCkv+CktuCljeCkmuCkv+CkpArgpLjgpY3gpLXgpJrgpY3gpJsK4KS44KWN4KS14KSt4KS+4KS1CuCkuOCljeCkteCkrwrgpLjgpY3gpLXgpL7gpK3gpL7gpLXgpL/gpJUK4KS44KWN4KS14KS+4KSw4KWN4KSlCuCkueCkpOCkvuCktgrgpLngpKTgpL8K4KS54KSk4KWL4KSk4KWN4KS44KS+4KS54KS/4KSkCuCkueCkrgrgpLngpK7gpYfgpLbgpL4K4KS54KSwCuCkueCksOCkpOCkvwrgpLngpLLgpY3gpJXgpL4K4KS54KS14KS+CuCkueCkuOCljeCkpOCkv+CkqOCkvwrgpLngpL7gpKXgpL8K4KS54KS+4KSwCuCkueCkvuCksOCkpOClhwrgpLngpL8K4KS54KS/4KSkCuCkueCkv+CkuOCkvgrgpLngpYEK4KS54KWB4KSGCuCkueClgeCkjwrgpLngpYPgpKbgpK8K4KS54KWD4KSm4KS/CuCkueClg+CkpuCljeCkpuClh+CktuClh+CkveCksOCljeCknOClgeCkqArgpLngpYcK4KS54KWICuCkueCliwrgpLngpYvgpJXgpLAK4KS54KWL4KSX4KS+CuCkueCli+CkpOCkvgrgpLngpYvgpKTgpL8K4KS54KWL4KSk4KWHCuCkueCli+CkqOCkvgrgpLngpYvgpKjgpYcK4KS54KWN4KSv4KSV4KSw4KWN4KSu4KSj4KSDCuCkueCljeCkr+CkquCkvwrgpLngpY3gpK/gpYfgpLfgpL4AAAA=";
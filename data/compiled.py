@@ -0,0 +1,307 @@
+# data/compiled.py
+"""
+Compiled, memory-mapped corpus format for the SECTION modules.
+
+Importing the SECTION_X modules means compiling and executing a Python file full
+of Devanagari string literals for every section. This module stores the same data
+in one binary file which the loader opens with `mmap`; nothing is decoded until a
+record is actually read, so start-up time and resident memory stay close to flat
+as the corpus grows.
+
+File layout (all integers little-endian):
+
+  header    magic, version, table counts, sha256 of the SECTION sources and the
+            byte offset of every table below
+  modules   one fixed-width row per SECTION module: name, attribute name and the
+            range of groups it owns
+  groups    one fixed-width row per problem title: title and the range of
+            records it owns
+  records   one fixed-width row per verse: id, chapter and verse as integers,
+            then an (offset, length) reference into the string heap for every
+            field; the heap reference of an int field is only used when the
+            source value was not an integer (e.g. a verse range such as "13-14")
+  heap      de-duplicated UTF-8 strings
+
+Build the file with:
+
+    python -m data.compiled
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b"GITACORP"
+VERSION = 1
+
+INT_FIELDS = ("id", "chapter", "verse")
+TEXT_FIELDS = ("sanskrit", "hindi_arth", "saral_samajh", "udaharan")
+RECORD_FIELDS = INT_FIELDS + TEXT_FIELDS
+
+# Sentinels stored in an int column when the source verse has no such key, or
+# when its value is not an integer and lives in the heap instead.
+MISSING = -(2 ** 31)
+AS_TEXT = MISSING + 1
+
+_HEADER = struct.Struct("<8sHHIII32sIIIII")
+_MODULE = struct.Struct("<6I")
+_GROUP = struct.Struct("<4I")
+_RECORD = struct.Struct("<%di%dI" % (len(INT_FIELDS), 2 * len(RECORD_FIELDS)))
+
+
+class CorpusFormatError(ValueError):
+    """Raised when a compiled corpus file is truncated or has the wrong format."""
+
+
+class _StringHeap:
+    """Collects strings for the heap, storing each distinct value only once."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._size = 0
+        self._seen: Dict[str, Tuple[int, int]] = {}
+
+    def add(self, text: str) -> Tuple[int, int]:
+        ref = self._seen.get(text)
+        if ref is None:
+            raw = text.encode("utf-8")
+            ref = (self._size, len(raw))
+            self._chunks.append(raw)
+            self._size += len(raw)
+            self._seen[text] = ref
+        return ref
+
+    def to_bytes(self) -> bytes:
+        return b"".join(self._chunks)
+
+
+def _pack_int(value: Any) -> int:
+    if value is None or value == "":
+        return MISSING
+    if isinstance(value, int) and not isinstance(value, bool) and AS_TEXT < value < 2 ** 31:
+        return value
+    return AS_TEXT
+
+
+def compile_corpus(sections: List[Tuple[str, str, Dict[str, List[Dict[str, Any]]]]],
+                   path: str, source_hash: bytes = b"") -> int:
+    """
+    Write `sections` to `path` in the compiled corpus format.
+
+    `sections` is a list of (module_basename, attr_name, section_dict) tuples in
+    load order, where section_dict has the usual `{title: [verse, ...]}` shape.
+    `source_hash` (up to 32 bytes) is stored in the header so the loader can tell
+    whether the file is still in sync with the SECTION sources.
+
+    The file is written to a temporary name first and moved into place, so a
+    reader never sees a half-written corpus. Returns the number of records.
+    """
+    heap = _StringHeap()
+    modules = bytearray()
+    groups = bytearray()
+    records = bytearray()
+    n_groups = 0
+    n_records = 0
+
+    for mod_basename, attr_name, section in sections:
+        first_group = n_groups
+        for title, verses in section.items():
+            first_record = n_records
+            for verse in verses:
+                ints = [_pack_int(verse.get(field)) for field in INT_FIELDS]
+                refs: List[int] = []
+                for k, field in enumerate(RECORD_FIELDS):
+                    if k < len(INT_FIELDS) and ints[k] != AS_TEXT:
+                        refs.extend((0, 0))
+                    else:
+                        refs.extend(heap.add(str(verse.get(field, "") or "")))
+                records += _RECORD.pack(*ints, *refs)
+                n_records += 1
+            groups += _GROUP.pack(*heap.add(title), first_record, n_records - first_record)
+            n_groups += 1
+        modules += _MODULE.pack(*heap.add(mod_basename), *heap.add(attr_name),
+                                first_group, n_groups - first_group)
+
+    heap_bytes = heap.to_bytes()
+    modules_off = _HEADER.size
+    groups_off = modules_off + len(modules)
+    records_off = groups_off + len(groups)
+    heap_off = records_off + len(records)
+    header = _HEADER.pack(
+        MAGIC, VERSION, 0, len(sections), n_groups, n_records,
+        source_hash[:32].ljust(32, b"\0"),
+        modules_off, groups_off, records_off, heap_off, len(heap_bytes),
+    )
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(modules)
+        f.write(groups)
+        f.write(records)
+        f.write(heap_bytes)
+    os.replace(tmp_path, path)
+    return n_records
+
+
+class CompiledShloka(Mapping):
+    """Read-only, dict-like view of one verse; fields are decoded on access."""
+
+    __slots__ = ("_corpus", "_index")
+
+    def __init__(self, corpus: "CorpusFile", index: int):
+        self._corpus = corpus
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._corpus._field(self._index, key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (f for f in RECORD_FIELDS if self._corpus._field(self._index, f) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"CompiledShloka({dict(self)!r})"
+
+
+class RecordRange(Sequence):
+    """Lazy list of the verses filed under one problem title."""
+
+    __slots__ = ("_corpus", "_start", "_count")
+
+    def __init__(self, corpus: "CorpusFile", start: int, count: int):
+        self._corpus = corpus
+        self._start = start
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("record index out of range")
+        return CompiledShloka(self._corpus, self._start + i)
+
+    def __repr__(self) -> str:
+        return f"RecordRange(start={self._start}, count={self._count})"
+
+
+class CorpusFile:
+    """
+    A compiled corpus opened with `mmap`.
+
+    `sections()` returns one `{title: RecordRange}` dict per SECTION module, the
+    same shape the SECTION modules themselves export, so existing consumers can
+    iterate it unchanged. Only the few titles are decoded up front; verse text is
+    read from the mapped file when a field is looked up.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            self._file.close()
+            raise CorpusFormatError(f"'{path}' is empty") from e
+
+        if len(self._buf) < _HEADER.size:
+            self.close()
+            raise CorpusFormatError(f"'{path}' is too short to be a compiled corpus")
+        (magic, version, _reserved, self.n_modules, self.n_groups, self.n_records,
+         self.source_hash, self._modules_off, self._groups_off, self._records_off,
+         self._heap_off, heap_len) = _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise CorpusFormatError(f"'{path}' is not a version {VERSION} compiled corpus")
+        if self._heap_off + heap_len > len(self._buf):
+            self.close()
+            raise CorpusFormatError(f"'{path}' is truncated")
+
+    def close(self) -> None:
+        buf = getattr(self, "_buf", None)
+        if buf is not None:
+            buf.close()
+            self._buf = None
+        self._file.close()
+
+    def __enter__(self) -> "CorpusFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.n_records
+
+    def _string(self, off: int, length: int) -> str:
+        start = self._heap_off + off
+        return self._buf[start:start + length].decode("utf-8")
+
+    def _field(self, index: int, field: str) -> Optional[Any]:
+        row = _RECORD.unpack_from(self._buf, self._records_off + index * _RECORD.size)
+        try:
+            k = RECORD_FIELDS.index(field)
+        except ValueError:
+            return None
+        if k < len(INT_FIELDS):
+            value = row[k]
+            if value == MISSING:
+                return None
+            if value != AS_TEXT:
+                return value
+        ref = len(INT_FIELDS) + 2 * k
+        return self._string(row[ref], row[ref + 1])
+
+    def record(self, index: int) -> CompiledShloka:
+        if not 0 <= index < self.n_records:
+            raise IndexError("record index out of range")
+        return CompiledShloka(self, index)
+
+    def _group(self, index: int) -> Tuple[str, RecordRange]:
+        t_off, t_len, first, count = _GROUP.unpack_from(self._buf, self._groups_off + index * _GROUP.size)
+        return self._string(t_off, t_len), RecordRange(self, first, count)
+
+    def modules(self) -> List[Tuple[str, str, Dict[str, RecordRange]]]:
+        """Return (module_basename, attr_name, section) for every compiled module."""
+        result = []
+        for m in range(self.n_modules):
+            n_off, n_len, a_off, a_len, first, count = _MODULE.unpack_from(
+                self._buf, self._modules_off + m * _MODULE.size)
+            section = dict(self._group(g) for g in range(first, first + count))
+            result.append((self._string(n_off, n_len), self._string(a_off, a_len), section))
+        return result
+
+    def sections(self) -> Dict[str, Dict[str, RecordRange]]:
+        """Return `{module_basename: {title: RecordRange}}` in compiled order."""
+        return {name: section for name, _attr, section in self.modules()}
+
+
+def main() -> None:
+    try:
+        from data import shlokas
+    except ModuleNotFoundError:
+        import shlokas
+
+    loaded, failed = shlokas.load_from_sources(warn_only=True)
+    attrs = shlokas.section_map()
+    sections = [(name, attrs[name], loaded[name]) for name in loaded]
+    n = compile_corpus(sections, shlokas.CORPUS_PATH, shlokas.sources_hash())
+    print(f"✔ Compiled {n} shlokas from {len(sections)} sections:", shlokas.CORPUS_PATH)
+    if failed:
+        print("⚠️ Not compiled (could not be loaded):", failed)
+
+
+if __name__ == "__main__":
+    main()
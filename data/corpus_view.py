@@ -0,0 +1,93 @@
+# data/corpus_view.py
+"""
+The one flattened view of the SECTION data shared by every consumer.
+
+`flatten()` walks the real `{title: [verse, ...]}` shape of the sections and
+fills a `ShlokaStore`. `get_shlokas()` does that once per process for the loaded
+corpus and memoizes the result on `data.shlokas.content_hash()`, so the Kivy
+`MainScreen`, `export_to_txt` and the HTML generator all see the same records
+without flattening again. `iter_shlokas()` builds the same view one section at
+a time, for callers (the Kivy app) that want to show records while the rest of
+the corpus is still loading.
+"""
+
+from typing import Any, Dict, Iterable, Iterator
+
+try:
+    from data import shlokas
+    from data.records import ShlokaStore
+except ModuleNotFoundError:
+    import shlokas
+    from records import ShlokaStore
+
+REFERENCE_FORMAT = "अध्याय {chapter} • श्लोक {verse}"
+
+# Shown instead of an empty text field.
+PLACEHOLDER = "—"
+
+_VIEWS: Dict[bytes, ShlokaStore] = {}
+
+
+def format_reference(chapter: Any, verse: Any) -> str:
+    return REFERENCE_FORMAT.format(chapter=chapter, verse=verse)
+
+
+def flatten_section(flat: ShlokaStore, sec: Any) -> None:
+    """Append the records of one `{title: [verse, ...]}` section to `flat`."""
+    if not isinstance(sec, dict):
+        return
+    for title, shlok_list in sec.items():
+        for s in shlok_list:
+            chapter = s.get("chapter", "")
+            verse = s.get("verse", "")
+            flat.append(
+                section=title,
+                problem=title,
+                source_id=s.get("id", ""),
+                chapter=chapter,
+                verse=verse,
+                reference=format_reference(chapter, verse),
+                text=s.get("sanskrit", "") or PLACEHOLDER,
+                meaning=s.get("hindi_arth", "") or PLACEHOLDER,
+                explanation=s.get("saral_samajh", "") or PLACEHOLDER,
+                example=s.get("udaharan", "") or PLACEHOLDER,
+            )
+
+
+def flatten(all_sections: Iterable[Any]) -> ShlokaStore:
+    """Flatten `{title: [verse, ...]}` sections into a ShlokaStore, in order."""
+    flat = ShlokaStore()
+    for sec in all_sections:
+        flatten_section(flat, sec)
+    return flat
+
+
+def get_shlokas() -> ShlokaStore:
+    """The flattened corpus, built on first call and reused while the data is unchanged."""
+    key = shlokas.content_hash()
+    view = _VIEWS.get(key)
+    if view is None:
+        _VIEWS.clear()
+        view = _VIEWS[key] = flatten(shlokas.ALL_SHLOKAS)
+    return view
+
+
+def iter_shlokas() -> Iterator[ShlokaStore]:
+    """
+    Build `get_shlokas()` one section at a time, yielding the partly filled
+    store after each section (only once, complete, if it is already built).
+    Each SECTION file is loaded when it is reached; once the generator is
+    exhausted, `get_shlokas()` returns the finished store.
+    """
+    key = shlokas.content_hash()
+    view = _VIEWS.get(key)
+    if view is not None:
+        yield view
+        return
+    flat = ShlokaStore()
+    for sec in shlokas.ALL_SHLOKAS:
+        flatten_section(flat, sec)
+        yield flat
+    if key not in _VIEWS:
+        _VIEWS.clear()
+        _VIEWS[key] = flat
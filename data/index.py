@@ -0,0 +1,126 @@
+# data/index.py
+"""
+Lookup indexes over the flattened corpus.
+
+`ShlokaIndex` is built once from a `ShlokaStore` and answers, in O(1):
+
+  - which rows hold chapter/verse "2.47" (`by_ref`, `lookup_ref`)
+  - which row has a given SECTION `id` (`by_source_id`)
+  - which problem titles cite a verse (`problems_for`)
+
+Verse ranges such as "13-14" are indexed under the range itself and under every
+verse in it, so asking for 2.13 also finds the record filed as "2.13-14".
+
+`get_index()` returns the index for the loaded corpus, memoized on the same
+content hash as `get_shlokas()`.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from data import shlokas
+    from data.corpus_view import get_shlokas
+    from data.records import Shloka, ShlokaStore
+except ModuleNotFoundError:
+    import shlokas
+    from corpus_view import get_shlokas
+    from records import Shloka, ShlokaStore
+
+Ref = Tuple[str, str]
+
+_REF_RE = re.compile(r"^\s*(\d+)\s*[.:/ ]\s*(\d+(?:\s*-\s*\d+)?)\s*$")
+_RANGE_RE = re.compile(r"^(\d+)\s*-\s*(\d+)$")
+
+# Verse ranges longer than this are indexed as a whole only.
+MAX_RANGE = 100
+
+_INDEXES: Dict[bytes, "ShlokaIndex"] = {}
+
+
+def ref_key(chapter: Any, verse: Any) -> Ref:
+    """Normalized (chapter, verse) key: both as stripped strings, '13 - 14' -> '13-14'."""
+    return str(chapter).strip(), re.sub(r"\s+", "", str(verse))
+
+
+def parse_ref(text: str) -> Optional[Ref]:
+    """Parse '2.47', '2:47' or '2 47' into a ref key, or None."""
+    m = _REF_RE.match(text)
+    if m is None:
+        return None
+    return ref_key(m.group(1), m.group(2))
+
+
+def expand_ref(key: Ref) -> List[Ref]:
+    """The key itself, followed by every single verse of a verse range."""
+    chapter, verse = key
+    keys = [key]
+    m = _RANGE_RE.match(verse)
+    if m is not None:
+        lo, hi = int(m.group(1)), int(m.group(2))
+        if lo <= hi and hi - lo <= MAX_RANGE:
+            keys.extend((chapter, str(v)) for v in range(lo, hi + 1))
+    return keys
+
+
+class ShlokaIndex:
+    """Primary (chapter, verse) / id indexes and verse -> problems reverse index."""
+
+    def __init__(self, store: ShlokaStore):
+        self.store = store
+        self._by_ref: Dict[Ref, List[int]] = {}
+        self._by_source_id: Dict[Any, int] = {}
+        self._problems: Dict[Ref, List[str]] = {}
+
+        chapters = store.column("chapter")
+        verses = store.column("verse")
+        source_ids = store.column("source_id")
+        problems = store.column("problem")
+        for row_id in range(len(store)):
+            key = ref_key(chapters[row_id], verses[row_id])
+            problem = problems[row_id]
+            for k in expand_ref(key):
+                self._by_ref.setdefault(k, []).append(row_id)
+                cited = self._problems.setdefault(k, [])
+                if problem not in cited:
+                    cited.append(problem)
+            if source_ids[row_id] != "":
+                self._by_source_id.setdefault(source_ids[row_id], row_id)
+
+    def by_ref(self, chapter: Any, verse: Any) -> List[Shloka]:
+        """All records for a chapter/verse, in corpus order (empty if none)."""
+        return [self.store[i] for i in self._by_ref.get(ref_key(chapter, verse), ())]
+
+    def lookup_ref(self, text: str) -> List[Shloka]:
+        """Like by_ref, for a typed reference such as '2.47'."""
+        key = parse_ref(text)
+        return self.by_ref(*key) if key is not None else []
+
+    def by_source_id(self, source_id: Any) -> Optional[Shloka]:
+        """The record with this SECTION `id`, or None."""
+        row_id = self._by_source_id.get(source_id)
+        return self.store[row_id] if row_id is not None else None
+
+    def by_row_id(self, row_id: int) -> Shloka:
+        return self.store[row_id]
+
+    def problems_for(self, chapter: Any, verse: Any) -> List[str]:
+        """Every problem title that cites this verse, in corpus order."""
+        return list(self._problems.get(ref_key(chapter, verse), ()))
+
+    def refs(self) -> List[Ref]:
+        """All indexed (chapter, verse) keys."""
+        return list(self._by_ref)
+
+    def __repr__(self) -> str:
+        return f"ShlokaIndex({len(self.store)} shlokas, {len(self._by_ref)} refs)"
+
+
+def get_index() -> ShlokaIndex:
+    """The index over `get_shlokas()`, built on first call and reused while the data is unchanged."""
+    key = shlokas.content_hash()
+    index = _INDEXES.get(key)
+    if index is None:
+        _INDEXES.clear()
+        index = _INDEXES[key] = ShlokaIndex(get_shlokas())
+    return index
@@ -0,0 +1,225 @@
+# data/manifest.py
+"""
+Manifest of the SECTION source files and a parse cache keyed on their content.
+
+`manifest.json` (next to this file) lists every `SECTION_*.py` file in load
+order with its sha256, the name of the `section_*` variable it defines and how
+many titles / verses it holds. A file whose `section_*` value is not a plain
+literal is listed with `"import": true` (and no counts): the loader imports
+that module instead, and records it as failed if the import fails too. The loader reads it instead of a hardcoded
+SECTION_MAP, so it knows the attribute to use up front and never has to probe
+import paths or scan `dir(module)`.
+
+Section data is read without importing the module: the `section_*` assignment is
+parsed with `ast` and evaluated with `ast.literal_eval`. The result is pickled
+into `.cache/<sha256>.pickle`, so a file is only parsed again after its content
+changes.
+
+Regenerate the manifest with:
+
+    python -m data.manifest
+"""
+
+import ast
+import hashlib
+import json
+import os
+import pickle
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(DATA_DIR, "manifest.json")
+CACHE_DIR = os.path.join(DATA_DIR, ".cache")
+MANIFEST_VERSION = 1
+
+SECTION_FILE_RE = re.compile(r"^SECTION_(\d+)(?:_(\w+))?\.py$")
+SECTION_ATTR_RE = re.compile(rb"^(section_\w+)\s*=", re.M)
+
+
+class SectionParseError(ValueError):
+    """Raised when a SECTION file has no literal `section_*` assignment."""
+
+
+def section_sort_key(filename: str) -> Tuple[int, str]:
+    """Natural load order: SECTION_2 before SECTION_10, SECTION_13 before SECTION_13_B."""
+    m = SECTION_FILE_RE.match(filename)
+    if m is None:
+        return (2 ** 31, filename)
+    return (int(m.group(1)), m.group(2) or "")
+
+
+def discover_section_files(data_dir: str = DATA_DIR) -> List[str]:
+    """File names of the SECTION sources in `data_dir`, in load order."""
+    return sorted((f for f in os.listdir(data_dir) if SECTION_FILE_RE.match(f)),
+                  key=section_sort_key)
+
+
+def file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def parse_section_source(source: bytes, expected_attr: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+    """
+    Return (attr_name, section_dict) from the source of a SECTION module.
+
+    Uses `expected_attr` when the module assigns it, otherwise the first
+    top-level assignment to a name starting with 'section_'.
+    """
+    tree = ast.parse(source)
+    found: List[Tuple[str, ast.expr]] = []
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id.startswith("section_"):
+                    found.append((target.id, node.value))
+    if not found:
+        raise SectionParseError("no top-level 'section_*' assignment")
+    for name, value in found:
+        if name == expected_attr:
+            break
+    else:
+        name, value = found[0]
+    try:
+        return name, ast.literal_eval(value)
+    except ValueError as e:
+        raise SectionParseError(f"'{name}' is not a literal: {e}") from e
+
+
+def guess_section_attr(source: bytes, filename: str) -> str:
+    """The `section_*` name a module assigns, found without parsing it (for modules to import)."""
+    m = SECTION_ATTR_RE.search(source)
+    if m is not None:
+        return m.group(1).decode("ascii")
+    return "section_" + filename[len("SECTION_"):-len(".py")].lower()
+
+
+def _cache_path(digest: str) -> str:
+    return os.path.join(CACHE_DIR, digest + ".pickle")
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def load_section(filename: str, expected_attr: Optional[str] = None,
+                 data_dir: str = DATA_DIR) -> Tuple[str, str, Dict[str, Any]]:
+    """
+    Return (sha256, attr_name, section_dict) for one SECTION file.
+
+    Served from the parse cache when a pickle for the file's current hash exists;
+    otherwise the file is parsed and the result cached. Cache write failures
+    (e.g. a read-only install) are ignored.
+    """
+    with open(os.path.join(data_dir, filename), "rb") as f:
+        source = f.read()
+    digest = hashlib.sha256(source).hexdigest()
+
+    try:
+        with open(_cache_path(digest), "rb") as f:
+            attr, section = pickle.load(f)
+        if expected_attr is None or attr == expected_attr:
+            return digest, attr, section
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+        pass
+
+    attr, section = parse_section_source(source, expected_attr)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _write_atomic(_cache_path(digest), pickle.dumps((attr, section), pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+    return digest, attr, section
+
+
+def build_manifest(data_dir: str = DATA_DIR, previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Scan `data_dir` and return a fresh manifest.
+
+    Entries of `previous` whose hash still matches are reused as they are, so
+    only new or changed files are parsed.
+    """
+    known = {e["file"]: e for e in (previous or {}).get("sections", [])}
+    entries = []
+    for filename in discover_section_files(data_dir):
+        old = known.get(filename)
+        if old is not None and old.get("sha256") == file_hash(os.path.join(data_dir, filename)):
+            entries.append(old)
+            continue
+        try:
+            digest, attr, section = load_section(filename, data_dir=data_dir)
+        except (SyntaxError, SectionParseError) as e:
+            print(f"⚠️ Warning: {filename} is not a plain literal, it will be imported — {e}")
+            with open(os.path.join(data_dir, filename), "rb") as f:
+                source = f.read()
+            entries.append({
+                "module": filename[:-3],
+                "file": filename,
+                "sha256": hashlib.sha256(source).hexdigest(),
+                "attr": guess_section_attr(source, filename),
+                "titles": None,
+                "records": None,
+                "import": True,
+            })
+            continue
+        entries.append({
+            "module": filename[:-3],
+            "file": filename,
+            "sha256": digest,
+            "attr": attr,
+            "titles": len(section),
+            "records": sum(len(v) for v in section.values()),
+        })
+    return {"version": MANIFEST_VERSION, "sections": entries}
+
+
+def write_manifest(manifest: Dict[str, Any], path: str = MANIFEST_PATH) -> None:
+    text = json.dumps(manifest, ensure_ascii=False, indent=2) + "\n"
+    _write_atomic(path, text.encode("utf-8"))
+
+
+def load_manifest(path: str = MANIFEST_PATH, data_dir: str = DATA_DIR) -> Dict[str, Any]:
+    """
+    Read the manifest, rebuilding it when it is missing, from another version or
+    out of step with the SECTION files on disk (a file was added or removed).
+
+    Content changes to an existing file are picked up by `load_section`, which
+    always keys its cache on the current hash.
+    """
+    manifest: Optional[Dict[str, Any]] = None
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    if (manifest is not None and manifest.get("version") == MANIFEST_VERSION
+            and [e["file"] for e in manifest["sections"]] == discover_section_files(data_dir)):
+        return manifest
+
+    manifest = build_manifest(data_dir, previous=manifest)
+    try:
+        write_manifest(manifest, path)
+    except OSError:
+        pass
+    return manifest
+
+
+def main() -> None:
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = None
+    manifest = build_manifest(previous=previous)
+    write_manifest(manifest)
+    total = sum(e["records"] or 0 for e in manifest["sections"])
+    print(f"✔ Manifest written: {MANIFEST_PATH} ({len(manifest['sections'])} sections, {total} shlokas)")
+
+
+if __name__ == "__main__":
+    main()
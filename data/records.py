@@ -0,0 +1,143 @@
+# data/records.py
+"""
+Compact, column-oriented storage for flattened shlokas.
+
+Flattening used to build one dict per verse, each repeating the same keys. A
+`ShlokaStore` instead keeps one list per field and identifies a verse by its
+integer row id. `store[i]` returns a `Shloka`, a two-slot view onto row `i` that
+behaves like a read-only dict (`s["text"]`, `s.get("meaning", "")`, `dict(s)`),
+so code written against the old dicts keeps working.
+
+String fields are interned in the store's `StringTable` (see data/strings.py):
+their columns hold integer handles, and each distinct title, reference or text
+is kept only once however many records share it.
+"""
+
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    from data.strings import StringTable
+except ModuleNotFoundError:
+    from strings import StringTable
+
+# Column order of a ShlokaStore. `source_id` is the `id` from the SECTION data,
+# `explanation` is its `saral_samajh` text.
+FIELDS = (
+    "section", "problem", "source_id", "chapter", "verse", "reference",
+    "text", "meaning", "explanation", "example",
+)
+
+# Columns stored as handles into the store's StringTable.
+STRING_FIELDS = ("section", "problem", "reference", "text", "meaning", "explanation", "example")
+
+# Older key names still accepted by Shloka lookups.
+ALIASES = {"sloka": "reference"}
+
+
+class Shloka(Mapping):
+    """Read-only, dict-like view of one row of a ShlokaStore."""
+
+    __slots__ = ("_store", "id")
+
+    def __init__(self, store: "ShlokaStore", row_id: int):
+        self._store = store
+        self.id = row_id
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "id":
+            return self.id
+        return self._store.value(self.id, ALIASES.get(key, key))
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self) -> Iterator[str]:
+        yield "id"
+        yield from FIELDS
+
+    def __len__(self) -> int:
+        return len(FIELDS) + 1
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Shloka):
+            return self._store is other._store and self.id == other.id
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self.id))
+
+    def __repr__(self) -> str:
+        return f"Shloka({self.id}, {self['reference']!r}, {self['problem']!r})"
+
+
+class ShlokaStore(Sequence):
+    """
+    One column per field in FIELDS; row ids are column positions.
+
+    STRING_FIELDS columns are `array('I')` of StringTable handles, the others
+    plain lists. Pass `strings` to share one table between several stores.
+    """
+
+    def __init__(self, strings: Optional[StringTable] = None):
+        self.strings = strings if strings is not None else StringTable()
+        self._columns: Dict[str, Any] = {
+            f: array("I") if f in STRING_FIELDS else [] for f in FIELDS
+        }
+
+    def append(self, **values: Any) -> int:
+        """Add a row (missing fields default to "") and return its id."""
+        unknown = set(values) - set(FIELDS)
+        if unknown:
+            raise KeyError(f"unknown shloka fields: {sorted(unknown)}")
+        for field, column in self._columns.items():
+            value = values.get(field, "")
+            if field in STRING_FIELDS:
+                value = self.strings.intern(str(value))
+            column.append(value)
+        return len(self) - 1
+
+    def value(self, row_id: int, field: str) -> Any:
+        """Decoded value of one field of one row."""
+        column = self._columns.get(field)
+        if column is None:
+            raise KeyError(field)
+        if field in STRING_FIELDS:
+            return self.strings[column[row_id]]
+        return column[row_id]
+
+    def handles(self, field: str) -> array:
+        """The StringTable handles of a string column (do not modify)."""
+        field = ALIASES.get(field, field)
+        if field not in STRING_FIELDS:
+            raise KeyError(f"'{field}' is not a string column")
+        return self._columns[field]
+
+    def column(self, field: str) -> List[Any]:
+        """The decoded values of one column, in row order."""
+        field = ALIASES.get(field, field)
+        if field in STRING_FIELDS:
+            strings = self.strings.strings()
+            return [strings[h] for h in self._columns[field]]
+        return self._columns[field]
+
+    def __len__(self) -> int:
+        return len(self._columns[FIELDS[0]])
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [Shloka(self, j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("shloka id out of range")
+        return Shloka(self, i)
+
+    def __repr__(self) -> str:
+        return f"ShlokaStore({len(self)} shlokas)"
@@ -17,12 +17,39 @@ in environments where some SECTION modules are missing).
 
 If you want stricter behaviour (fail fast when a section is missing), replace the
 `warn_only=True` to `False` in the loader call below.
+
+Compiled corpus: when `shlokas.corpus` (built with `python -m data.compiled`)
+exists next to this file and was compiled from the current SECTION sources, the
+sections are served from that memory-mapped file instead of importing the 16
+SECTION modules. A missing or stale corpus silently falls back to the imports.
+
+Discovery: the SECTION files, their `section_*` attribute names and record
+counts come from the generated `manifest.json` (see data/manifest.py) rather
+than a hardcoded map. Section data is read through a parse cache keyed on each
+file's sha256, so unchanged files are never parsed again; importing the module
+(`try_import_section`) is only the fallback for files that are not plain literals.
+
+Lazy loading: importing this module does no work. `ALL_SHLOKAS` is a sequence
+that loads each section the first time it is touched, and `LOADED_SECTIONS`,
+`FAILED_SECTIONS` and `CORPUS` are computed on first access through the module
+`__getattr__`. Call `preload()` to warm everything up eagerly.
 """
 
 from importlib import import_module
-import sys
-import types
-from typing import Dict, Any, List, Tuple
+import hashlib
+import os
+from collections.abc import Sequence
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    from data.compiled import CorpusFile, CorpusFormatError
+    from data.manifest import SectionParseError, file_hash, load_manifest, load_section
+except ModuleNotFoundError:
+    from compiled import CorpusFile, CorpusFormatError
+    from manifest import SectionParseError, file_hash, load_manifest, load_section
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_PATH = os.path.join(DATA_DIR, "shlokas.corpus")
 
 
 def try_import_section(module_basename: str, expected_attr: str, warn_only: bool = True) -> Tuple[str, Any]:
@@ -79,47 +106,208 @@ def try_import_section(module_basename: str, expected_attr: str, warn_only: bool
     return None, None
 
 
-# Mapping of SECTION module basenames to expected attribute names
-SECTION_MAP = {
-    'SECTION_1': 'section_1',
-    'SECTION_2': 'section_2',
-    'SECTION_3': 'section_3',
-    'SECTION_4': 'section_4',
-    'SECTION_5': 'section_5',
-    'SECTION_6': 'section_6',
-    'SECTION_7': 'section_7',
-    'SECTION_8': 'section_8',
-    'SECTION_9': 'section_9',
-    'SECTION_10': 'section_10',
-    'SECTION_11': 'section_11',
-    'SECTION_12': 'section_12',
-    'SECTION_13': 'section_13',
-    'SECTION_13_B': 'section_13_peace',
-    'SECTION_15': 'section_15',
-    'SECTION_16': 'section_16',
-}
-
-LOADED_SECTIONS: Dict[str, Any] = {}
-FAILED_SECTIONS: List[str] = []
-
-for mod_basename, attr_name in SECTION_MAP.items():
-    modpath, value = try_import_section(mod_basename, attr_name, warn_only=True)
-    if modpath is None or value is None:
-        FAILED_SECTIONS.append(mod_basename)
-    else:
-        LOADED_SECTIONS[mod_basename] = value
+def section_entries() -> List[Dict[str, Any]]:
+    """Manifest entries for every SECTION file, in load order (see data/manifest.py)."""
+    return load_manifest()["sections"]
+
+
+def section_map() -> Dict[str, str]:
+    """Mapping of SECTION module basenames to their `section_*` attribute names."""
+    return {e["module"]: e["attr"] for e in section_entries()}
+
+
+def sources_hash() -> bytes:
+    """sha256 over the SECTION source files, used to detect a stale compiled corpus."""
+    h = hashlib.sha256()
+    for entry in section_entries():
+        h.update(entry["module"].encode("utf-8") + b"\0")
+        try:
+            h.update(file_hash(os.path.join(DATA_DIR, entry["file"])).encode("ascii"))
+        except OSError:
+            h.update(b"<missing>")
+        h.update(b"\0")
+    return h.digest()
+
+
+def load_section_data(entry: Dict[str, Any], warn_only: bool = True) -> Any:
+    """
+    Return the section dict described by a manifest entry, or None on failure.
+
+    Reads it through the hash-keyed parse cache; only a file that cannot be
+    parsed as a literal (listed with "import" in the manifest) falls back to
+    importing the module.
+    """
+    if not entry.get("import"):
+        try:
+            return load_section(entry["file"], entry["attr"], DATA_DIR)[2]
+        except (OSError, SyntaxError, SectionParseError):
+            pass
+    modpath, value = try_import_section(entry["module"], entry["attr"], warn_only=warn_only)
+    return value if modpath is not None else None
+
+
+def load_from_sources(warn_only: bool = True) -> Tuple[Dict[str, Any], List[str]]:
+    """Load every SECTION file listed in the manifest. Returns (loaded, failed)."""
+    loaded: Dict[str, Any] = {}
+    failed: List[str] = []
+    for entry in section_entries():
+        value = load_section_data(entry, warn_only=warn_only)
+        if value is None:
+            failed.append(entry["module"])
+        else:
+            loaded[entry["module"]] = value
+    return loaded, failed
+
+
+def open_compiled_corpus(path: str = CORPUS_PATH, expected_hash: Optional[bytes] = None) -> Optional[CorpusFile]:
+    """
+    Open the compiled corpus if it exists and matches the current sources, else None.
+    Pass `expected_hash` when `sources_hash()` has already been computed.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        corpus = CorpusFile(path)
+    except (OSError, CorpusFormatError) as e:
+        print(f"⚠️ Warning: ignoring compiled corpus {path} — {e}")
+        return None
+    if corpus.source_hash != (expected_hash or sources_hash()):
+        corpus.close()
+        return None
+    return corpus
+
+
+class LazySections(Sequence):
+    """
+    The sections listed in the manifest, in order, loaded one at a time on first
+    access.
+
+    Touching `ALL_SHLOKAS[i]` (directly or by iterating) loads only that section,
+    from the compiled corpus when it is in sync with the sources, otherwise from
+    the parse cache / its SECTION file. A section that fails to load shows up as
+    an empty dict and is recorded in FAILED_SECTIONS.
+    """
+
+    def __init__(self, entries: List[Dict[str, Any]]):
+        self._entries = {e["module"]: e for e in entries}
+        self._names: Optional[List[str]] = None
+        self._cache: Dict[str, Any] = {}
+        self._failed: List[str] = []
+        self._corpus_checked = False
+        self._corpus: Optional[CorpusFile] = None
+        self._compiled: Dict[str, Any] = {}
+        self._content_hash: Optional[bytes] = None
+
+    def content_hash(self) -> bytes:
+        """sha256 of the SECTION sources this sequence serves (computed once)."""
+        if self._content_hash is None:
+            self._content_hash = sources_hash()
+        return self._content_hash
+
+    @property
+    def corpus(self) -> Optional[CorpusFile]:
+        """The compiled corpus backing this sequence, or None when importing modules."""
+        if not self._corpus_checked:
+            self._corpus_checked = True
+            self._corpus = open_compiled_corpus(expected_hash=self.content_hash())
+            if self._corpus is not None:
+                self._compiled = self._corpus.sections()
+        return self._corpus
+
+    def names(self) -> List[str]:
+        """Basenames of the sections this sequence exposes, in load order."""
+        if self._names is None:
+            if self.corpus is not None:
+                self._names = [n for n in self._entries if n in self._compiled]
+            else:
+                self._names = list(self._entries)
+        return self._names
+
+    def load(self, mod_basename: str) -> Any:
+        """Return one section by module basename, loading it if needed."""
+        if mod_basename not in self._cache:
+            if self.corpus is not None and mod_basename in self._compiled:
+                value = self._compiled[mod_basename]
+            else:
+                value = load_section_data(self._entries[mod_basename], warn_only=True)
+                if value is None:
+                    self._failed.append(mod_basename)
+                    value = {}
+            self._cache[mod_basename] = value
+        return self._cache[mod_basename]
+
+    def loaded(self) -> Dict[str, Any]:
+        """Sections loaded so far, keyed by module basename (failures excluded)."""
+        return {n: v for n, v in self._cache.items() if n not in self._failed}
+
+    def failed(self) -> List[str]:
+        """Sections that are missing or could not be loaded so far."""
+        self.names()
+        return list(self._failed)
+
+    def preload(self) -> "LazySections":
+        """Load every section now (eager warm-up)."""
+        for name in self.names():
+            self.load(name)
+        return self
+
+    def __len__(self) -> int:
+        return len(self.names())
+
+    def __getitem__(self, i):
+        names = self.names()
+        if isinstance(i, slice):
+            return [self.load(n) for n in names[i]]
+        return self.load(names[i])
+
+    def __repr__(self) -> str:
+        return f"LazySections({len(self._cache)}/{len(self)} loaded)"
+
+
+_SECTIONS: Optional[LazySections] = None
+
+
+def _sections() -> LazySections:
+    global _SECTIONS
+    if _SECTIONS is None:
+        _SECTIONS = LazySections(section_entries())
+    return _SECTIONS
+
+
+def preload() -> LazySections:
+    """Load every section now instead of on first access. Returns ALL_SHLOKAS."""
+    return _sections().preload()
+
+
+def content_hash() -> bytes:
+    """sha256 identifying the loaded SECTION data; changes whenever any source does."""
+    return _sections().content_hash()
+
 
-# Build ALL_SHLOKAS list in the expected order. Keep missing entries out but note them.
-ALL_SHLOKAS: List[Any] = []
-for mod_basename in SECTION_MAP.keys():
-    if mod_basename in LOADED_SECTIONS:
-        ALL_SHLOKAS.append(LOADED_SECTIONS[mod_basename])
+def __getattr__(name: str) -> Any:
+    # Module-level attributes are computed on first use so that importing this
+    # module costs (almost) nothing.
+    if name in ("ALL_SHLOKAS", "PROBLEM_SECTIONS"):
+        # Backward compatibility: PROBLEM_SECTIONS is an alias of ALL_SHLOKAS
+        return _sections()
+    if name == "LOADED_SECTIONS":
+        return _sections().preload().loaded()
+    if name == "FAILED_SECTIONS":
+        return _sections().preload().failed()
+    if name == "CORPUS":
+        return _sections().corpus
+    if name == "SECTION_MAP":
+        return section_map()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Backward compatibility alias
-PROBLEM_SECTIONS = ALL_SHLOKAS
 
 if __name__ == '__main__':
-    print("🔢 Current Sections Loaded:", len(ALL_SHLOKAS))
+    # Module __getattr__ does not apply to names used inside the module itself.
+    ALL_SHLOKAS = preload()
+    CORPUS = ALL_SHLOKAS.corpus
+    FAILED_SECTIONS = ALL_SHLOKAS.failed()
+    print("🔢 Current Sections Loaded:", len(ALL_SHLOKAS.loaded()))
+    print("📦 Source:", CORPUS.path if CORPUS is not None else "SECTION modules")
     if FAILED_SECTIONS:
         print("⚠️ The following sections could not be loaded:", FAILED_SECTIONS)
         print("Tip: Ensure the SECTION_X modules exist either in the same directory or inside a 'data' package.")
@@ -143,4 +331,4 @@ if __name__ == '__main__':
         print("No sections available to introspect. Create the SECTION_X modules or adjust the loader.")
 
 # Exports for external use
-__all__ = ['ALL_SHLOKAS', 'PROBLEM_SECTIONS', 'LOADED_SECTIONS', 'FAILED_SECTIONS']
+__all__ = ['ALL_SHLOKAS', 'PROBLEM_SECTIONS', 'LOADED_SECTIONS', 'FAILED_SECTIONS', 'CORPUS', 'preload', 'content_hash']
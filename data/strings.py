@@ -0,0 +1,53 @@
+# data/strings.py
+"""
+Shared string table for flattened records.
+
+Section titles, problem titles and references repeat across many records (every
+verse of a problem carries the same title twice, and a verse cited under several
+problems repeats its reference and text). A `StringTable` stores each distinct
+string once and hands out small integer handles, so a record column is an array
+of ints and memory / serialized size grow with the number of unique strings
+rather than the number of records.
+"""
+
+from typing import Dict, Iterator, List, Optional
+
+
+class StringTable:
+    """Append-only interning table: string <-> dense integer handle."""
+
+    def __init__(self):
+        self._strings: List[str] = []
+        self._handles: Dict[str, int] = {}
+
+    def intern(self, text: str) -> int:
+        """Return the handle for `text`, adding it to the table if new."""
+        handle = self._handles.get(text)
+        if handle is None:
+            handle = len(self._strings)
+            self._strings.append(text)
+            self._handles[text] = handle
+        return handle
+
+    def handle(self, text: str) -> Optional[int]:
+        """Handle of `text` if it is in the table, else None (never adds)."""
+        return self._handles.get(text)
+
+    def __getitem__(self, handle: int) -> str:
+        return self._strings[handle]
+
+    def __contains__(self, text: object) -> bool:
+        return text in self._handles
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._strings)
+
+    def strings(self) -> List[str]:
+        """All strings in handle order (do not modify)."""
+        return self._strings
+
+    def __repr__(self) -> str:
+        return f"StringTable({len(self)} strings)"
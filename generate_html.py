@@ -1,6 +1,20 @@
+import argparse
+import hashlib
+import io
+import itertools
+import json
+import multiprocessing
 import os
+import time
 import webbrowser
-from data.shlokas import ALL_SHLOKAS
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from typing import List, NamedTuple, Tuple
+from data.corpus_view import REFERENCE_FORMAT, get_shlokas
+from search.ann import ANN_PATH, load_ann
+from search.autocomplete import AUTOCOMPLETE_FILENAME, write_autocomplete
+from search.related import RELATED_PATH, RelatedTable, get_related
+from search.web_index import INDEX_FILENAME, worker_source, write_web_index
+from utils.files import replace_if_changed, temp_path, write_if_changed
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_HTML = os.path.join(
@@ -8,506 +22,460 @@ OUTPUT_HTML = os.path.join(
     "android", "app", "src", "main", "assets", "html", "gita_shlokas.html"
 )
 
-SHLOKAS_PER_PAGE = 2
+TEMPLATE_DIR = os.path.join(BASE_DIR, "templates")
+TEMPLATE_CACHE_DIR = os.path.join(BASE_DIR, ".cache", "jinja")
+PAGE_TEMPLATE = "gita_shlokas.html"
+
+# Incremental builds: BUILD_CACHE_PATH records a hash of every build input
+# (see build_key()), the files the build wrote and the fingerprint of every
+# chunk, so an unchanged tree is not rebuilt and only changed chunks are packed.
+BUILD_CACHE_PATH = os.path.join(BASE_DIR, ".cache", "build.json")
+BUILD_CACHE_VERSION = 1
+BUILD_INPUT_DIRS = (
+    ("data", (".py",)), ("search", (".py", ".js")), ("templates", (".html",)), ("utils", (".py",)),
+)
 
+# The page is one virtualized scroll list; its Previous / Next buttons move
+# SHLOKAS_PER_PAGE frames at a time.
+SHLOKAS_PER_PAGE = 2
 
-def flatten_sections(all_sections):
-    flat = []
-    for sec in all_sections:
-        if not isinstance(sec, dict):
-            continue
-        for title, shlok_list in sec.items():
-            for s in shlok_list:
-                chapter = s.get("chapter", "")
-                verse = s.get("verse", "")
-
-                reference = f"अध्याय {chapter} • श्लोक {verse}"
-
-                flat.append({
-                    "section": title,
-                    "problem": title,
-                    "reference": reference,
-                    "text": s.get("sanskrit", "") or "—",
-                    "meaning": s.get("hindi_arth", "") or "—",
-                    "example": s.get("udaharan", "") or "—"
-                })
-    return flat
-
-
-def js_escape(t):
-    if t is None:
-        return ""
-    return (
-        str(t)
-        .replace("\\", "\\\\")
-        .replace("`", "\\`")
-        .replace("</", "<\\u002F")
-        .replace("\r", "")
-    )
-
-
-def gen_js_array(flat):
-    entries = []
-    for i, s in enumerate(flat):
-        entries.append(
-            "        {\n"
-            f"            id: {i},\n"
-            f"            section: `{js_escape(s['section'])}`,\n"
-            f"            problem: `{js_escape(s['problem'])}`,\n"
-            f"            reference: `{js_escape(s['reference'])}`,\n"
-            f"            text: `{js_escape(s['text'])}`,\n"
-            f"            meaning: `{js_escape(s['meaning'])}`,\n"
-            f"            example: `{js_escape(s['example'])}`\n"
-            "        }"
+# Records are shipped in chunk files of CHUNK_SIZE records in CHUNK_DIR next
+# to the page.
+CHUNK_DIR = "chunks"
+CHUNK_SIZE = 16
+PACKED_TEXT_FIELDS = ("text", "meaning", "example")
+VERBOSE_FIELDS = ("section", "problem", "reference", "text", "meaning", "example")
+
+# Variant matrix of `--variants` builds: every page size x theme x locale.
+# "sa_hi" pages show the Sanskrit verse with its Hindi meaning, "hi" pages only
+# the Hindi text.
+VARIANT_PAGE_SIZES = (2, 4)
+THEMES = ("default", "high_contrast")
+LOCALES = ("sa_hi", "hi")
+
+_ENVIRONMENT = None
+_VARIANT_STATE = None
+
+
+def get_environment():
+    """
+    The Jinja2 environment for the page templates, created once per process.
+
+    Compiled templates are also kept in TEMPLATE_CACHE_DIR, so later builds
+    (and other processes) load bytecode instead of parsing the templates.
+    """
+    global _ENVIRONMENT
+    if _ENVIRONMENT is None:
+        os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+        _ENVIRONMENT = Environment(
+            loader=FileSystemLoader(TEMPLATE_DIR),
+            bytecode_cache=FileSystemBytecodeCache(TEMPLATE_CACHE_DIR),
+            autoescape=False,
+            keep_trailing_newline=True,
         )
-    return ",\n".join(entries)
-
-
-def generate_html(flat):
-    js_array = gen_js_array(flat)
-
-    html = """<!DOCTYPE html>
-<html>
-<head>
-<meta charset="UTF-8">
-<title>Bhagwat Geeta</title>
-<meta name="viewport" content="width=device-width, initial-scale=1">
-<style>
-body { margin:0; padding:12px; font-family:Arial; background:#ff9800; }
-.title-block { text-align:center; width:100%; }
-h1 { font-size:24px; margin:6px 0; }
-h3 { font-size:21px; margin:0 0 6px 0; }
-hr { border:none; border-bottom:2px solid black; margin:6px 0; }
-.container { display:flex; flex-direction:column; min-height:calc(100vh - 140px); }
-.content-wrap { overflow:auto; padding-bottom:12px; }
-.frame {
-  background:white; border:2px solid black; border-radius:12px;
-  padding:12px; margin-top:12px; min-height:160px;
-}
-.frame.highlight {
-  background:#e7f9e6; border-color:#8fd19b;
-  box-shadow:0 0 12px rgba(0,128,64,0.25);
-}
-button {
-  padding:7px 14px; border:none; border-radius:14px;
-  margin:3px; font-size:14px; font-weight:bold; cursor:pointer;
-}
-.green { background:#2e7d32; color:white; }
-.red { background:#b71c1c; color:white; }
-.blue { background:#1565c0; color:white; }
-.small-btn { padding:5px 10px; font-size:13px; }
-pre { white-space:pre-wrap; font-size:16px; margin-top:8px; }
-.controls-row { text-align:center; margin:8px 0; }
-.voice-controls { display:inline-block; margin-left:14px; }
-.toggle {
-  margin:0 6px; padding:6px 10px; border-radius:10px;
-  background:white; border:1px solid rgba(0,0,0,0.12); cursor:pointer;
-}
-.selected { background:#1976d2; color:white; }
-.speed-selected { background:#388e3c; color:white; }
-.nav {
-  display:flex; justify-content:space-between; font-weight:bold;
-  margin-top:12px; position:sticky; bottom:0; padding-top:10px;
-}
-</style>
-</head>
-<body>
-
-<div class="title-block">
-  <h1>Bhagwat Geeta</h1>
-  <hr>
-  <h3>📘 भगवद गीता में अपनी समस्याओं का समाधान खोजें</h3>
-  <hr>
-</div>
-
-<div class="controls-row">
-  <button class="green" onclick="startSequential()">Start</button>
-  <button class="green" onclick="nextButton()">Next</button>
-  <button class="red" onclick="stopReading()">Stop</button>
-  <button class="green" onclick="resumeReading()">Resume</button>
-  <button class="green" onclick="startRandom()">Random</button>
-  <button class="red" onclick="exitApp()">Exit</button>
-  <span id="voiceControls" class="voice-controls"></span>
-</div>
-
-<div class="container">
-  <div class="content-wrap" id="contentWrap"><div id="content"></div></div>
-  <div class="nav">
-    <button onclick="prevPage()">⬅ Previous</button>
-    <span id="pageInfo"></span>
-    <button onclick="nextPage()">Next ➡</button>
-  </div>
-</div>
-
-<script>
-const PER_PAGE = __PER_PAGE__;
-const SHLOKAS = [
-__JS_ARRAY__
-];
-
-let page = 0;
-let mode = null; // "seq" | "random" | null
-let playing = false;
-let seqIndex = 0;     // next index to play in sequential mode
-let randomList = [];  // shuffled list of indices
-let randomPos = 0;    // position in randomList
-let currentIndex = -1; // index currently being read (highlighted)
-
-// Voice & speed settings (persisted)
-let selectedGender = localStorage.getItem("gita_voice_gender") || "female";
-let selectedSpeed = localStorage.getItem("gita_voice_speed") || "slow";
-
-// Browser voice fallback
-let browserVoice = null;
-function loadBrowserVoices(){
-    const list = speechSynthesis.getVoices();
-    if(!list || !list.length) return;
-    if(selectedGender === "female"){
-        browserVoice = list.find(v => v.lang && v.lang.toLowerCase().includes('hi') && v.name && v.name.toLowerCase().includes('female'))
-            || list.find(v => v.lang && v.lang.toLowerCase().includes('hi'))
-            || list[0];
-    } else {
-        browserVoice = list.find(v => v.lang && v.lang.toLowerCase().includes('hi') && v.name && v.name.toLowerCase().includes('male'))
-            || list.find(v => v.lang && v.lang.toLowerCase().includes('hi'))
-            || list[0];
-    }
-}
-speechSynthesis.onvoiceschanged = loadBrowserVoices;
-loadBrowserVoices();
-
-// Highlight helpers
-function clearHighlights(){
-    document.querySelectorAll(".frame.highlight").forEach(e=>e.classList.remove("highlight"));
-}
-function highlightFrame(i){
-    clearHighlights();
-    const el = document.getElementById("shlok_"+i);
-    if(el){
-        el.classList.add("highlight");
-        el.scrollIntoView({behavior:'smooth', block:'center'});
-    }
-}
-
-// Called by Android via evaluateJavascript (MainActivity) when TTS finishes
-function onSpeakComplete(){
-    try {
-        if(!playing) return;
-        if(mode === "seq"){
-            playNextSequential();
-        } else if(mode === "random"){
-            playNextRandom();
-        }
-    } catch(e){}
-}
-window.onSpeakComplete = onSpeakComplete; // expose globally
-
-// Speak (prefer Android, fallback to browser)
-function speakNowIndex(i){
-    currentIndex = i;
-    const s = SHLOKAS[i];
-    const textToSpeak = "अनुभाग: " + s.section + "\\n" +
-                        s.reference + "\\n" +
-                        "संस्कृत:\\n" + s.text + "\\n" +
-                        "हिंदी अर्थ:\\n" + s.meaning + "\\n" +
-                        "उदाहरण:\\n" + s.example;
-
-    // Try Android first
-    try {
-        if(typeof Android !== "undefined" && Android && Android.speak){
-            try { Android.speak(textToSpeak, selectedGender, selectedSpeed); } catch(e){}
-            return;
+    return _ENVIRONMENT
+
+
+class ChunkSet(NamedTuple):
+    files: List[str]       # chunk file names, in chunk order
+    titles: List[str]      # shared section / problem title table
+    packed_bytes: int      # chunk files + title table
+    verbose_bytes: int     # the same records as plain objects, for comparison
+    related: RelatedTable  # related records of every record, as packed
+    fingerprints: List[str]         # chunk_fingerprint() of every chunk
+    sizes: List[Tuple[int, int]]    # (packed, verbose) bytes of every chunk
+    reused: int                     # chunks taken from the previous build unpacked
+
+    def cache_entry(self):
+        """What the next build needs to reuse these chunks (see write_chunks())."""
+        return {
+            "titles": self.titles,
+            "chunks": {fp: [name, packed, verbose]
+                       for fp, name, (packed, verbose) in zip(self.fingerprints, self.files, self.sizes)},
         }
-    } catch(e){}
-
-    // Browser fallback using SpeechSynthesis
-    try {
-        speechSynthesis.cancel();
-        const u = new SpeechSynthesisUtterance(textToSpeak);
-        if(browserVoice) u.voice = browserVoice;
-        if(selectedSpeed === "very_slow") u.rate = 0.72;
-        else if(selectedSpeed === "slow") u.rate = 0.82;
-        else u.rate = 0.95;
-        u.lang = (browserVoice && browserVoice.lang) ? browserVoice.lang : 'hi-IN';
-        u.onend = function(){ try{ onSpeakComplete(); } catch(e){} };
-        speechSynthesis.speak(u);
-    } catch(e){
-        setTimeout(()=>{ try{ onSpeakComplete(); }catch(e){} }, 1000);
-    }
-}
-
-// ------------------ SEQUENTIAL MODE ------------------
-function startSequential(){
-    stopReading();
-    mode = "seq";
-    playing = true;
-    // resume from next item after currently highlighted (ensures not repeating same)
-    seqIndex = (currentIndex >= 0) ? currentIndex + 1 : 0;
-    if(seqIndex < SHLOKAS.length){
-        let i = seqIndex;
-        seqIndex++;
-        page = Math.floor(i / PER_PAGE);
-        render();
-        setTimeout(()=>{ highlightFrame(i); speakNowIndex(i); }, 180);
-    } else {
-        playing = false;
-    }
-}
-
-function playNextSequential(){
-    if(!playing || mode !== "seq") return;
-    if(seqIndex >= SHLOKAS.length){
-        playing = false;
-        clearHighlights();
-        return;
-    }
-    let i = seqIndex;
-    seqIndex++;
-    page = Math.floor(i / PER_PAGE);
-    render();
-    setTimeout(()=>{ highlightFrame(i); speakNowIndex(i); }, 180);
-}
-
-// NEXT button behavior: immediate next shlok and continue sequentially
-function nextButton(){
-    stopReading();
-    mode = "seq";
-    playing = true;
-
-    // compute next index: highlighted+1 or currentIndex+1
-    let highlighted = -1;
-    document.querySelectorAll('.frame').forEach(function(f){
-        if(f.classList.contains('highlight')){
-            highlighted = Number(f.id.replace('shlok_',''));
-        }
-    });
 
-    let startIdx = (highlighted !== -1) ? highlighted + 1 : (currentIndex >= 0 ? currentIndex + 1 : 0);
-    if(startIdx >= SHLOKAS.length){
-        playing = false;
-        return;
-    }
 
-    seqIndex = startIdx + 1; // set seqIndex for subsequent items
-    let i = startIdx;
-    page = Math.floor(i / PER_PAGE);
-    render();
-    setTimeout(()=>{ highlightFrame(i); speakNowIndex(i); }, 180);
-}
-
-// ------------------ RANDOM MODE ------------------
-function startRandom(){
-    stopReading();
-    mode = "random";
-    playing = true;
-
-    // build shuffled list
-    randomList = [];
-    for(let i=0;i<SHLOKAS.length;i++) randomList.push(i);
-    for(let i=randomList.length-1;i>0;i--){
-        const j = Math.floor(Math.random()*(i+1));
-        const tmp = randomList[i]; randomList[i] = randomList[j]; randomList[j] = tmp;
-    }
-    randomPos = 0;
-
-    if(randomPos < randomList.length){
-        let i = randomList[randomPos++];
-        page = Math.floor(i / PER_PAGE);
-        render();
-        setTimeout(()=>{ highlightFrame(i); speakNowIndex(i); }, 180);
-    } else {
-        playing = false;
-    }
-}
-
-function playNextRandom(){
-    if(!playing || mode !== "random") return;
-    if(randomPos >= randomList.length){
-        // reshuffle and continue
-        for(let i=randomList.length-1;i>0;i--){
-            const j = Math.floor(Math.random()*(i+1));
-            const tmp = randomList[i]; randomList[i] = randomList[j]; randomList[j] = tmp;
+class Variant(NamedTuple):
+    name: str = ""                 # "" is the default page, gita_shlokas.html
+    per_page: int = SHLOKAS_PER_PAGE
+    theme: str = THEMES[0]
+    locale: str = LOCALES[0]
+
+    @property
+    def filename(self):
+        return "gita_shlokas_%s.html" % self.name if self.name else os.path.basename(OUTPUT_HTML)
+
+
+DEFAULT_VARIANT = Variant()
+
+
+def variant_matrix():
+    """Every combination of VARIANT_PAGE_SIZES, THEMES and LOCALES, named by how it differs from the default."""
+    variants = []
+    for per_page, theme, locale in itertools.product(VARIANT_PAGE_SIZES, THEMES, LOCALES):
+        parts = []
+        if per_page != DEFAULT_VARIANT.per_page:
+            parts.append("p%d" % per_page)
+        if theme != DEFAULT_VARIANT.theme:
+            parts.append(theme)
+        if locale != DEFAULT_VARIANT.locale:
+            parts.append(locale)
+        variants.append(Variant("_".join(parts), per_page, theme, locale))
+    return variants
+
+
+def _json(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def chunk_source(c, strings, rows):
+    """JS of one chunk file: its packed records, handed to the page's GITA_CHUNK()."""
+    return "GITA_CHUNK(%d,%s,%s);\n" % (c, _json(strings), _json(rows))
+
+
+def chunk_fingerprint(flat, related, c, start, end, title_ids):
+    """
+    sha256 of everything chunk `c` (records start..end) is made from.
+
+    Registers the chunk's titles in `title_ids` exactly as pack_rows() does, so
+    a chunk that is reused without packing leaves the title table unchanged.
+    """
+    h = hashlib.sha256(b"%d\0" % c)
+    for i in range(start, end):
+        s = flat[i]
+        row = [title_ids.setdefault(s["section"], len(title_ids)),
+               title_ids.setdefault(s["problem"], len(title_ids)),
+               s["chapter"], s["verse"]]
+        row.extend(s[field] for field in PACKED_TEXT_FIELDS)
+        row.append(related.neighbours(i))
+        h.update(_json(row).encode("utf-8"))
+    return h.hexdigest()
+
+
+def pack_rows(flat, related, start, end, title_ids):
+    """
+    (strings, rows) of records start..end in the packed layout.
+
+    A row is [section, problem, chapter, verse, text, meaning, example, related]:
+    section / problem index the shared title table, text / meaning / example
+    index the chunk's own string table (repeated verses and placeholders are
+    stored once), and the page rebuilds `reference` from chapter / verse.
+    """
+    strings, string_ids, rows = [], {}, []
+    for i in range(start, end):
+        s = flat[i]
+        row = [title_ids.setdefault(s["section"], len(title_ids)),
+               title_ids.setdefault(s["problem"], len(title_ids)),
+               s["chapter"], s["verse"]]
+        for field in PACKED_TEXT_FIELDS:
+            text = s[field]
+            sid = string_ids.get(text)
+            if sid is None:
+                sid = string_ids[text] = len(strings)
+                strings.append(text)
+            row.append(sid)
+        row.append(related.neighbours(i))
+        rows.append(row)
+    return strings, rows
+
+
+def write_chunks(flat, directory, related=None, chunk_size=CHUNK_SIZE, previous=None):
+    """
+    Write the records of `flat` as packed chunk files into `directory`/CHUNK_DIR.
+
+    File names carry a hash of their content, so a WebView never serves a stale
+    chunk and unchanged chunks are not rewritten; chunk files of earlier builds
+    are removed.
+
+    `previous` is the ChunkSet.cache_entry() of the last build. Its title table
+    is kept (as long as every title in it is still used) so title ids stay
+    stable, and a chunk whose fingerprint is unchanged and whose file is still
+    there is reused without being packed again.
+    """
+    if related is None:
+        related = RelatedTable.build(flat)
+    chunk_dir = os.path.join(directory, CHUNK_DIR)
+    os.makedirs(chunk_dir, exist_ok=True)
+    title_ids = {}
+    known = {}
+    if previous:
+        titles = previous.get("titles", [])
+        if set(titles) <= set(flat.column("section")) | set(flat.column("problem")):
+            title_ids = {title: tid for tid, title in enumerate(titles)}
+            known = previous.get("chunks", {})
+    files, fingerprints, sizes = [], [], []
+    reused = 0
+    for c, start in enumerate(range(0, len(flat), chunk_size)):
+        end = min(start + chunk_size, len(flat))
+        fingerprint = chunk_fingerprint(flat, related, c, start, end, title_ids)
+        entry = known.get(fingerprint)
+        if entry is not None and os.path.exists(os.path.join(chunk_dir, entry[0])):
+            name, packed, verbose = entry
+            reused += 1
+        else:
+            strings, rows = pack_rows(flat, related, start, end, title_ids)
+            source = chunk_source(c, strings, rows).encode("utf-8")
+            packed = len(source)
+            verbose = len(_json([
+                dict({f: flat[i][f] for f in VERBOSE_FIELDS}, related=related.neighbours(i))
+                for i in range(start, end)
+            ]).encode("utf-8"))
+            name = "gita_chunk_%04d.%s.js" % (c, hashlib.sha256(source).hexdigest()[:10])
+            path = os.path.join(chunk_dir, name)
+            if not os.path.exists(path):
+                write_if_changed(path, source)
+        files.append(name)
+        fingerprints.append(fingerprint)
+        sizes.append((packed, verbose))
+    keep = set(files)
+    for name in os.listdir(chunk_dir):
+        if name.startswith("gita_chunk_") and name not in keep:
+            os.remove(os.path.join(chunk_dir, name))
+    titles = list(title_ids)
+    packed_bytes = sum(p for p, _v in sizes) + len(_json(titles).encode("utf-8"))
+    verbose_bytes = sum(v for _p, v in sizes)
+    return ChunkSet(files, titles, packed_bytes, verbose_bytes, related, fingerprints, sizes, reused)
+
+
+def prerender_records(flat, related, count):
+    """
+    Yield the first `count` records as the page's `frame` macro renders them:
+    the markup the page shows before its script has run or loaded any chunk.
+    """
+    for i in range(min(count, len(flat))):
+        s = flat[i]
+        ids = related.neighbours(i)
+        yield {
+            "index": i,
+            "section": s["section"],
+            "problem": s["problem"],
+            "reference": s["reference"],
+            "text": s["text"],
+            "meaning": s["meaning"],
+            "example": s["example"],
+            "related_key": ",".join(map(str, ids)),
+            "related": [(j, "%s — %s" % (flat[j]["problem"], flat[j]["reference"])) for j in ids],
         }
-        randomPos = 0;
-    }
-    if(randomPos < randomList.length){
-        let i = randomList[randomPos++];
-        page = Math.floor(i / PER_PAGE);
-        render();
-        setTimeout(()=>{ highlightFrame(i); speakNowIndex(i); }, 180);
-    } else {
-        playing = false;
-    }
-}
-
-// Read a single shlok (user clicks this shlok's play button) — plays that one only
-function readSingle(i){
-    stopReading();
-    mode = null;
-    playing = true;
-    currentIndex = i;
-    page = Math.floor(i / PER_PAGE);
-    render();
-    setTimeout(()=>{ highlightFrame(i); speakNowIndex(i); }, 180);
-}
-
-// STOP / RESUME / EXIT
-function stopReading(){
-    playing = false;
-    try { if(typeof Android !== "undefined" && Android && Android.stopSpeak) Android.stopSpeak(); } catch(e){}
-    try { speechSynthesis.cancel(); } catch(e){}
-    clearHighlights();
-}
-
-function resumeReading(){
-    if(playing) return; // already playing
-    // resume depending on mode
-    if(mode === "seq"){
-        // ensure we resume from next item after currentIndex
-        seqIndex = Math.max(seqIndex, (currentIndex >= 0 ? currentIndex + 1 : 0));
-        if(seqIndex < SHLOKAS.length){
-            playing = true;
-            let i = seqIndex;
-            seqIndex++;
-            page = Math.floor(i / PER_PAGE);
-            render();
-            setTimeout(()=>{ highlightFrame(i); speakNowIndex(i); }, 180);
-        }
-    } else if(mode === "random"){
-        if(randomPos < randomList.length){
-            playing = true;
-            let i = randomList[randomPos++];
-            page = Math.floor(i / PER_PAGE);
-            render();
-            setTimeout(()=>{ highlightFrame(i); speakNowIndex(i); }, 180);
-        }
-    }
-}
-
-function exitApp(){
-    try { if(typeof Android !== "undefined" && Android && Android.exitApp) Android.exitApp(); } catch(e){}
-    try { window.close(); } catch(e){}
-}
-
-// ------------------ RENDER / PAGINATION ------------------
-function render(){
-    const start = page * PER_PAGE;
-    const end = Math.min(start + PER_PAGE, SHLOKAS.length);
-    let html = "";
-    for(let i=start;i<end;i++){
-        let s = SHLOKAS[i];
-        html += `
-        <div class="frame" id="shlok_${i}">
-            <div style="font-weight:bold; margin-bottom:6px;">
-                ${i+1})
-                <button class="blue small-btn" onclick="readSingle(${i})">▶ Start This Shlok</button>
-                <button class="red small-btn" onclick="stopReading()">■ Stop</button>
-            </div>
-
-            <h4>📗 अनुभाग: ${s.section}</h4>
-            <b>समस्या:</b> ${s.problem}<br><br>
-
-            <b>${s.reference}</b><br><br>
-
-            <b>संस्कृत:</b><br>
-            <pre>${s.text}</pre>
-
-            <b>हिंदी अर्थ:</b><br>
-            ${s.meaning}<br><br>
-
-            <b>उदाहरण:</b><br>
-            ${s.example}
-        </div>`;
+
+
+def write_html(out, flat, chunks, chunk_size=CHUNK_SIZE, variant=DEFAULT_VARIANT, prerender=None):
+    """
+    Stream the page shell of `variant` into the text file `out`.
+
+    The first `prerender` records (one page, `variant.per_page`, by default)
+    are written into the document as static frames, so the WebView paints
+    them straight from the HTML; the script adopts those nodes instead of
+    building them again.
+
+    The shell only carries the chunk index and the title table; records are
+    loaded from the files written by `write_chunks()`. The template is rendered
+    with `generate()`, so its output is written piece by piece.
+    """
+    template = get_environment().get_template(PAGE_TEMPLATE)
+    for piece in template.generate(
+        per_page=variant.per_page,
+        theme=variant.theme,
+        locale=variant.locale,
+        search_index_js=INDEX_FILENAME,
+        autocomplete_js=AUTOCOMPLETE_FILENAME,
+        search_worker=worker_source(),
+        chunk_dir=CHUNK_DIR,
+        chunk_size=chunk_size,
+        chunk_files=chunks.files,
+        titles=chunks.titles,
+        reference_format=REFERENCE_FORMAT,
+        total=len(flat),
+        prerendered=prerender_records(flat, chunks.related,
+                                      variant.per_page if prerender is None else prerender),
+    ):
+        out.write(piece)
+
+
+def generate_html(flat, chunks, chunk_size=CHUNK_SIZE, variant=DEFAULT_VARIANT, prerender=None):
+    buf = io.StringIO()
+    write_html(buf, flat, chunks, chunk_size, variant, prerender)
+    return buf.getvalue()
+
+
+def _file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.digest()
+
+
+def write_page(directory, flat, chunks, variant=DEFAULT_VARIANT, prerender=None):
+    """
+    Write the page of `variant` into `directory` atomically. Returns its path.
+
+    A page identical to the one already there is not replaced, so its
+    modification time (and anything keyed on it downstream) is left alone.
+    """
+    path = os.path.join(directory, variant.filename)
+    tmp_path = temp_path(path)
+    with open(tmp_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        write_html(f, flat, chunks, variant=variant, prerender=prerender)
+    replace_if_changed(tmp_path, path)
+    return path
+
+
+def _init_variant_worker(directory, flat, chunks, prerender):
+    # Records and chunk tables arrive once per worker, not once per variant
+    global _VARIANT_STATE
+    _VARIANT_STATE = (directory, flat, chunks, prerender)
+    get_environment()
+
+
+def _build_variant(variant):
+    directory, flat, chunks, prerender = _VARIANT_STATE
+    started = time.perf_counter()
+    path = write_page(directory, flat, chunks, variant, prerender)
+    return variant, path, time.perf_counter() - started
+
+
+def build_variants(directory, flat, chunks, variants, workers=1, prerender=None):
+    """
+    Write the page of every variant into `directory`, rendering them in
+    parallel with `workers` processes. The records are flattened once by the
+    caller and handed to each worker when it starts.
+
+    Returns (variant, path, seconds) per variant, in input order.
+    """
+    if workers <= 1 or len(variants) <= 1:
+        _init_variant_worker(directory, flat, chunks, prerender)
+        return [_build_variant(v) for v in variants]
+    with multiprocessing.Pool(min(workers, len(variants)), initializer=_init_variant_worker,
+                              initargs=(directory, flat, chunks, prerender)) as pool:
+        return pool.map(_build_variant, variants)
+
+
+def remove_stale_variants(directory, variants):
+    """Delete variant pages in `directory` of earlier builds that are not in `variants`. Returns their names."""
+    keep = {v.filename for v in variants}
+    stale = sorted(name for name in os.listdir(directory)
+                   if name.startswith("gita_shlokas_") and name.endswith(".html") and name not in keep)
+    for name in stale:
+        os.remove(os.path.join(directory, name))
+    return stale
+
+
+def build_inputs():
+    """Every file the build output depends on: this script, the data, search and utils modules, the templates."""
+    paths = [os.path.abspath(__file__)]
+    for sub, extensions in BUILD_INPUT_DIRS:
+        directory = os.path.join(BASE_DIR, sub)
+        paths.extend(os.path.join(directory, name) for name in sorted(os.listdir(directory))
+                     if name.endswith(extensions))
+    return paths
+
+
+def build_key(settings):
+    """
+    sha256 (hex) of the build inputs and `settings`.
+
+    Settings that are module constants (page size, chunk size, variant matrix)
+    are covered by hashing this file; `settings` carries the command line.
+    """
+    h = hashlib.sha256()
+    for path in build_inputs():
+        h.update(os.path.relpath(path, BASE_DIR).encode("utf-8") + b"\0")
+        h.update(_file_digest(path))
+    h.update(_json(settings).encode("utf-8"))
+    return h.hexdigest()
+
+
+def load_build_cache(path=BUILD_CACHE_PATH):
+    """The record of the last build, or None if there is none (or it is unreadable)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("version") != BUILD_CACHE_VERSION:
+        return None
+    return cache
+
+
+def save_build_cache(key, outputs, chunks, path=BUILD_CACHE_PATH):
+    cache = {
+        "version": BUILD_CACHE_VERSION,
+        "key": key,
+        "outputs": sorted(os.path.relpath(p, BASE_DIR) for p in outputs),
+        "chunks": chunks.cache_entry(),
     }
-    document.getElementById("content").innerHTML = html;
-    document.getElementById("pageInfo").innerText = "Page "+(page+1)+" / "+Math.ceil(SHLOKAS.length/PER_PAGE);
-}
-
-function nextPage(){
-    page = (page + 1) % Math.ceil(SHLOKAS.length/PER_PAGE);
-    render();
-}
-function prevPage(){
-    page = (page - 1 + Math.ceil(SHLOKAS.length/PER_PAGE)) % Math.ceil(SHLOKAS.length/PER_PAGE);
-    render();
-}
-
-// ------------------ VOICE & SPEED UI ------------------
-function renderVoiceControls(){
-    const c = document.getElementById("voiceControls");
-    c.innerHTML = "";
-
-    const g1 = document.createElement("button");
-    g1.textContent = "♀ Female";
-    g1.className = "toggle" + (selectedGender==="female" ? " selected" : "");
-    g1.onclick = function(){
-        selectedGender = "female";
-        localStorage.setItem("gita_voice_gender","female");
-        try { if(typeof Android !== "undefined" && Android && Android.setVoice) Android.setVoice("female"); } catch(e){}
-        try { if(typeof Android !== "undefined" && Android && Android.setSpeed) Android.setSpeed(selectedSpeed); } catch(e){}
-        loadBrowserVoices();
-        renderVoiceControls();
-    };
-    c.appendChild(g1);
-
-    const g2 = document.createElement("button");
-    g2.textContent = "Male";
-    g2.className = "toggle" + (selectedGender==="male" ? " selected" : "");
-    g2.onclick = function(){
-        selectedGender = "male";
-        localStorage.setItem("gita_voice_gender","male");
-        try { if(typeof Android !== "undefined" && Android && Android.setVoice) Android.setVoice("male"); } catch(e){}
-        try { if(typeof Android !== "undefined" && Android && Android.setSpeed) Android.setSpeed(selectedSpeed); } catch(e){}
-        loadBrowserVoices();
-        renderVoiceControls();
-    };
-    c.appendChild(g2);
-
-    const speeds = [
-        {key:'very_slow', label:'Very Slow'},
-        {key:'slow', label:'Slow'},
-        {key:'medium', label:'Medium'}
-    ];
-    speeds.forEach(function(s){
-        const b = document.createElement("button");
-        b.textContent = s.label;
-        b.className = "toggle" + (selectedSpeed===s.key ? " speed-selected" : "");
-        b.onclick = function(){
-            selectedSpeed = s.key;
-            localStorage.setItem("gita_voice_speed", s.key);
-            try { if(typeof Android !== "undefined" && Android && Android.setSpeed) Android.setSpeed(s.key); } catch(e){}
-            renderVoiceControls();
-        };
-        c.appendChild(b);
-    });
-}
-
-// initial
-renderVoiceControls();
-render();
-
-</script>
-</body>
-</html>
-"""
-    html = html.replace("__PER_PAGE__", str(SHLOKAS_PER_PAGE))
-    html = html.replace("__JS_ARRAY__", js_array)
-    return html
-
-
-def main():
-    flat = flatten_sections(ALL_SHLOKAS)
-    html = generate_html(flat)
-
-    os.makedirs(os.path.dirname(OUTPUT_HTML), exist_ok=True)
-    with open(OUTPUT_HTML, "w", encoding="utf-8") as f:
-        f.write(html)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_if_changed(path, json.dumps(cache, ensure_ascii=False).encode("utf-8"))
 
-    print("✔ HTML Generated:", OUTPUT_HTML)
+
+def is_up_to_date(cache, key):
+    return (cache is not None and cache.get("key") == key
+            and all(os.path.exists(os.path.join(BASE_DIR, p)) for p in cache.get("outputs", ())))
+
+
+def _open_page():
     try:
         webbrowser.open("file://" + OUTPUT_HTML)
     except:
         pass
 
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the Android WebView page and its data files.")
+    parser.add_argument("--variants", action="store_true",
+                        help="also build every page size / theme / locale variant of the page")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="processes rendering variants in parallel (default: all cores)")
+    parser.add_argument("--prerender-all", action="store_true",
+                        help="write every record into the page as static markup, not just the first page")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild everything, even if no input changed since the last build")
+    args = parser.parse_args(argv)
+
+    key = build_key({"variants": args.variants, "prerender_all": args.prerender_all})
+    cache = None if args.force else load_build_cache()
+    if is_up_to_date(cache, key):
+        print("✔ Up to date:", OUTPUT_HTML, "(no input changed, nothing rebuilt)")
+        _open_page()
+        return
+
+    flat = get_shlokas()
+
+    output_dir = os.path.dirname(OUTPUT_HTML)
+    os.makedirs(output_dir, exist_ok=True)
+    chunks = write_chunks(flat, output_dir, get_related(), previous=cache and cache.get("chunks"))
+    variants = variant_matrix() if args.variants else [DEFAULT_VARIANT]
+    started = time.perf_counter()
+    built = build_variants(output_dir, flat, chunks, variants, args.workers,
+                           len(flat) if args.prerender_all else None)
+    variants_seconds = time.perf_counter() - started
+    stale_variants = remove_stale_variants(output_dir, variants)
+    index_path, index_size = write_web_index(flat, output_dir)
+    ac_path, ac_nodes = write_autocomplete(flat, output_dir)
+    ann = load_ann()
+    ann_added, ann_removed = ann.update(flat)
+    ann.save()
+    outputs = [path for _v, path, _s in built] + [index_path, ac_path, ANN_PATH, RELATED_PATH]
+    outputs += [os.path.join(output_dir, CHUNK_DIR, name) for name in chunks.files]
+    save_build_cache(key, outputs, chunks)
+
+    print("✔ HTML Generated:", OUTPUT_HTML)
+    if args.variants:
+        for variant, path, seconds in built:
+            print(f"✔ Variant {variant.name or 'default'}: {path} ({seconds * 1000:.0f} ms)")
+        print(f"✔ {len(built)} variants in {variants_seconds * 1000:.0f} ms "
+              f"({min(args.workers, len(built))} workers)")
+    if stale_variants:
+        print(f"✔ Removed {len(stale_variants)} variant pages of an earlier build:", ", ".join(stale_variants))
+    print(f"✔ Data chunks: {len(chunks.files)} x {CHUNK_SIZE} records in {CHUNK_DIR}/ "
+          f"({chunks.reused} unchanged)")
+    print(f"✔ Payload: {chunks.verbose_bytes} bytes as objects -> {chunks.packed_bytes} bytes packed "
+          f"({100 * chunks.packed_bytes / max(chunks.verbose_bytes, 1):.0f}%)")
+    print(f"✔ Search index: {index_path} ({index_size} bytes)")
+    print(f"✔ Autocomplete: {ac_path} ({ac_nodes} nodes)")
+    print(f"✔ ANN index: {len(ann)} verses (+{ann_added} / -{ann_removed})")
+    _open_page()
+
+
 if __name__ == "__main__":
     main()
@@ -1,14 +1,23 @@
 import os, sys
 from kivy.app import App
+from kivy.clock import Clock
 from kivy.uix.boxlayout import BoxLayout
-from kivy.properties import ListProperty, DictProperty, StringProperty
+from kivy.properties import ObjectProperty, DictProperty, StringProperty
 from kivy.core.text import LabelBase
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from data.shlokas import ALL_SHLOKAS
+from data.corpus_view import get_shlokas, iter_shlokas
+from data.index import get_index
+from data.records import ShlokaStore
+from search import fulltext, matcher, ngram
+from search.ann import load_ann, record_keys
+from search.autocomplete import AUTOCOMPLETE_FILENAME, AutocompleteTrie, load_autocomplete
+from search.related import load_related
+from search.translit import has_devanagari
 from utils.exporter import export_to_txt
 
+AUTOCOMPLETE_PATH = os.path.join('android','app','src','main','assets','html', AUTOCOMPLETE_FILENAME)
 FONT_PATH = os.path.join('android','app','src','main','assets','fonts','NotoSerifDevanagari-Regular.ttf')
 
 if os.path.exists(FONT_PATH):
@@ -18,41 +27,66 @@ else:
     print("❌ Font missing:", FONT_PATH)
 
 
-def flatten(all_sec):
-    result = []
-    for sec in all_sec:
-        if isinstance(sec, list):
-            sec = sec[0]
-        title = sec.get("title", "")
-        for s in sec.get("shlokas", []):
-            result.append({
-                "section": title,
-                "problem": s.get("problem", ""),
-                "sloka": s.get("reference", ""),
-                "text": s.get("text", ""),
-                "meaning": s.get("meaning", ""),
-                "example": s.get("example", "")
-            })
-    return result
-
-
 class MainScreen(BoxLayout):
 
-    sections = ListProperty([])
+    sections = ObjectProperty([])
     selected = DictProperty({})
     status_text = StringProperty("")
 
     def __init__(self, **kw):
         super().__init__(**kw)
-        self.sections = flatten(ALL_SHLOKAS)
-        self.load_list()
+        self._autocomplete = None
+        self._ann = None
+        self._ann_rows = None
+        self._related = None
+        self._shown = None
+        # The corpus is flattened one section per frame once the window is up
+        # (see _load_next_section), so build() returns before it is parsed
+        self.sections = ShlokaStore()
+        self._loader = iter_shlokas()
+        Clock.schedule_once(self._load_next_section)
+
+    def _list_rows(self, start=0):
+        return [
+            {"text": f"{self.sections[i]['problem']} ({self.sections[i]['reference']})", "index": i}
+            for i in range(start, len(self.sections))
+        ]
+
+    def _load_next_section(self, _dt):
+        if self._loader is None:
+            return
+        store = next(self._loader, None)
+        if store is None:
+            self._loaded()
+            return
+        start = len(self.ids.rv.data)
+        self.sections = store
+        self.ids.rv.data.extend(self._list_rows(start))
+        if self._shown is None and self.sections:
+            self.show(0)
+        Clock.schedule_once(self._load_next_section)
+
+    def _loaded(self):
+        # Complete: from now on the shared view, and the related table
+        self._loader = None
+        self.sections = get_shlokas()
+        Clock.schedule_once(self._load_related)
+
+    def _ensure_loaded(self):
+        # Searches and exports need every record: finish flattening right away
+        if self._loader is not None:
+            self._loaded()
+            self.ids.rv.data.extend(self._list_rows(len(self.ids.rv.data)))
+
+    def _load_related(self, _dt):
+        # Shipped with the page assets (generate_html.py); no table, no "Related"
+        self._related = load_related()
+        if self._shown is not None:
+            self.show(self._shown)
 
     def load_list(self):
         # Requires a RecycleView with id 'rv' and a Label with id 'content_label' in kv
-        self.ids.rv.data = [
-            {"text": f"{x['problem']} ({x['sloka']})", "index": i}
-            for i, x in enumerate(self.sections)
-        ]
+        self.ids.rv.data = self._list_rows()
         if self.sections:
             self.show(0)
 
@@ -60,16 +94,104 @@ class MainScreen(BoxLayout):
         self.show(i)
 
     def show(self, i):
+        self._shown = i
         d = self.sections[i]
         self.ids.content_label.text = (
             f"📖 {d['section']}\n\n"
-            f"📜 {d['sloka']}\n\n"
+            f"📜 {d['reference']}\n\n"
             f"{d['text']}\n\n"
             f"Meaning: {d['meaning']}\n\n"
             f"Example: {d['example']}"
         )
+        related = self._related.neighbours(i) if self._related is not None else []
+        if related:
+            self.ids.content_label.text += "\n\n🔗 Related: " + ", ".join(
+                f"{self.sections[j]['problem']} ({self.sections[j]['reference']})" for j in related)
+
+    def search(self, query):
+        # Replaces the list with ranked hits; an empty query restores the full list
+        self._ensure_loaded()
+        if not query.strip():
+            self.load_list()
+            return
+        hits = fulltext.search(query, limit=50) if has_devanagari(query) else []
+        if hits:
+            index = fulltext.get_fulltext_index()
+            self.ids.rv.data = [
+                {"text": f"{self.sections[h.row_id]['problem']} — {index.snippet(h)}", "index": h.row_id}
+                for h in hits
+            ]
+        else:
+            # Latin-script (Hinglish / IAST) queries and Devanagari misspellings
+            hits = ngram.search(query, limit=50)
+            self.ids.rv.data = [
+                {"text": f"{self.sections[h.row_id]['problem']} ({self.sections[h.row_id]['reference']})",
+                 "index": h.row_id}
+                for h in hits
+            ]
+        self.status_text = f"{len(hits)} results for: {query}"
+        if hits:
+            self.show(hits[0].row_id)
+
+    def suggest(self, prefix):
+        # Autocomplete: [(label, row index)] for the text typed so far
+        self._ensure_loaded()
+        if self._autocomplete is None:
+            try:
+                self._autocomplete = load_autocomplete(AUTOCOMPLETE_PATH)
+            except (OSError, ValueError):
+                # Page assets not generated yet: build the trie in memory
+                self._autocomplete = AutocompleteTrie.from_store(self.sections)
+        return self._autocomplete.complete(prefix, limit=8)
+
+    def describe_problem(self, text):
+        # Free-text complaint -> best matching problem sections, best verse first
+        self._ensure_loaded()
+        matches = matcher.match_sections(text, k=3)
+        if not matches:
+            self.status_text = f"No matching section for: {text}"
+            return
+        self.ids.rv.data = [
+            {"text": f"{m.problem} ({self.sections[r]['reference']})", "index": r}
+            for m in matches for r in m.row_ids
+        ]
+        self.show(matches[0].row_ids[0])
+        self.status_text = "Closest problems: " + ", ".join(m.problem for m in matches)
+
+    def similar_verses(self, text):
+        # Free text -> verses with the closest wording, from the LSH index
+        # shipped with the page assets (search/ann.py)
+        self._ensure_loaded()
+        if self._ann is None:
+            self._ann = load_ann()
+            # Signs only records the shipped index lacks (none once it is in sync)
+            self._ann.update(self.sections)
+            self._ann_rows = {k: i for i, k in enumerate(record_keys(self.sections))}
+        hits = [self._ann_rows[k] for k, _score in self._ann.query(text, k=10)
+                if k in self._ann_rows]
+        if not hits:
+            self.status_text = f"No similar verses for: {text}"
+            return
+        self.ids.rv.data = [
+            {"text": f"{self.sections[r]['problem']} ({self.sections[r]['reference']})", "index": r}
+            for r in hits
+        ]
+        self.show(hits[0])
+        self.status_text = f"{len(hits)} similar verses for: {text}"
+
+    def show_reference(self, text):
+        # e.g. "2.47"; shows the first record for that verse
+        self._ensure_loaded()
+        found = get_index().lookup_ref(text)
+        if found:
+            self.show(found[0].id)
+            self.status_text = "Also cited under: " + ", ".join(
+                get_index().problems_for(found[0]['chapter'], found[0]['verse']))
+        else:
+            self.status_text = f"Not found: {text}"
 
     def export_all(self):
+        self._ensure_loaded()
         p = export_to_txt(self.sections)
         self.status_text = f"Saved: {p}"
 
@@ -0,0 +1,206 @@
+# search/autocomplete.py
+"""
+Prefix autocomplete for problem titles and verse references.
+
+Completions come from the flattened corpus:
+
+  - every problem title ("8. हतोत्साहित हो जाना"), also under its romanized
+    form ("8. hatotsaahit ho jaanaa")
+  - every reference ("अध्याय 2 • श्लोक 47") and its short form "2.47"
+
+Each completion is keyed under every word it contains, not just the first, so
+typing "क्रोध", "krodh" or "anger" all offer "20. क्रोध आना (Anger)". Keys and
+typed prefixes go through the same `fold_key()`: Devanagari folds of
+search.devanagari, IAST diacritics dropped, doubled letters collapsed ("aa"
+-> "a") and punctuation reduced to single spaces.
+
+The keys form a radix trie (edges carry whole strings). Every node stores the
+ids of its top-k completions, so a keystroke walks at most len(prefix)
+characters and reads one list, without visiting the subtree.
+
+The trie serializes to plain JSON:
+
+  {"k": K, "completions": [[label, row_id], ...],
+   "nodes": [[[edge_label, ...], [child_node, ...], [completion_id, ...]], ...]}
+
+node 0 being the root. `write_autocomplete()` stores it as
+`var GITA_AUTOCOMPLETE = {...};` next to the generated page; the page uses it
+directly and `load_autocomplete()` reads the same file for the Kivy app.
+"""
+
+import json
+import os
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from data.index import ref_key
+    from data.records import ShlokaStore
+except ModuleNotFoundError:
+    from index import ref_key
+    from records import ShlokaStore
+
+from search.devanagari import normalize
+from search.translit import romanize
+from utils.files import write_if_changed
+
+TOP_K = 8
+AUTOCOMPLETE_FILENAME = "gita_autocomplete.js"
+_JS_PREFIX = "var GITA_AUTOCOMPLETE = "
+
+TITLE_WEIGHT = 3
+REFERENCE_WEIGHT = 2
+SHORT_REF_WEIGHT = 1
+
+_LATIN_MARKS_RE = re.compile("[\u0300-\u036f]")
+_DOUBLE_RE = re.compile(r"([a-z])\1+")
+_SEPARATORS_RE = re.compile("[^0-9a-z\u0900-\u0963\u0966-\u097f]+")
+
+Completion = Tuple[str, int]   # (label, row_id)
+
+
+def fold_key(text: str) -> str:
+    """Fold a key or typed prefix so spelling variants share one trie path."""
+    text = normalize(text, fold_matras=True, fold_anusvara=True)
+    text = _LATIN_MARKS_RE.sub("", unicodedata.normalize("NFD", text))
+    text = unicodedata.normalize("NFC", text)
+    text = _DOUBLE_RE.sub(r"\1", text)
+    return " ".join(_SEPARATORS_RE.sub(" ", text).split())
+
+
+def _suffixes(key: str) -> List[str]:
+    # The key from each word on: "20 krod ana anger" -> ..., "krod ana anger", ...
+    words = key.split(" ")
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+class AutocompleteTrie:
+    """Radix trie with cached top-k completions per node."""
+
+    def __init__(self, k: int, completions: List[Completion], nodes: List[list]):
+        self.k = k
+        self.completions = completions
+        self.nodes = nodes
+
+    @classmethod
+    def build(cls, entries: List[Tuple[str, str, int, int]], k: int = TOP_K) -> "AutocompleteTrie":
+        """Build from (key_text, label, row_id, weight) entries."""
+        completions: List[Completion] = []
+        completion_ids: Dict[str, int] = {}
+        weights: List[int] = []
+        # Character trie first: node = [children {char: node}, terminal completion ids]
+        root: list = [{}, set()]
+        for key_text, label, row_id, weight in entries:
+            # One completion per label; it opens the first row filed under it
+            cid = completion_ids.get(label)
+            if cid is None:
+                cid = completion_ids[label] = len(completions)
+                completions.append((label, row_id))
+                weights.append(weight)
+            else:
+                weights[cid] = max(weights[cid], weight)
+            for suffix in _suffixes(fold_key(key_text)):
+                node = root
+                for ch in suffix:
+                    node = node[0].setdefault(ch, [{}, set()])
+                node[1].add(cid)
+
+        rank = lambda cid: (-weights[cid], cid)
+        nodes: List[list] = []
+
+        def top(node) -> List[int]:
+            best = set(node[1])
+            for child in node[0].values():
+                best.update(top(child))
+            ranked = sorted(best, key=rank)[:k]
+            node.append(ranked)
+            return ranked
+
+        def emit(node) -> int:
+            index = len(nodes)
+            entry: list = [[], [], node[2]]
+            nodes.append(entry)
+            for ch in sorted(node[0]):
+                label, child = ch, node[0][ch]
+                # Collapse single-child chains without completions of their own
+                while len(child[0]) == 1 and not child[1]:
+                    (next_ch, next_child), = child[0].items()
+                    label += next_ch
+                    child = next_child
+                entry[0].append(label)
+                entry[1].append(emit(child))
+            return index
+
+        top(root)
+        emit(root)
+        return cls(k, completions, nodes)
+
+    @classmethod
+    def from_store(cls, store: ShlokaStore, k: int = TOP_K) -> "AutocompleteTrie":
+        entries = []
+        seen_titles = set()
+        problems = store.column("problem")
+        references = store.column("reference")
+        for row_id, (problem, chapter, verse) in enumerate(
+                zip(problems, store.column("chapter"), store.column("verse"))):
+            if problem not in seen_titles:
+                seen_titles.add(problem)
+                entries.append((problem, problem, row_id, TITLE_WEIGHT))
+                entries.append((romanize(problem), problem, row_id, TITLE_WEIGHT))
+            reference = references[row_id]
+            entries.append((reference, reference, row_id, REFERENCE_WEIGHT))
+            if chapter != "":
+                short = "%s.%s" % ref_key(chapter, verse)
+                entries.append((short, reference, row_id, SHORT_REF_WEIGHT))
+        return cls.build(entries, k)
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> List[Completion]:
+        """Top completions of a typed prefix, best first (empty if none)."""
+        rest = fold_key(prefix)
+        if not rest:
+            return []
+        node = self.nodes[0]
+        while rest:
+            for label, child in zip(node[0], node[1]):
+                if label[0] != rest[0]:
+                    continue
+                if rest.startswith(label):
+                    rest = rest[len(label):]
+                    node = self.nodes[child]
+                    break
+                if label.startswith(rest):
+                    rest = ""
+                    node = self.nodes[child]
+                    break
+                return []
+            else:
+                return []
+        return [self.completions[c] for c in node[2][:limit]]
+
+    def to_json(self) -> str:
+        return json.dumps({"k": self.k, "completions": self.completions, "nodes": self.nodes},
+                          ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text: str) -> "AutocompleteTrie":
+        data = json.loads(text)
+        return cls(data["k"], [tuple(c) for c in data["completions"]], data["nodes"])
+
+
+def write_autocomplete(store: ShlokaStore, directory: str) -> Tuple[str, int]:
+    """Write `gita_autocomplete.js` into `directory` (only if it changed). Returns (path, node count)."""
+    trie = AutocompleteTrie.from_store(store)
+    path = os.path.join(directory, AUTOCOMPLETE_FILENAME)
+    source = _JS_PREFIX + trie.to_json().replace("</", "<\\/") + ";\n"
+    write_if_changed(path, source.encode("utf-8"))
+    return path, len(trie.nodes)
+
+
+def load_autocomplete(path: str) -> AutocompleteTrie:
+    """Read a trie written by `write_autocomplete()`."""
+    with open(path, encoding="utf-8") as f:
+        text = f.read().strip()
+    if not text.startswith(_JS_PREFIX):
+        raise ValueError("not an autocomplete file: %s" % path)
+    return AutocompleteTrie.from_json(text[len(_JS_PREFIX):].rstrip(";"))
@@ -0,0 +1,149 @@
+# search/cache.py
+"""
+Result cache for queries over the corpus.
+
+Real traffic repeats a handful of queries ("anger", "fear", "stress") over and
+over. `cached_query` puts a `QueryCache` in front of a function whose first
+argument is the query text, so a repeated query returns the stored result and
+scores nothing.
+
+The cache key is the query as the cached search reduces it, together with the
+remaining call arguments. By default that is `normalize_query()`: the tokens
+with the full-text folds (NFC, nukta, zero-width joiners, case, long/short
+i/u and nasal signs) joined by single spaces. Searches that fold further pass
+their own reduction (`cached_query(..., normalizer=...)`; the n-gram search and
+the matcher key on their script-neutral `word_keys()`, so "krodha" and "Krodh"
+share an entry). Queries that give the same results therefore share one entry.
+
+Every cache remembers the `data.shlokas.content_hash()` it was filled under and
+empties itself when that changes, i.e. when the corpus is reloaded. The hash is
+computed once per process, like the corpus itself is loaded once: editing a
+SECTION file under a running process changes neither the hash nor the data the
+searches serve, and is picked up on the next start.
+
+Cached results are shared between callers and must not be modified.
+"""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+try:
+    from data import shlokas
+except ModuleNotFoundError:
+    import shlokas
+
+from search.devanagari import iter_tokens, normalize
+
+DEFAULT_MAXSIZE = 256
+
+_MISSING = object()
+_CACHES: Dict[str, "QueryCache"] = {}
+
+
+def normalize_query(query: str) -> str:
+    """Cache key form of a query: tokens folded like the full-text search's, joined by single spaces."""
+    return " ".join(filter(None, (
+        normalize(raw, fold_matras=True, fold_anusvara=True) for _s, _e, raw in iter_tokens(query))))
+
+
+class QueryCache:
+    """Size-bounded LRU cache with optional TTL, tied to the corpus content hash."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()   # key -> (expires, value)
+        self._version: Optional[bytes] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _check_version(self) -> None:
+        version = shlokas.content_hash()
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            self._check_version()
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires is None or expires > self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._check_version()
+            expires = None if self.ttl is None else self.clock() + self.ttl
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def cached_query(name: str, maxsize: int = DEFAULT_MAXSIZE, ttl: Optional[float] = None,
+                 normalizer: Callable[[str], Hashable] = normalize_query):
+    """
+    Decorator caching `func(query, *args, **kwargs)` on `normalizer(query)`.
+
+    `normalizer` must map two queries to the same key only if `func` gives them
+    the same result. The cache is registered under `name` (see `cache_stats()`)
+    and reachable as `func.cache`.
+    """
+    cache = _CACHES[name] = QueryCache(maxsize, ttl)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(query: str, *args, **kwargs):
+            key = (normalizer(query), args, tuple(sorted(kwargs.items())))
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(query, *args, **kwargs)
+                cache.put(key, result)
+            return result
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Counters of every registered query cache, by name."""
+    return {name: cache.stats() for name, cache in _CACHES.items()}
+
+
+def clear_caches() -> None:
+    for cache in _CACHES.values():
+        cache.clear()
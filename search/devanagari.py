@@ -0,0 +1,77 @@
+# search/devanagari.py
+"""
+Devanagari-aware text normalization and tokenization for the search modules.
+
+`normalize()` always applies NFC, lower-cases Latin letters and folds the nukta
+(ज़ -> ज, ड़ -> ड), which phone keyboards and source texts use inconsistently.
+Two optional, lossy folds help with common typing differences:
+
+  fold_matras    long and short i/u vowels (ी -> ि, ू -> ु, ई -> इ, ऊ -> उ)
+  fold_anusvara  chandrabindu / anusvara / half nasal (हैं, हँ, सन्त -> सत)
+
+`tokenize()` splits on anything that is not a letter, vowel sign or digit and
+keeps the character offsets of every token in the original string, so search
+hits can point back at the exact text to highlight.
+"""
+
+import re
+import unicodedata
+from typing import Iterator, List, Tuple
+
+NUKTA = "\u093c"
+VIRAMA = "\u094d"
+ANUSVARA = "\u0902"
+CHANDRABINDU = "\u0901"
+
+# Devanagari letters and signs (without the dandas U+0964/U+0965), digits,
+# Latin letters incl. IAST diacritics, and zero-width (non-)joiners.
+TOKEN_RE = re.compile(
+    "[0-9A-Za-z\u00c0-\u024f\u1e00-\u1eff"
+    "\u0900-\u0963\u0966-\u097f\u200c\u200d]+"
+)
+
+_MATRA_FOLD = str.maketrans({
+    "\u0940": "\u093f",  # ी -> ि
+    "\u0942": "\u0941",  # ू -> ु
+    "\u0908": "\u0907",  # ई -> इ
+    "\u090a": "\u0909",  # ऊ -> उ
+})
+# Nasal consonant + virama before a consonant is written as an anusvara.
+_HALF_NASAL_RE = re.compile("[\u0919\u091e\u0923\u0928\u092e]\u094d(?=[\u0915-\u0939])")
+_NASAL_SIGNS_RE = re.compile("[\u0901\u0902]")
+_JOINERS_RE = re.compile("[\u200c\u200d]")
+
+
+def normalize(text: str, fold_matras: bool = False, fold_anusvara: bool = False) -> str:
+    """Normalize a token or query for indexing / lookup."""
+    text = unicodedata.normalize("NFD", text)
+    text = text.replace(NUKTA, "")
+    text = _JOINERS_RE.sub("", text)
+    text = unicodedata.normalize("NFC", text).lower()
+    if fold_matras:
+        text = text.translate(_MATRA_FOLD)
+    if fold_anusvara:
+        text = _HALF_NASAL_RE.sub(ANUSVARA, text)
+        text = _NASAL_SIGNS_RE.sub("", text)
+    return text
+
+
+def iter_tokens(text: str) -> Iterator[Tuple[int, int, str]]:
+    """Yield (start, end, raw_token) for every token in `text`."""
+    for m in TOKEN_RE.finditer(text):
+        yield m.start(), m.end(), m.group()
+
+
+def tokenize(text: str, fold_matras: bool = False, fold_anusvara: bool = False) -> List[Tuple[int, int, str]]:
+    """(start, end, normalized_token) for every token; offsets refer to `text`."""
+    result = []
+    for start, end, raw in iter_tokens(text):
+        term = normalize(raw, fold_matras, fold_anusvara)
+        if term:
+            result.append((start, end, term))
+    return result
+
+
+def query_terms(query: str, fold_matras: bool = False, fold_anusvara: bool = False) -> List[str]:
+    """Normalized terms of a free-text query, in order."""
+    return [term for _s, _e, term in tokenize(query, fold_matras, fold_anusvara)]
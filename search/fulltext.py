@@ -0,0 +1,224 @@
+# search/fulltext.py
+"""
+Positional full-text index over the verse text fields of the flattened corpus.
+
+Every token of `text` (Sanskrit), `meaning` (hindi_arth), `explanation`
+(saral_samajh) and `example` (udaharan) is normalized with search.devanagari and
+posted as term -> {document: [positions]}, where a document is one field of one
+record. The start/end offset of every position is kept, so a hit carries the
+character spans to highlight and a precomputed snippet window without
+re-tokenizing anything at query time.
+
+Ranking is BM25 per field, weighted by field, plus a bonus when query terms
+appear next to each other (a phrase) and a penalty for records that match only
+some of the terms. The last query term is also matched as a prefix, so results
+appear while a word is still being typed.
+"""
+
+import math
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+try:
+    from data import shlokas
+    from data.corpus_view import get_shlokas
+    from data.records import ShlokaStore
+except ModuleNotFoundError:
+    import shlokas
+    from corpus_view import get_shlokas
+    from records import ShlokaStore
+
+from search.cache import cached_query
+from search.devanagari import query_terms, tokenize
+from search.spelling import correct_query
+
+SEARCH_FIELDS = ("text", "meaning", "explanation", "example")
+FIELD_WEIGHTS = {"text": 1.0, "meaning": 1.5, "explanation": 1.2, "example": 1.0}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+PHRASE_BONUS = 0.5
+PREFIX_WEIGHT = 0.7
+MAX_PREFIX_EXPANSIONS = 32
+SNIPPET_CHARS = 90
+SNIPPET_LEAD = 25
+
+Span = Tuple[int, int]
+
+_INDEXES: Dict[Tuple[bytes, bool, bool], "FullTextIndex"] = {}
+
+
+class SearchHit(NamedTuple):
+    row_id: int
+    score: float
+    field: str              # field the snippet is taken from
+    snippet: Span           # (start, end) character window in that field
+    highlights: Tuple[Span, ...]  # matched token spans in that field
+
+
+class FullTextIndex:
+    """Inverted index with positions and token offsets over SEARCH_FIELDS."""
+
+    def __init__(self, store: ShlokaStore, fields: Sequence[str] = SEARCH_FIELDS,
+                 fold_matras: bool = False, fold_anusvara: bool = False):
+        self.store = store
+        self.fields = tuple(fields)
+        self.fold_matras = fold_matras
+        self.fold_anusvara = fold_anusvara
+
+        # A document is one field of one record: doc = row_id * n_fields + field_no.
+        n_fields = len(self.fields)
+        self._postings: Dict[str, Dict[int, List[int]]] = {}
+        self._offsets: List[array] = []
+        self._lengths = array("I")
+        total_len = [0] * n_fields
+
+        columns = [store.column(f) for f in self.fields]
+        for row_id in range(len(store)):
+            for field_no in range(n_fields):
+                doc = row_id * n_fields + field_no
+                offsets = array("I")
+                for pos, (start, end, term) in enumerate(
+                        tokenize(columns[field_no][row_id], fold_matras, fold_anusvara)):
+                    self._postings.setdefault(term, {}).setdefault(doc, []).append(pos)
+                    offsets.append(start)
+                    offsets.append(end)
+                self._offsets.append(offsets)
+                self._lengths.append(len(offsets) // 2)
+                total_len[field_no] += len(offsets) // 2
+
+        n_rows = max(len(store), 1)
+        self._avg_len = [max(t / n_rows, 1.0) for t in total_len]
+        self._vocab = sorted(self._postings)
+        self._idf: Dict[str, float] = {}
+        for term, docs in self._postings.items():
+            df = len({doc // n_fields for doc in docs})
+            self._idf[term] = math.log(1 + (len(store) - df + 0.5) / (df + 0.5))
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def vocabulary(self) -> List[str]:
+        """All indexed terms, sorted."""
+        return self._vocab
+
+    def terms(self, query: str) -> List[str]:
+        """Normalize a query the same way the index was built."""
+        return query_terms(query, self.fold_matras, self.fold_anusvara)
+
+    def _expand(self, term: str, prefix: bool) -> List[Tuple[str, float]]:
+        expansions = [(term, 1.0)] if term in self._postings else []
+        if prefix:
+            i = bisect_left(self._vocab, term)
+            while (i < len(self._vocab) and self._vocab[i].startswith(term)
+                   and len(expansions) < MAX_PREFIX_EXPANSIONS):
+                if self._vocab[i] != term:
+                    expansions.append((self._vocab[i], PREFIX_WEIGHT))
+                i += 1
+        return expansions
+
+    def search(self, query: str, limit: int = 10, prefix: bool = True) -> List[SearchHit]:
+        """Ranked hits for `query`; the last term is also matched as a prefix."""
+        terms = self.terms(query)
+        return self.search_terms(terms, limit, prefix)
+
+    def search_terms(self, terms: List[str], limit: int = 10, prefix: bool = True) -> List[SearchHit]:
+        """Like `search`, for already-normalized terms."""
+        if not terms:
+            return []
+        n_fields = len(self.fields)
+        scores: Dict[int, float] = {}
+        matched: Dict[int, set] = {}
+        # doc -> {query term index: positions}, for phrases and highlighting
+        doc_hits: Dict[int, Dict[int, List[int]]] = {}
+
+        for qi, term in enumerate(terms):
+            for expanded, weight in self._expand(term, prefix and qi == len(terms) - 1):
+                idf = self._idf[expanded] * weight
+                for doc, positions in self._postings[expanded].items():
+                    field_no = doc % n_fields
+                    tf = len(positions)
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[doc] / self._avg_len[field_no])
+                    row_id = doc // n_fields
+                    scores[row_id] = scores.get(row_id, 0.0) + (
+                        FIELD_WEIGHTS.get(self.fields[field_no], 1.0) * idf * tf * (BM25_K1 + 1) / (tf + norm))
+                    matched.setdefault(row_id, set()).add(qi)
+                    doc_hits.setdefault(doc, {}).setdefault(qi, []).extend(positions)
+
+        for doc, by_term in doc_hits.items():
+            for qi in range(len(terms) - 1):
+                if qi in by_term and qi + 1 in by_term:
+                    following = set(by_term[qi + 1])
+                    if any(p + 1 in following for p in by_term[qi]):
+                        scores[doc // n_fields] += PHRASE_BONUS * len(terms)
+
+        ranked = sorted(
+            ((score * len(matched[row_id]) / len(terms), row_id) for row_id, score in scores.items()),
+            key=lambda x: (-x[0], x[1]),
+        )[:limit]
+        return [self._hit(row_id, score, doc_hits) for score, row_id in ranked]
+
+    def _hit(self, row_id: int, score: float, doc_hits: Dict[int, Dict[int, List[int]]]) -> SearchHit:
+        n_fields = len(self.fields)
+        best_doc, best_positions = None, []
+        for field_no in range(n_fields):
+            doc = row_id * n_fields + field_no
+            by_term = doc_hits.get(doc)
+            if not by_term:
+                continue
+            positions = sorted({p for ps in by_term.values() for p in ps})
+            if best_doc is None or (len(by_term), len(positions)) > (len(doc_hits[best_doc]), len(best_positions)):
+                best_doc, best_positions = doc, positions
+        offsets = self._offsets[best_doc]
+        highlights = tuple((offsets[2 * p], offsets[2 * p + 1]) for p in best_positions)
+        field = self.fields[best_doc % n_fields]
+        text_len = len(self.store.value(row_id, field))
+        start = max(0, highlights[0][0] - SNIPPET_LEAD)
+        end = min(text_len, start + SNIPPET_CHARS)
+        return SearchHit(row_id, score, field, (start, end), highlights)
+
+    def snippet(self, hit: SearchHit, mark: Tuple[str, str] = ("[", "]")) -> str:
+        """The snippet text of a hit with matched tokens wrapped in `mark`."""
+        text = self.store.value(hit.row_id, hit.field)
+        start, end = hit.snippet
+        parts, cursor = [], start
+        for h_start, h_end in hit.highlights:
+            if h_start < cursor or h_end > end:
+                continue
+            parts.append(text[cursor:h_start])
+            parts.append(mark[0] + text[h_start:h_end] + mark[1])
+            cursor = h_end
+        parts.append(text[cursor:end])
+        prefix = "…" if start > 0 else ""
+        suffix = "…" if end < len(text) else ""
+        return prefix + "".join(parts) + suffix
+
+
+def get_fulltext_index(fold_matras: bool = True, fold_anusvara: bool = True) -> FullTextIndex:
+    """The full-text index over `get_shlokas()`, built once per data version and options."""
+    key = (shlokas.content_hash(), fold_matras, fold_anusvara)
+    index = _INDEXES.get(key)
+    if index is None:
+        for stale in [k for k in _INDEXES if k[0] != key[0]]:
+            del _INDEXES[stale]
+        index = _INDEXES[key] = FullTextIndex(
+            get_shlokas(), fold_matras=fold_matras, fold_anusvara=fold_anusvara)
+    return index
+
+
+@cached_query("fulltext")
+def search(query: str, limit: int = 10, prefix: bool = True) -> List[SearchHit]:
+    """
+    `get_fulltext_index().search()` behind the query cache.
+
+    A query without hits is retried once with its misspelled words corrected
+    (search.spelling).
+    """
+    index = get_fulltext_index()
+    hits = index.search(query, limit, prefix)
+    if not hits:
+        corrected = correct_query(query)
+        if corrected != query:
+            hits = index.search(corrected, limit, prefix)
+    return hits
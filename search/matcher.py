@@ -0,0 +1,278 @@
+# search/matcher.py
+"""
+"Describe your problem" matcher: free text -> best problem sections and verses.
+
+Two BM25 document sets are built over the flattened corpus:
+
+  sections  one document per problem title: the title (weighted up) plus the
+            meaning / explanation / example text of all its verses
+  verses    one document per record: its title (weighted up) plus its own
+            meaning / explanation / example text
+
+Each set is stored as a sparse term x document matrix in CSC form (one array of
+document ids and one array of BM25 weights per term; see `SparseMatrix`).
+Scoring a query is the sparse product of its term vector with that matrix: only
+the postings of the query's own terms are touched. `SparseMatrix.dot_batch`
+scores many queries with one pass over each distinct term's postings.
+
+Terms are the `word_keys()` of search.ngram, so Hindi, Hinglish and IAST
+complaints all land on the same vocabulary. A Devanagari query word none of
+whose keys is in the vocabulary also gets the keys of its spelling correction
+(search.spelling); Latin-script words are never corrected. A key still missing
+from the vocabulary is mapped to its closest words through the trigram index.
+"""
+
+import heapq
+import math
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+try:
+    from data import shlokas
+    from data.corpus_view import get_shlokas
+    from data.records import ShlokaStore
+except ModuleNotFoundError:
+    import shlokas
+    from corpus_view import get_shlokas
+    from records import ShlokaStore
+
+from search.cache import cached_query
+from search.devanagari import iter_tokens
+from search.ngram import TITLE_WEIGHT, get_ngram_index, query_key, word_keys
+from search.spelling import correct_word
+
+MATCH_FIELDS = ("meaning", "explanation", "example")
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Similarity a fuzzy replacement for an unknown query word must reach.
+FUZZY_SIMILARITY = 0.75
+FUZZY_EXPANSIONS = 3
+
+# Very common Hindi / Hinglish words that carry no meaning for matching.
+STOPWORDS = frozenset(k for w in (
+    "है हैं था थे थी हो होता होती होते के का की को में से पर और या भी एक यह ये वह वो "
+    "जो तो ही न नहीं कि जब तब मैं मुझे मेरा मेरी हम आप तुम अपने अपना अपनी इस उस कर करना "
+    "hai hain tha the ho hota hoti ke ka ki ko me mein se par aur ya bhi ek yeh ye woh vo "
+    "jo to hi na nahi ki jab tab main mujhe mera meri hum aap tum apne apna apni is us kar karna "
+    "i me my am is are the a an to of and in it very so"
+).split() for k in word_keys(w))
+
+Vector = Dict[int, float]
+
+_MATCHERS: Dict[bytes, "ProblemMatcher"] = {}
+
+
+class SectionMatch(NamedTuple):
+    problem: str
+    score: float
+    row_ids: Tuple[int, ...]      # records of this section, best match first
+
+
+class VerseMatch(NamedTuple):
+    row_id: int
+    score: float
+
+
+class SparseMatrix:
+    """
+    Term x document matrix in compressed sparse column-by-term form.
+
+    `docs[t]` / `weights[t]` are parallel arrays holding the non-zero entries of
+    term t. Products with a query vector only visit the query terms' columns.
+    """
+
+    def __init__(self, n_docs: int, columns: Sequence[Dict[int, float]]):
+        self.n_docs = n_docs
+        self.docs = [array("I", sorted(col)) for col in columns]
+        self.weights = [array("f", (col[d] for d in sorted(col))) for col in columns]
+
+    def nnz(self) -> int:
+        return sum(len(d) for d in self.docs)
+
+    def dot(self, query: Vector) -> List[float]:
+        """Scores of every document for one query vector."""
+        scores = [0.0] * self.n_docs
+        for term, q in query.items():
+            for d, w in zip(self.docs[term], self.weights[term]):
+                scores[d] += q * w
+        return scores
+
+    def dot_batch(self, queries: Sequence[Vector]) -> List[Dict[int, float]]:
+        """
+        Sparse scores ({doc: score}, non-zero only) for a batch of query vectors.
+
+        Queries are grouped by term, so each distinct term's postings are read
+        once per batch however many queries contain it.
+        """
+        by_term: Dict[int, List[Tuple[int, float]]] = {}
+        for qi, query in enumerate(queries):
+            for term, q in query.items():
+                by_term.setdefault(term, []).append((qi, q))
+        results: List[Dict[int, float]] = [{} for _ in queries]
+        for term, users in by_term.items():
+            column = list(zip(self.docs[term], self.weights[term]))
+            for qi, q in users:
+                acc = results[qi]
+                for d, w in column:
+                    acc[d] = acc.get(d, 0.0) + q * w
+        return results
+
+
+def top_k(scores: Iterable[Tuple[int, float]], k: int) -> List[Tuple[int, float]]:
+    """The k (doc, score) pairs with the highest positive score, best first."""
+    return heapq.nlargest(k, ((d, s) for d, s in scores if s > 0), key=lambda x: (x[1], -x[0]))
+
+
+class ProblemMatcher:
+    """BM25 matcher from free text to problem sections and verses."""
+
+    def __init__(self, store: ShlokaStore):
+        self.store = store
+        self.vocab: Dict[str, int] = {}
+
+        problems = store.column("problem")
+        self.problems: List[str] = list(dict.fromkeys(problems))
+        section_of = {p: i for i, p in enumerate(self.problems)}
+        self.section_rows: List[List[int]] = [[] for _ in self.problems]
+        for row_id, problem in enumerate(problems):
+            self.section_rows[section_of[problem]].append(row_id)
+
+        verse_tf: List[Dict[int, float]] = []
+        columns = [store.column(f) for f in MATCH_FIELDS]
+        for row_id in range(len(store)):
+            tf: Dict[int, float] = {}
+            self._count(problems[row_id], TITLE_WEIGHT, tf)
+            for column in columns:
+                self._count(column[row_id], 1.0, tf)
+            verse_tf.append(tf)
+
+        section_tf: List[Dict[int, float]] = []
+        for s, rows in enumerate(self.section_rows):
+            tf = {}
+            self._count(self.problems[s], TITLE_WEIGHT * max(1, len(rows)) ** 0.5, tf)
+            for row_id in rows:
+                for term, n in verse_tf[row_id].items():
+                    tf[term] = tf.get(term, 0.0) + n
+            section_tf.append(tf)
+
+        self.verses = self._bm25(verse_tf)
+        self.sections = self._bm25(section_tf)
+
+    def _count(self, text: str, weight: float, tf: Dict[int, float]) -> None:
+        for _s, _e, raw in iter_tokens(text):
+            for key in word_keys(raw):
+                if key in STOPWORDS:
+                    continue
+                term = self.vocab.get(key)
+                if term is None:
+                    term = self.vocab[key] = len(self.vocab)
+                tf[term] = tf.get(term, 0.0) + weight
+
+    def _bm25(self, doc_tf: List[Dict[int, float]]) -> SparseMatrix:
+        n_docs = len(doc_tf)
+        lengths = [sum(tf.values()) for tf in doc_tf]
+        avg_len = max(sum(lengths) / max(n_docs, 1), 1.0)
+        df = [0] * len(self.vocab)
+        for tf in doc_tf:
+            for term in tf:
+                df[term] += 1
+        columns: List[Dict[int, float]] = [{} for _ in self.vocab]
+        for d, tf in enumerate(doc_tf):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[d] / avg_len)
+            for term, n in tf.items():
+                idf = math.log(1 + (n_docs - df[term] + 0.5) / (df[term] + 0.5))
+                columns[term][d] = idf * n * (BM25_K1 + 1) / (n + norm)
+        return SparseMatrix(n_docs, columns)
+
+    def query_vector(self, text: str) -> Vector:
+        """Sparse term vector of a free-text query (unknown words fuzzily mapped)."""
+        vector: Vector = {}
+        corpus = self.store is get_shlokas()
+        for _s, _e, raw in iter_tokens(text):
+            keys = [key for key in word_keys(raw) if key not in STOPWORDS]
+            if corpus and keys and not any(key in self.vocab for key in keys):
+                fixed = correct_word(raw)
+                if fixed != raw:
+                    keys = list(dict.fromkeys([k for k in word_keys(fixed) if k not in STOPWORDS] + keys))
+            for key in keys:
+                term = self.vocab.get(key)
+                if term is not None:
+                    vector[term] = vector.get(term, 0.0) + 1.0
+                    continue
+                for term, sim in self._fuzzy(key):
+                    vector[term] = max(vector.get(term, 0.0), sim)
+        return vector
+
+    def _fuzzy(self, key: str) -> List[Tuple[int, float]]:
+        ngram = get_ngram_index() if self.store is get_shlokas() else None
+        if ngram is None:
+            return []
+        found = []
+        for wid, sim in ngram.similar_words(key):
+            if sim < FUZZY_SIMILARITY:
+                break
+            term = self.vocab.get(ngram.words[wid])
+            if term is not None:
+                found.append((term, sim))
+                if len(found) == FUZZY_EXPANSIONS:
+                    break
+        return found
+
+    def sections_for(self, vector: Vector, k: int = 3, verse_scores: Sequence[float] = ()) -> List[SectionMatch]:
+        scores = self.sections.dot(vector)
+        result = []
+        for s, score in top_k(enumerate(scores), k):
+            rows = self.section_rows[s]
+            if verse_scores:
+                rows = sorted(rows, key=lambda r: -verse_scores[r])
+            result.append(SectionMatch(self.problems[s], score, tuple(rows)))
+        return result
+
+    def match_sections(self, text: str, k: int = 3) -> List[SectionMatch]:
+        """Top-k problem sections for a complaint, with their verses best first."""
+        vector = self.query_vector(text)
+        return self.sections_for(vector, k, self.verses.dot(vector))
+
+    def match_verses(self, text: str, k: int = 5) -> List[VerseMatch]:
+        """Top-k individual verses for a complaint."""
+        scores = self.verses.dot(self.query_vector(text))
+        return [VerseMatch(r, s) for r, s in top_k(enumerate(scores), k)]
+
+    def match_batch(self, texts: Sequence[str], k_sections: int = 3,
+                    k_verses: int = 5) -> List[Tuple[List[SectionMatch], List[VerseMatch]]]:
+        """(sections, verses) for each text, scored with one product per matrix."""
+        vectors = [self.query_vector(t) for t in texts]
+        verse_scores = self.verses.dot_batch(vectors)
+        section_scores = self.sections.dot_batch(vectors)
+        results = []
+        for verses, sections in zip(verse_scores, section_scores):
+            ranked_sections = []
+            for s, score in top_k(sections.items(), k_sections):
+                rows = sorted(self.section_rows[s], key=lambda r: -verses.get(r, 0.0))
+                ranked_sections.append(SectionMatch(self.problems[s], score, tuple(rows)))
+            results.append((ranked_sections, [VerseMatch(r, v) for r, v in top_k(verses.items(), k_verses)]))
+        return results
+
+
+def get_matcher() -> ProblemMatcher:
+    """The matcher over `get_shlokas()`, built once per data version."""
+    key = shlokas.content_hash()
+    matcher = _MATCHERS.get(key)
+    if matcher is None:
+        _MATCHERS.clear()
+        matcher = _MATCHERS[key] = ProblemMatcher(get_shlokas())
+    return matcher
+
+
+@cached_query("match_sections", normalizer=query_key)
+def match_sections(text: str, k: int = 3) -> List[SectionMatch]:
+    """`get_matcher().match_sections()` behind the query cache."""
+    return get_matcher().match_sections(text, k)
+
+
+@cached_query("match_verses", normalizer=query_key)
+def match_verses(text: str, k: int = 5) -> List[VerseMatch]:
+    """`get_matcher().match_verses()` behind the query cache."""
+    return get_matcher().match_verses(text, k)
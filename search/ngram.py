@@ -0,0 +1,210 @@
+# search/ngram.py
+"""
+Script-tolerant character n-gram search over the flattened corpus.
+
+At build time every record's problem title and text fields are romanized once
+(search.translit) and kept in `NgramIndex.romanized`. The vocabulary is the set
+of distinct words of those records in two forms: the `phonetic_key()` of each
+romanized word and the folded Devanagari token. Each vocabulary word is split
+into padded character trigrams, and the index maps trigram -> words and
+word -> records.
+
+A query word, typed in Devanagari, Hinglish, ITRANS or IAST, is reduced the same
+way. Vocabulary words that contain enough of its trigrams are its matches, so
+"krodh", "krodha" and क्रोध all find क्रोधाद्, and misspellings still overlap
+on most trigrams. A query only looks at the postings of its own trigrams and
+never scans the corpus.
+"""
+
+import functools
+import math
+from array import array
+from typing import Dict, List, NamedTuple, Sequence, Set, Tuple
+
+try:
+    from data import shlokas
+    from data.corpus_view import get_shlokas
+    from data.records import ShlokaStore
+except ModuleNotFoundError:
+    import shlokas
+    from corpus_view import get_shlokas
+    from records import ShlokaStore
+
+from search.cache import cached_query
+from search.devanagari import iter_tokens, normalize
+from search.fulltext import SEARCH_FIELDS
+from search.translit import has_devanagari, phonetic_key, romanize
+
+NGRAM_FIELDS = ("problem",) + SEARCH_FIELDS
+N = 3
+
+# A vocabulary word matches a query word when it contains at least this share
+# of the query word's trigrams.
+MIN_SIMILARITY = 0.6
+
+# A word in the problem title counts this many times as much as one in the text.
+TITLE_WEIGHT = 3.0
+
+# Distinct raw tokens whose keys are remembered (see word_keys).
+WORD_KEYS_CACHE_SIZE = 1 << 17
+
+# Version of the keys word_keys() gives a token (with search.devanagari's
+# tokens and folds and search.translit's romanization). Bump it with any change
+# there that alters a key, so that tables stored with those keys are rebuilt.
+TOKENIZER_VERSION = 1
+
+_INDEXES: Dict[bytes, "NgramIndex"] = {}
+
+
+class NgramHit(NamedTuple):
+    row_id: int
+    score: float
+    matched: Tuple[str, ...]   # vocabulary words that matched, best first
+
+
+def ngrams(word: str, n: int = N) -> Set[str]:
+    """Distinct padded character n-grams of `word`."""
+    padded = f" {word} "
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+@functools.lru_cache(maxsize=WORD_KEYS_CACHE_SIZE)
+def word_keys(raw: str) -> Tuple[str, ...]:
+    """
+    Index / query keys of one raw token: phonetic key, plus folded Devanagari.
+
+    Memoized per spelling: every index build (ngram, matcher, web index, ANN,
+    related) reduces the same few thousand distinct tokens over and over.
+    """
+    keys = []
+    key = phonetic_key(raw)
+    if key:
+        keys.append(key)
+    if has_devanagari(raw):
+        folded = normalize(raw, fold_matras=True, fold_anusvara=True)
+        if folded and folded not in keys:
+            keys.append(folded)
+    return tuple(keys)
+
+
+def query_key(query: str) -> str:
+    """Cache key of a query for searches over word_keys(): the keys of each token."""
+    return " ".join(filter(None, ("/".join(word_keys(raw)) for _s, _e, raw in iter_tokens(query))))
+
+
+class NgramIndex:
+    """Trigram index over romanized + Devanagari vocabulary of the corpus."""
+
+    def __init__(self, store: ShlokaStore, fields: Sequence[str] = NGRAM_FIELDS, n: int = N):
+        self.store = store
+        self.fields = tuple(fields)
+        self.n = n
+        self.romanized: List[str] = []
+
+        vocab: Dict[str, int] = {}
+        rows_of: List[Dict[int, float]] = []   # word -> {row: weighted term frequency}
+        columns = [store.column(f) for f in self.fields]
+        for row_id in range(len(store)):
+            texts = [c[row_id] for c in columns]
+            self.romanized.append(" | ".join(romanize(t) for t in texts))
+            for field, text in zip(self.fields, texts):
+                tf = TITLE_WEIGHT if field == "problem" else 1.0
+                for _s, _e, raw in iter_tokens(text):
+                    for key in word_keys(raw):
+                        wid = vocab.get(key)
+                        if wid is None:
+                            wid = vocab[key] = len(rows_of)
+                            rows_of.append({})
+                        rows_of[wid][row_id] = rows_of[wid].get(row_id, 0.0) + tf
+
+        self.words: List[str] = [""] * len(vocab)
+        for word, wid in vocab.items():
+            self.words[wid] = word
+        self._word_rows = [array("I", sorted(rows)) for rows in rows_of]
+        self._word_tf = [array("f", (1 + math.log(rows[r]) for r in sorted(rows))) for rows in rows_of]
+        self._gram_count = array("I")
+        grams: Dict[str, List[int]] = {}
+        for wid, word in enumerate(self.words):
+            word_grams = ngrams(word, n)
+            self._gram_count.append(len(word_grams))
+            for g in word_grams:
+                grams.setdefault(g, []).append(wid)
+        self._grams = {g: array("I", wids) for g, wids in grams.items()}
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def similar_words(self, key: str) -> List[Tuple[int, float]]:
+        """(word_id, similarity) of vocabulary words matching one query key."""
+        query_grams = ngrams(key, self.n)
+        overlap: Dict[int, int] = {}
+        for g in query_grams:
+            for wid in self._grams.get(g, ()):
+                overlap[wid] = overlap.get(wid, 0) + 1
+        q = len(query_grams)
+        result = []
+        for wid, common in overlap.items():
+            containment = common / q
+            if containment < MIN_SIMILARITY:
+                continue
+            w = self._gram_count[wid]
+            closeness = min(q, w) / max(q, w)
+            result.append((wid, containment * (0.7 + 0.3 * closeness)))
+        result.sort(key=lambda x: -x[1])
+        return result
+
+    def search(self, query: str, limit: int = 10) -> List[NgramHit]:
+        """Ranked records for a query in any script."""
+        query_words = [word_keys(raw) for _s, _e, raw in iter_tokens(query)]
+        query_words = [keys for keys in query_words if keys]
+        if not query_words:
+            return []
+
+        scores: Dict[int, float] = {}
+        coverage: Dict[int, int] = {}
+        matched: Dict[int, Dict[str, float]] = {}
+        for keys in query_words:
+            # Best-matching vocabulary word per record; the query word's idf is
+            # taken over every record it matched, so an exact match always
+            # beats a rarer near-match.
+            best: Dict[int, Tuple[float, int]] = {}
+            for key in keys:
+                for wid, sim in self.similar_words(key):
+                    for row_id, tf in zip(self._word_rows[wid], self._word_tf[wid]):
+                        if row_id not in best or sim * tf > best[row_id][0]:
+                            best[row_id] = (sim * tf, wid)
+            if not best:
+                continue
+            idf = math.log(1 + len(self.store) / len(best))
+            for row_id, (sim_tf, wid) in best.items():
+                weight = sim_tf * idf
+                scores[row_id] = scores.get(row_id, 0.0) + weight
+                coverage[row_id] = coverage.get(row_id, 0) + 1
+                matched.setdefault(row_id, {})[self.words[wid]] = weight
+
+        ranked = sorted(
+            ((score * coverage[row_id] / len(query_words), row_id) for row_id, score in scores.items()),
+            key=lambda x: (-x[0], x[1]),
+        )[:limit]
+        return [
+            NgramHit(row_id, score, tuple(w for w, _ in sorted(matched[row_id].items(), key=lambda x: -x[1])))
+            for score, row_id in ranked
+        ]
+
+
+def get_ngram_index() -> NgramIndex:
+    """The n-gram index over `get_shlokas()`, built once per data version."""
+    key = shlokas.content_hash()
+    index = _INDEXES.get(key)
+    if index is None:
+        _INDEXES.clear()
+        index = _INDEXES[key] = NgramIndex(get_shlokas())
+    return index
+
+
+@cached_query("ngram", normalizer=query_key)
+def search(query: str, limit: int = 10) -> List[NgramHit]:
+    """`get_ngram_index().search()` behind the query cache."""
+    return get_ngram_index().search(query, limit)
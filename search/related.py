@@ -0,0 +1,257 @@
+# search/related.py
+"""
+Precomputed "related shlokas": the top-k most similar records of every record.
+
+Similarity of two records combines
+
+  - text similarity: cosine of their TF-IDF vectors over the verse text fields
+    (word_keys terms, so Sanskrit, Hindi and romanized spellings agree)
+  - co-citation: both are filed under the same problem title
+  - a shared (chapter, verse): the same verse cited under another problem,
+    including verse ranges ("2.13-14" shares 2.13)
+
+Text similarity is computed block by block: a block of record vectors is
+multiplied with the sparse term x record matrix (SparseMatrix.dot_batch), and
+each row keeps only its top k before the next block is scored. No N x N matrix
+is ever built. The work per record is bounded by pruning the vectors:
+
+  - terms of a single record can't make any pair similar
+  - common terms (in more than MAX_DF_SHARE of the records, or in more than
+    MAX_POSTINGS of them; never fewer than MIN_MAX_DF) say little about
+    similarity but would make every product dense
+  - each vector keeps only its MAX_TERMS strongest terms
+
+so one record touches at most MAX_TERMS x MAX_POSTINGS accumulators, however
+large the corpus is.
+
+The table is a flat array of N x k row ids (-1 padded), so the neighbours of a
+record are one slice. At build time, `get_related()` (generate_html.py) keeps
+it in `RELATED_PATH`, next to the generated page assets, so the app ships with
+it precomputed. The file is tagged with a hash of the corpus content, of the
+parameters above and of the tokenizer version (`cache_key()`), and is
+recomputed only when one of them changes. The app only reads it
+(`load_related()`) and never builds it.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import os
+import struct
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+try:
+    from data import shlokas
+    from data.corpus_view import get_shlokas
+    from data.index import expand_ref, ref_key
+    from data.records import ShlokaStore
+except ModuleNotFoundError:
+    import shlokas
+    from corpus_view import get_shlokas
+    from index import expand_ref, ref_key
+    from records import ShlokaStore
+
+from search.devanagari import iter_tokens
+from search.fulltext import SEARCH_FIELDS
+from search.matcher import SparseMatrix
+from search.ngram import TOKENIZER_VERSION, word_keys
+from utils.files import write_if_changed
+
+RELATED_K = 5
+BLOCK_SIZE = 256
+MAX_DF_SHARE = 0.02
+MAX_POSTINGS = 128
+MIN_MAX_DF = 8
+MAX_TERMS = 32
+
+TEXT_WEIGHT = 1.0
+PROBLEM_WEIGHT = 0.25
+REF_WEIGHT = 0.5
+
+RELATED_FILENAME = "gita_related.bin"
+RELATED_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "android", "app", "src", "main", "assets", "html", RELATED_FILENAME,
+)
+MAGIC = b"GREL"
+VERSION = 2
+_HEADER = struct.Struct("<4sIII32s")   # magic, version, n_rows, k, cache key
+
+_TABLES: Dict[bytes, "RelatedTable"] = {}
+
+
+def cache_key(content_hash: bytes, k: int = RELATED_K) -> bytes:
+    """sha256 of the corpus content hash and every parameter (and tokenizer) the table depends on."""
+    params = {
+        "version": VERSION, "tokenizer": TOKENIZER_VERSION, "k": k, "fields": list(SEARCH_FIELDS),
+        "max_df_share": MAX_DF_SHARE, "max_postings": MAX_POSTINGS,
+        "min_max_df": MIN_MAX_DF, "max_terms": MAX_TERMS,
+        "weights": [TEXT_WEIGHT, PROBLEM_WEIGHT, REF_WEIGHT],
+    }
+    return hashlib.sha256(content_hash + json.dumps(params, sort_keys=True).encode("ascii")).digest()
+
+
+def text_vectors(store: ShlokaStore, fields: Sequence[str] = SEARCH_FIELDS) -> List[Dict[int, float]]:
+    """L2-normalized TF-IDF vector ({term: weight}) of every record, pruned as described above."""
+    vocab: Dict[str, int] = {}
+    counts: List[Dict[int, int]] = []
+    columns = [store.column(f) for f in fields]
+    for row_id in range(len(store)):
+        tf: Dict[int, int] = {}
+        for column in columns:
+            for _s, _e, raw in iter_tokens(column[row_id]):
+                for key in word_keys(raw):
+                    term = vocab.setdefault(key, len(vocab))
+                    tf[term] = tf.get(term, 0) + 1
+        counts.append(tf)
+
+    n = len(store)
+    df = [0] * len(vocab)
+    for tf in counts:
+        for term in tf:
+            df[term] += 1
+    max_df = max(MIN_MAX_DF, min(MAX_DF_SHARE * n, MAX_POSTINGS))
+
+    vectors = []
+    for tf in counts:
+        vector = {
+            term: (1 + math.log(c)) * math.log(n / df[term])
+            for term, c in tf.items() if 1 < df[term] <= max_df
+        }
+        if len(vector) > MAX_TERMS:
+            vector = dict(heapq.nlargest(MAX_TERMS, vector.items(), key=lambda x: (x[1], -x[0])))
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        vectors.append({t: w / norm for t, w in vector.items()} if norm else {})
+    return vectors
+
+
+class RelatedTable:
+    """Top-k related record ids (and scores) of every record."""
+
+    def __init__(self, k: int, rows: array, scores: array):
+        self.k = k
+        self.rows = rows
+        self.scores = scores
+
+    def __len__(self) -> int:
+        return len(self.rows) // self.k if self.k else 0
+
+    def neighbours(self, row_id: int) -> List[int]:
+        """Related row ids of `row_id`, most similar first."""
+        start = row_id * self.k
+        return [r for r in self.rows[start:start + self.k] if r >= 0]
+
+    def as_lists(self) -> List[List[int]]:
+        return [self.neighbours(i) for i in range(len(self))]
+
+    @classmethod
+    def build(cls, store: ShlokaStore, k: int = RELATED_K, block_size: int = BLOCK_SIZE) -> "RelatedTable":
+        n = len(store)
+        vectors = text_vectors(store)
+        n_terms = 1 + max((t for v in vectors for t in v), default=-1)
+        columns: List[Dict[int, float]] = [{} for _ in range(n_terms)]
+        for row_id, vector in enumerate(vectors):
+            for term, w in vector.items():
+                columns[term][row_id] = w
+        matrix = SparseMatrix(n, columns)
+        del columns
+
+        problems = store.column("problem")
+        by_problem: Dict[str, List[int]] = {}
+        for row_id, problem in enumerate(problems):
+            by_problem.setdefault(problem, []).append(row_id)
+        row_refs = []
+        by_ref: Dict[tuple, List[int]] = {}
+        for row_id, (chapter, verse) in enumerate(zip(store.column("chapter"), store.column("verse"))):
+            keys = expand_ref(ref_key(chapter, verse)) if chapter != "" else []
+            row_refs.append(keys)
+            for key in keys:
+                by_ref.setdefault(key, []).append(row_id)
+
+        rows = array("i", [-1]) * (n * k)
+        scores = array("f", [0.0]) * (n * k)
+        for start in range(0, n, block_size):
+            block = vectors[start:start + block_size]
+            for offset, sims in enumerate(matrix.dot_batch(block)):
+                row_id = start + offset
+                combined = {r: TEXT_WEIGHT * s for r, s in sims.items()}
+                for r in by_problem[problems[row_id]]:
+                    combined[r] = combined.get(r, 0.0) + PROBLEM_WEIGHT
+                shared = {r for key in row_refs[row_id] for r in by_ref[key]}
+                for r in shared:
+                    combined[r] = combined.get(r, 0.0) + REF_WEIGHT
+                combined.pop(row_id, None)
+                best = heapq.nlargest(k, combined.items(), key=lambda x: (x[1], -x[0]))
+                for j, (r, s) in enumerate(best):
+                    rows[row_id * k + j] = r
+                    scores[row_id * k + j] = s
+        return cls(k, rows, scores)
+
+    def to_bytes(self, key: bytes) -> bytes:
+        return (_HEADER.pack(MAGIC, VERSION, len(self), self.k, key)
+                + self.rows.tobytes() + self.scores.tobytes())
+
+    @classmethod
+    def from_bytes(cls, data: bytes, key: Optional[bytes] = None) -> Optional["RelatedTable"]:
+        """Decode a stored table; None if it is malformed or was built for another cache_key()."""
+        if len(data) < _HEADER.size:
+            return None
+        magic, version, n, k, stored_key = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION or (key is not None and stored_key != key):
+            return None
+        rows, scores = array("i"), array("f")
+        size = n * k * rows.itemsize
+        if len(data) != _HEADER.size + 2 * size:
+            return None
+        rows.frombytes(data[_HEADER.size:_HEADER.size + size])
+        scores.frombytes(data[_HEADER.size + size:])
+        return cls(k, rows, scores)
+
+
+def _load(path: str, key: bytes) -> Optional[RelatedTable]:
+    try:
+        with open(path, "rb") as f:
+            return RelatedTable.from_bytes(f.read(), key)
+    except OSError:
+        return None
+
+
+def _save(table: RelatedTable, path: str, key: bytes) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_if_changed(path, table.to_bytes(key))
+    except OSError:
+        pass
+
+
+def load_related(path: str = RELATED_PATH) -> Optional[RelatedTable]:
+    """
+    The related table for `get_shlokas()` as shipped at `path`, or None when it
+    is missing or stale. Read-only: the app calls this and never builds.
+    """
+    key = cache_key(shlokas.content_hash(), RELATED_K)
+    table = _TABLES.get(key)
+    if table is None:
+        table = _load(path, key)
+        if table is None or table.k != RELATED_K or len(table) != len(get_shlokas()):
+            return None
+        _TABLES.clear()
+        _TABLES[key] = table
+    return table
+
+
+def get_related(path: str = RELATED_PATH) -> RelatedTable:
+    """
+    The related table for `get_shlokas()`, read from `path` or built and saved
+    there when it is missing or stale. Build time only (generate_html.py).
+    """
+    table = load_related(path)
+    if table is None:
+        key = cache_key(shlokas.content_hash(), RELATED_K)
+        table = RelatedTable.build(get_shlokas(), RELATED_K)
+        _save(table, path, key)
+        _TABLES.clear()
+        _TABLES[key] = table
+    return table
@@ -0,0 +1,144 @@
+// search/search_worker.js
+// Web Worker that answers search queries for the generated page.
+//
+// The page inlines this file and starts it from a Blob URL, then posts
+//   {type: "load", b64: GITA_SEARCH_INDEX}    once, and
+//   {type: "query", id, query, limit}         per keystroke.
+// The worker replies {type: "ready", terms} and {type: "results", id, hits}
+// where hits is [{i: row index into SHLOKAS, s: score}, ...], best first.
+//
+// The binary layout and the query normalization mirror search/web_index.py,
+// search/devanagari.py (normalize, folds on) and search/translit.py
+// (phonetic_key for Latin-script words).
+
+var idx = null;
+
+var TOKEN_RE = /[0-9A-Za-z\u00c0-\u024f\u1e00-\u1eff\u0900-\u0963\u0966-\u097f\u200c\u200d]+/g;
+var DEVANAGARI_RE = /[\u0900-\u0963\u0966-\u097f]/;
+var PREFIX_WEIGHT = 0.7;
+var MAX_PREFIX_EXPANSIONS = 32;
+
+function loadIndex(b64){
+    var bin = atob(b64);
+    var bytes = new Uint8Array(bin.length);
+    for(var i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+    var view = new DataView(bytes.buffer);
+    var magic = String.fromCharCode(bytes[0], bytes[1], bytes[2], bytes[3]);
+    if(magic !== "GSIX" || view.getUint32(4, true) !== 1) throw new Error("bad search index");
+    var nTerms = view.getUint32(8, true);
+    var nPostings = view.getUint32(16, true);
+    var vocabLen = view.getUint32(20, true);
+    var streamLen = view.getUint32(24, true);
+    var pos = 32;
+    var byteOffsets = new Uint32Array(bytes.buffer, pos, nTerms + 1); pos += 4 * (nTerms + 1);
+    var countOffsets = new Uint32Array(bytes.buffer, pos, nTerms + 1); pos += 4 * (nTerms + 1);
+    var weights = new Uint8Array(bytes.buffer, pos, nPostings); pos += nPostings;
+    var stream = new Uint8Array(bytes.buffer, pos, streamLen); pos += streamLen;
+    var vocab = nTerms ? new TextDecoder("utf-8").decode(new Uint8Array(bytes.buffer, pos, vocabLen)).split("\n") : [];
+    return {nTerms: nTerms, byteOffsets: byteOffsets, countOffsets: countOffsets,
+            weights: weights, stream: stream, vocab: vocab};
+}
+
+function normalizeDevanagari(t){
+    t = t.normalize("NFD").replace(/\u093c/g, "").replace(/[\u200c\u200d]/g, "");
+    t = t.normalize("NFC").toLowerCase();
+    t = t.replace(/\u0940/g, "\u093f").replace(/\u0942/g, "\u0941")
+         .replace(/\u0908/g, "\u0907").replace(/\u090a/g, "\u0909");
+    t = t.replace(/[\u0919\u091e\u0923\u0928\u092e]\u094d(?=[\u0915-\u0939])/g, "\u0902");
+    return t.replace(/[\u0901\u0902]/g, "");
+}
+
+var IAST = {"\u1e5b": "ri", "\u1e5d": "ri", "\u0157": "ri", "\u1e37": "li", "\u1e39": "li",
+            "\u1e43": "n", "\u1e41": "n", "\u1e25": "h", "\u015b": "sh", "\u1e63": "sh"};
+var PHONETIC_SUBS = [["chh", "c"], ["ch", "c"], ["sh", "s"], ["ph", "f"], ["w", "v"], ["z", "j"],
+                     ["q", "k"], ["x", "ks"], ["ee", "i"], ["oo", "u"], ["ai", "e"], ["au", "o"]];
+
+function phoneticKey(w){
+    w = w.toLowerCase().replace(/[\u1e5b\u1e5d\u0157\u1e37\u1e39\u1e43\u1e41\u1e25\u015b\u1e63]/g,
+                                function(c){ return IAST[c]; });
+    w = w.normalize("NFD").replace(/[\u0300-\u036f]/g, "").replace(/[^a-z0-9]/g, "");
+    for(var i = 0; i < PHONETIC_SUBS.length; i++) w = w.split(PHONETIC_SUBS[i][0]).join(PHONETIC_SUBS[i][1]);
+    w = w.replace(/([bcdgjkptr])h/g, "$1").replace(/(.)\1+/g, "$1");
+    if(w.length > 2 && w.charAt(w.length - 1) === "a") w = w.slice(0, -1);
+    return w;
+}
+
+function queryKeys(query){
+    var keys = [];
+    var m = query.match(TOKEN_RE) || [];
+    for(var i = 0; i < m.length; i++){
+        var k = DEVANAGARI_RE.test(m[i]) ? normalizeDevanagari(m[i]) : phoneticKey(m[i]);
+        if(k) keys.push(k);
+    }
+    return keys;
+}
+
+function lowerBound(term){
+    var lo = 0, hi = idx.vocab.length;
+    while(lo < hi){
+        var mid = (lo + hi) >> 1;
+        if(idx.vocab[mid] < term) lo = mid + 1; else hi = mid;
+    }
+    return lo;
+}
+
+function expand(term, prefix){
+    var out = [];
+    var t = lowerBound(term);
+    if(t < idx.vocab.length && idx.vocab[t] === term) out.push([t, 1.0]);
+    if(prefix){
+        for(var j = t; j < idx.vocab.length && out.length < MAX_PREFIX_EXPANSIONS; j++){
+            if(idx.vocab[j].lastIndexOf(term, 0) !== 0) break;
+            if(idx.vocab[j] !== term) out.push([j, PREFIX_WEIGHT]);
+        }
+    }
+    return out;
+}
+
+function postings(t, weight, best){
+    var s = idx.byteOffsets[t], e = idx.byteOffsets[t + 1], w = idx.countOffsets[t];
+    var row = 0, value = 0, shift = 0;
+    for(var p = s; p < e; p++){
+        var b = idx.stream[p];
+        value |= (b & 0x7f) << shift;
+        shift += 7;
+        if(!(b & 0x80)){
+            row += value;
+            var score = idx.weights[w++] * weight;
+            if(!(row in best) || score > best[row]) best[row] = score;
+            value = 0; shift = 0;
+        }
+    }
+}
+
+function search(query, limit){
+    var keys = queryKeys(query);
+    var scores = {}, coverage = {};
+    for(var q = 0; q < keys.length; q++){
+        var best = {};
+        var terms = expand(keys[q], q === keys.length - 1);
+        for(var k = 0; k < terms.length; k++) postings(terms[k][0], terms[k][1], best);
+        for(var row in best){
+            scores[row] = (scores[row] || 0) + best[row];
+            coverage[row] = (coverage[row] || 0) + 1;
+        }
+    }
+    var hits = [];
+    for(var r in scores) hits.push({i: Number(r), s: scores[r] * coverage[r] / keys.length});
+    hits.sort(function(a, b){ return (b.s - a.s) || (a.i - b.i); });
+    return hits.slice(0, limit);
+}
+
+self.onmessage = function(e){
+    var msg = e.data;
+    try {
+        if(msg.type === "load"){
+            idx = loadIndex(msg.b64);
+            self.postMessage({type: "ready", terms: idx.nTerms});
+        } else if(msg.type === "query" && idx){
+            self.postMessage({type: "results", id: msg.id, hits: search(msg.query, msg.limit || 20)});
+        }
+    } catch(err){
+        self.postMessage({type: "error", id: msg.id, message: String(err)});
+    }
+};
@@ -0,0 +1,207 @@
+# search/spelling.py
+"""
+Spelling correction for query words (symmetric delete, SymSpell style).
+
+Hindi typed on a phone keyboard is full of wrong matras and stray or missing
+halants. Comparing each query word against the whole vocabulary would be far
+too slow, so the vocabulary is indexed once by its deletes: every form of a
+word with up to MAX_DISTANCE units removed maps back to the word. A query word
+generates its own deletes, looks each one up, and only the few words found are
+checked with a real edit distance. A lookup costs the same however large the
+vocabulary is.
+
+The edit unit is the grapheme cluster, not the code point: a letter together
+with its vowel sign, nasal sign and halant (कि, क्, मों). A wrong matra, a
+missing or stray halant (करोध for क्रोध) or a wrong nasal is therefore a single
+edit instead of two. Only the first PREFIX_LENGTH clusters of a word are used
+for deletes, which keeps the index small without losing corrections.
+
+The vocabulary is every normalized Devanagari token (search.devanagari, folds
+on) of the corpus text fields and titles, with its frequency, so that a
+correction picks the most common of the closest words. Latin-script words are
+never corrected: Hinglish and English spellings are matched through their
+phonetic keys instead. `correct_query()` replaces the unknown Devanagari words
+of a query and leaves everything else as typed (fulltext.search retries with
+it); `correct_word()` corrects a single token, which the matcher only asks for
+when none of the token's keys is in its own vocabulary.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    from data import shlokas
+    from data.corpus_view import get_shlokas
+    from data.records import ShlokaStore
+except ModuleNotFoundError:
+    import shlokas
+    from corpus_view import get_shlokas
+    from records import ShlokaStore
+
+from search.devanagari import iter_tokens, normalize
+from search.translit import has_devanagari
+
+SPELLING_FIELDS = ("problem", "text", "meaning", "explanation", "example")
+MAX_DISTANCE = 2
+PREFIX_LENGTH = 7
+# Words of at most NO_CORRECTION clusters are left alone (almost every edit of
+# them is another word); up to SHORT_WORD clusters, one edit is allowed.
+NO_CORRECTION = 2
+SHORT_WORD = 4
+
+# Vowel signs, nasal signs, visarga, nukta and halant extend the preceding letter.
+_MARKS = "\u0900-\u0903\u093a\u093b\u093c\u093e-\u094f\u0951-\u0957\u0962\u0963"
+_CLUSTER_RE = re.compile("[^%s][%s]*|." % (_MARKS, _MARKS), re.S)
+
+_SPELLERS: Dict[bytes, "SpellIndex"] = {}
+
+
+def clusters(word: str) -> Tuple[str, ...]:
+    """Grapheme clusters of a (normalized) word: क्रोध -> ('क्', 'रो', 'ध')."""
+    return tuple(_CLUSTER_RE.findall(word))
+
+
+def _deletes(units: Tuple[str, ...], max_distance: int) -> Set[Tuple[str, ...]]:
+    result = {units}
+    frontier = {units}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for u in frontier:
+            for i in range(len(u)):
+                d = u[:i] + u[i + 1:]
+                if d not in result:
+                    next_frontier.add(d)
+        result |= next_frontier
+        frontier = next_frontier
+    return result
+
+
+def edit_distance(a: Sequence[str], b: Sequence[str], limit: int = MAX_DISTANCE) -> int:
+    """Optimal string alignment distance between unit sequences (limit + 1 if larger)."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2: List[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[-1] if prev[-1] <= limit else limit + 1
+
+
+class SpellIndex:
+    """Symmetric-delete index over a word -> frequency vocabulary."""
+
+    def __init__(self, frequencies: Dict[str, int], max_distance: int = MAX_DISTANCE,
+                 prefix_length: int = PREFIX_LENGTH):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.frequencies = frequencies
+        self.words: List[str] = list(frequencies)
+        self._units = [clusters(w) for w in self.words]
+        self._deletes: Dict[Tuple[str, ...], List[int]] = {}
+        for wid, units in enumerate(self._units):
+            for d in _deletes(units[:prefix_length], max_distance):
+                self._deletes.setdefault(d, []).append(wid)
+
+    @classmethod
+    def from_store(cls, store: ShlokaStore, fields: Iterable[str] = SPELLING_FIELDS) -> "SpellIndex":
+        frequencies: Dict[str, int] = {}
+        for field in fields:
+            for text in store.column(field):
+                for _s, _e, raw in iter_tokens(text):
+                    if not has_devanagari(raw):
+                        continue
+                    term = normalize(raw, fold_matras=True, fold_anusvara=True)
+                    if term:
+                        frequencies[term] = frequencies.get(term, 0) + 1
+        return cls(frequencies)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.frequencies
+
+    def suggestions(self, word: str, max_distance: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        (word, distance) of the closest vocabulary words.
+
+        Ties go to words with the same first letter (rarely mistyped), then to
+        the most frequent.
+        """
+        if word in self.frequencies:
+            return [(word, 0)]
+        units = clusters(word)
+        if len(units) <= NO_CORRECTION:
+            return []
+        if max_distance is None:
+            max_distance = 1 if len(units) <= SHORT_WORD else self.max_distance
+        max_distance = min(max_distance, self.max_distance)
+
+        seen: Set[int] = set()
+        found: List[Tuple[int, bool, int, str]] = []
+        best = max_distance
+        for d in _deletes(units[:self.prefix_length], max_distance):
+            for wid in self._deletes.get(d, ()):
+                if wid in seen:
+                    continue
+                seen.add(wid)
+                dist = edit_distance(units, self._units[wid], best)
+                if dist <= best:
+                    if dist < best:
+                        best = dist
+                        found = [f for f in found if f[0] <= best]
+                    word_units = self._units[wid]
+                    other_start = not word_units or word_units[0][0] != units[0][0]
+                    found.append((dist, other_start, -self.frequencies[self.words[wid]], self.words[wid]))
+        found.sort()
+        return [(w, dist) for dist, _o, _f, w in found]
+
+    def correct(self, word: str) -> str:
+        """The best correction of a normalized word, or the word itself."""
+        found = self.suggestions(word)
+        return found[0][0] if found else word
+
+    def correct_query(self, query: str) -> str:
+        """`query` with every Devanagari word missing from the vocabulary replaced by its correction."""
+        parts = []
+        cursor = 0
+        for start, end, raw in iter_tokens(query):
+            if not has_devanagari(raw):
+                continue
+            term = normalize(raw, fold_matras=True, fold_anusvara=True)
+            if term and term not in self.frequencies:
+                fixed = self.correct(term)
+                if fixed != term:
+                    parts.append(query[cursor:start])
+                    parts.append(fixed)
+                    cursor = end
+        parts.append(query[cursor:])
+        return "".join(parts)
+
+
+def get_speller() -> SpellIndex:
+    """The spelling index over `get_shlokas()`, built once per data version."""
+    key = shlokas.content_hash()
+    speller = _SPELLERS.get(key)
+    if speller is None:
+        _SPELLERS.clear()
+        speller = _SPELLERS[key] = SpellIndex.from_store(get_shlokas())
+    return speller
+
+
+def correct_query(query: str) -> str:
+    return get_speller().correct_query(query)
+
+
+def correct_word(raw: str) -> str:
+    """The correction of one Devanagari token (normalized), or `raw` unchanged."""
+    if not has_devanagari(raw):
+        return raw
+    term = normalize(raw, fold_matras=True, fold_anusvara=True)
+    fixed = get_speller().correct(term) if term else term
+    return fixed if fixed != term else raw
@@ -0,0 +1,142 @@
+# search/translit.py
+"""
+Devanagari -> Latin romanization and a script-neutral phonetic key.
+
+Most users type Hindi in Latin script ("krodh", "dar lagna", "karmanye") and
+mix Hinglish, ITRANS and IAST spellings. Rather than guessing which scheme a
+query uses, both sides are reduced to the same loose `phonetic_key()`:
+
+  - `romanize()` writes Devanagari the way Hinglish is typed: inherent vowels
+    are spelled out and then dropped by Hindi schwa deletion (डर -> "dar",
+    लगना -> "lagnaa", कर्मण्ये -> "karmanye").
+  - `phonetic_key()` folds what the schemes disagree on: IAST diacritics,
+    ITRANS punctuation, vowel length, aspiration, sh/s, ch/c, ph/f, doubled
+    letters and a trailing "a".
+
+Both functions are table driven and allocation-light, and each distinct
+Devanagari word is romanized only once, so romanizing the whole corpus at
+index-build time takes milliseconds.
+"""
+
+import functools
+import re
+import unicodedata
+from typing import List
+
+from search.devanagari import NUKTA, VIRAMA, ANUSVARA, CHANDRABINDU
+
+VISARGA = "\u0903"
+
+_VOWELS = {
+    "अ": "a", "आ": "aa", "इ": "i", "ई": "ii", "उ": "u",
+    "ऊ": "uu", "ऋ": "ri", "ॠ": "rii", "ऌ": "li", "ऍ": "e",
+    "ऎ": "e", "ए": "e", "ऐ": "ai", "ऑ": "o", "ऒ": "o",
+    "ओ": "o", "औ": "au", "ॐ": "om",
+}
+_MATRAS = {
+    "ा": "aa", "ि": "i", "ी": "ii", "ु": "u", "ू": "uu",
+    "ृ": "ri", "ॄ": "rii", "ॢ": "li", "ॅ": "e", "ॆ": "e",
+    "े": "e", "ै": "ai", "ॉ": "o", "ॊ": "o", "ो": "o",
+    "ौ": "au",
+}
+_CONSONANTS = dict(zip(
+    [chr(c) for c in range(0x0915, 0x093a)],
+    ["k", "kh", "g", "gh", "n", "ch", "chh", "j", "jh", "n",
+     "t", "th", "d", "dh", "n", "t", "th", "d", "dh", "n", "n",
+     "p", "ph", "b", "bh", "m", "y", "r", "r", "l", "l", "l",
+     "v", "sh", "sh", "s", "h"],
+))
+# Consonant + nukta (after NFD): क़ ख़ ग़ ज़ ड़ ढ़ फ़ य़
+_NUKTA_FORMS = {"k": "q", "kh": "kh", "g": "g", "j": "z", "d": "r", "dh": "rh", "ph": "f", "y": "y"}
+_DIGITS = {chr(0x0966 + d): str(d) for d in range(10)}
+
+_DEVANAGARI_RUN_RE = re.compile("[\u0900-\u0963\u0966-\u097f]+")
+
+# IAST / ISO letters whose plain-ASCII reading is more than their base letter.
+_IAST = str.maketrans({
+    "ṛ": "ri", "ṝ": "ri", "ŗ": "ri", "ḷ": "li", "ḹ": "li",
+    "ṃ": "n", "ṁ": "n", "ḥ": "h", "ś": "sh", "ṣ": "sh",
+})
+_PHONETIC_SUBS = [
+    ("chh", "c"), ("ch", "c"), ("sh", "s"), ("ph", "f"), ("w", "v"), ("z", "j"),
+    ("q", "k"), ("x", "ks"), ("ee", "i"), ("oo", "u"), ("ai", "e"), ("au", "o"),
+]
+_NON_ALNUM_RE = re.compile("[^a-z0-9]")
+_ASPIRATE_RE = re.compile("([bcdgjkptr])h")
+_DOUBLE_RE = re.compile(r"(.)\1+")
+
+
+@functools.lru_cache(maxsize=1 << 17)
+def _romanize_run(run: str) -> str:
+    # Each unit is [consonant, vowel, inherent_vowel_pending, coda].
+    units: List[list] = []
+    for ch in unicodedata.normalize("NFD", run):
+        if ch in _CONSONANTS:
+            units.append([_CONSONANTS[ch], "a", True, ""])
+        elif ch == NUKTA:
+            if units and units[-1][0]:
+                units[-1][0] = _NUKTA_FORMS.get(units[-1][0], units[-1][0])
+        elif ch in _MATRAS:
+            if units and units[-1][2]:
+                units[-1][1] = _MATRAS[ch]
+                units[-1][2] = False
+            else:
+                units.append(["", _MATRAS[ch], False, ""])
+        elif ch == VIRAMA:
+            if units:
+                units[-1][1] = ""
+                units[-1][2] = False
+        elif ch in _VOWELS:
+            units.append(["", _VOWELS[ch], False, ""])
+        elif ch in (ANUSVARA, CHANDRABINDU):
+            if units:
+                units[-1][3] += "n"
+            else:
+                units.append(["", "", False, "n"])
+        elif ch == VISARGA:
+            pass  # silent in typed Hindi: दुःख -> "dukh"
+        elif ch in _DIGITS:
+            units.append([_DIGITS[ch], "", False, ""])
+
+    # Hindi schwa deletion: drop the word-final inherent vowel, and (right to
+    # left) an inherent vowel in the pattern vowel-C[a]-C-vowel unless that
+    # would leave three consonants together (ज़िंदगी -> "zindagii").
+    n = len(units)
+    if n > 1 and units[-1][2] and not units[-1][3]:
+        units[-1][1] = ""
+    for i in range(n - 2, 0, -1):
+        u = units[i]
+        if (u[2] and u[1] and not u[3] and units[i - 1][1] and not units[i - 1][3]
+                and units[i + 1][0] and units[i + 1][1]):
+            u[1] = ""
+    return "".join(u[0] + u[1] + u[3] for u in units)
+
+
+def romanize(text: str) -> str:
+    """Romanize the Devanagari parts of `text` (other characters pass through)."""
+    return _DEVANAGARI_RUN_RE.sub(lambda m: _romanize_run(m.group()), text)
+
+
+def has_devanagari(text: str) -> bool:
+    return _DEVANAGARI_RUN_RE.search(text) is not None
+
+
+def phonetic_key(word: str) -> str:
+    """
+    Loose, scheme-independent key of one Latin (or Devanagari) word.
+
+    "krodh", "krodha", "krOdha" and क्रोध all give "krod"; "karmanye",
+    "karmaNye" and कर्मण्ये give "karmanye".
+    """
+    if has_devanagari(word):
+        word = romanize(word)
+    word = word.lower().translate(_IAST)
+    word = "".join(c for c in unicodedata.normalize("NFD", word) if not unicodedata.combining(c))
+    word = _NON_ALNUM_RE.sub("", word)
+    for src, dst in _PHONETIC_SUBS:
+        word = word.replace(src, dst)
+    word = _ASPIRATE_RE.sub(r"\1", word)
+    word = _DOUBLE_RE.sub(r"\1", word)
+    if len(word) > 2 and word.endswith("a"):
+        word = word[:-1]
+    return word
@@ -0,0 +1,156 @@
+# search/web_index.py
+"""
+Prebuilt, compact search index for the generated WebView page.
+
+The page cannot afford to scan every string of SHLOKAS on each keystroke, so
+the build ships an inverted index the page only has to decode. The index is
+written next to the HTML as `gita_search_index.js`, which holds one base64
+string. The page passes that string to a Web Worker (search_worker.js), which
+decodes it and answers queries off the UI thread.
+
+Terms are the `word_keys()` of search.ngram: the folded Devanagari form of
+Devanagari words and the phonetic key of every word. The page can compute both
+in JS for a typed query (Devanagari, or Hinglish / IAST).
+
+Binary layout (little-endian; every Uint32 section starts 4-byte aligned):
+
+  0   magic "GSIX", u32 version, u32 n_terms, u32 n_rows, u32 n_postings,
+      u32 vocab_bytes, u32 postings_bytes, u32 reserved        (32 bytes)
+  32  Uint32[n_terms + 1]  byte offset of each term's postings
+      Uint32[n_terms + 1]  index of each term's first posting (weights)
+      Uint8[n_postings]    quantized score of each posting (1..255)
+      Uint8[...]           postings: row ids, delta-encoded as LEB128 varints
+      Uint8[...]           vocabulary: sorted terms, UTF-8, joined by "\\n"
+"""
+
+import base64
+import math
+import os
+import struct
+from typing import Dict, List, Tuple
+
+try:
+    from data.records import ShlokaStore
+except ModuleNotFoundError:
+    from records import ShlokaStore
+
+from search.devanagari import iter_tokens
+from search.fulltext import FIELD_WEIGHTS
+from search.ngram import NGRAM_FIELDS, TITLE_WEIGHT, word_keys
+from utils.files import write_if_changed
+
+MAGIC = b"GSIX"
+VERSION = 1
+INDEX_FILENAME = "gita_search_index.js"
+WORKER_JS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "search_worker.js")
+
+_HEADER = struct.Struct("<4s7I")
+
+
+def _varint(value: int, out: bytearray) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _pad4(buf: bytearray) -> None:
+    buf.extend(b"\0" * (-len(buf) % 4))
+
+
+def collect_postings(store: ShlokaStore) -> Dict[str, Dict[int, float]]:
+    """term -> {row_id: field-weighted term frequency}."""
+    postings: Dict[str, Dict[int, float]] = {}
+    for field in NGRAM_FIELDS:
+        weight = TITLE_WEIGHT if field == "problem" else FIELD_WEIGHTS.get(field, 1.0)
+        for row_id, text in enumerate(store.column(field)):
+            for _s, _e, raw in iter_tokens(text):
+                for key in word_keys(raw):
+                    rows = postings.setdefault(key, {})
+                    rows[row_id] = rows.get(row_id, 0.0) + weight
+    return postings
+
+
+def build_web_index(store: ShlokaStore) -> bytes:
+    """Encode the index for `store` in the binary layout described above."""
+    postings = collect_postings(store)
+    terms = sorted(postings)
+    n_rows = len(store)
+
+    scored: List[List[Tuple[int, float]]] = []
+    max_score = 0.0
+    for term in terms:
+        rows = postings[term]
+        idf = math.log(1 + n_rows / len(rows))
+        row_scores = [(row_id, idf * (1 + math.log(tf))) for row_id, tf in sorted(rows.items())]
+        max_score = max(max_score, max(s for _r, s in row_scores))
+        scored.append(row_scores)
+
+    byte_offsets = [0]
+    count_offsets = [0]
+    weights = bytearray()
+    stream = bytearray()
+    for row_scores in scored:
+        previous = 0
+        for row_id, score in row_scores:
+            _varint(row_id - previous, stream)
+            previous = row_id
+            weights.append(max(1, min(255, round(255 * score / max_score))))
+        byte_offsets.append(len(stream))
+        count_offsets.append(len(weights))
+
+    vocab = "\n".join(terms).encode("utf-8")
+
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, len(terms), n_rows, len(weights),
+                                 len(vocab), len(stream), 0))
+    out += struct.pack("<%dI" % len(byte_offsets), *byte_offsets)
+    out += struct.pack("<%dI" % len(count_offsets), *count_offsets)
+    out += weights
+    out += stream
+    out += vocab
+    _pad4(out)
+    return bytes(out)
+
+
+def read_web_index(data: bytes) -> Dict[str, List[Tuple[int, int]]]:
+    """Decode an index back to {term: [(row_id, weight), ...]} (for checks and tooling)."""
+    magic, version, n_terms, _n_rows, n_postings, vocab_len, stream_len, _ = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a version %d web search index" % VERSION)
+    pos = _HEADER.size
+    byte_offsets = struct.unpack_from("<%dI" % (n_terms + 1), data, pos)
+    pos += 4 * (n_terms + 1)
+    count_offsets = struct.unpack_from("<%dI" % (n_terms + 1), data, pos)
+    pos += 4 * (n_terms + 1)
+    weights = data[pos:pos + n_postings]
+    pos += n_postings
+    stream = data[pos:pos + stream_len]
+    pos += stream_len
+    terms = data[pos:pos + vocab_len].decode("utf-8").split("\n") if n_terms else []
+
+    result = {}
+    for t, term in enumerate(terms):
+        rows, row_id, shift, value = [], 0, 0, 0
+        for b in stream[byte_offsets[t]:byte_offsets[t + 1]]:
+            value |= (b & 0x7F) << shift
+            shift += 7
+            if not b & 0x80:
+                row_id += value
+                rows.append(row_id)
+                value, shift = 0, 0
+        result[term] = list(zip(rows, weights[count_offsets[t]:count_offsets[t + 1]]))
+    return result
+
+
+def write_web_index(store: ShlokaStore, directory: str) -> Tuple[str, int]:
+    """Write `gita_search_index.js` into `directory` (only if it changed). Returns (path, binary size)."""
+    data = build_web_index(store)
+    path = os.path.join(directory, INDEX_FILENAME)
+    write_if_changed(path, b"var GITA_SEARCH_INDEX = \"" + base64.b64encode(data) + b"\";\n")
+    return path, len(data)
+
+
+def worker_source() -> str:
+    """JS source of the search worker, for inlining into the page."""
+    with open(WORKER_JS_PATH, encoding="utf-8") as f:
+        return f.read()
@@ -0,0 +1,78 @@
+# tests/test_autocomplete_js.py
+"""
+The page's JS `foldKey()` must fold keys exactly like search/autocomplete.py
+`fold_key()`: the trie is built with the Python folds and walked with the JS
+ones, so any difference makes completions disappear on the page.
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from data.corpus_view import get_shlokas
+from search.autocomplete import AutocompleteTrie, fold_key
+from search.translit import romanize
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_PATH = os.path.join(BASE_DIR, "templates", "gita_shlokas.html")
+
+EXTRA_KEYS = [
+    "jaanaa", "lagnaa", "hatotsaahit", "krodh", "Krōdha", "ANGER", "2.47",
+    "सन्त", "हैं", "हँसी", "ज़िंदगी", "नीति", "ऊर्जा", "ईश्वर", "अध्याय 2 • श्लोक 47",
+    "कि‍सी", "  mixed   SPACES -- and, punctuation!  ",
+]
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+
+
+def _page_function(name: str) -> str:
+    with open(TEMPLATE_PATH, encoding="utf-8") as f:
+        source = f.read()
+    match = re.search(r"^function %s\(.*?^\}" % name, source, re.M | re.S)
+    assert match, "%s() not found in the page template" % name
+    return match.group(0)
+
+
+def _run_js(script: str, data):
+    script += "\nconst input = JSON.parse(require('fs').readFileSync(0, 'utf8'));"
+    script += "\nprocess.stdout.write(JSON.stringify(main(input)));"
+    out = subprocess.run(["node", "-e", script], input=json.dumps(data), capture_output=True,
+                         text=True, encoding="utf-8", check=True).stdout
+    return json.loads(out)
+
+
+def _sample_keys():
+    store = get_shlokas()
+    keys = list(EXTRA_KEYS)
+    for problem in sorted(set(store.column("problem"))):
+        keys.extend([problem, romanize(problem)])
+    keys.extend(store.column("reference")[:20])
+    return keys
+
+
+def run_fold_key_js(keys):
+    return _run_js(_page_function("foldKey") + "\nfunction main(keys){ return keys.map(foldKey); }", keys)
+
+
+def test_fold_key_js_matches_python():
+    keys = _sample_keys()
+    assert run_fold_key_js(keys) == [fold_key(k) for k in keys]
+
+
+def test_doubled_letters_collapse_in_js():
+    assert run_fold_key_js(["jaanaa", "hatotsaahit"]) == ["jana", "hatotsahit"]
+
+
+def test_page_completions_match_python():
+    trie = AutocompleteTrie.from_store(get_shlokas())
+    prefixes = ["jaanaa", "lagnaa", "hatotsaahit", "krodh", "क्रोध", "2.4", "अध्याय 1"]
+    script = "\n".join([_page_function("foldKey"), _page_function("acComplete"),
+                        "function main(d){ GITA_AUTOCOMPLETE = d.trie;",
+                        "  return d.prefixes.map(function(p){ return acComplete(p, 5); }); }"])
+    got = _run_js(script, {"trie": json.loads(trie.to_json()), "prefixes": prefixes})
+    assert got == [[list(c) for c in trie.complete(p, 5)] for p in prefixes]
+    assert all(got[:3])
@@ -0,0 +1,26 @@
+# tests/test_cache.py
+"""Queries that the searches treat alike must share one cache entry."""
+
+from search import fulltext, matcher, ngram
+from search.cache import normalize_query
+from search.ngram import query_key
+
+
+def test_fulltext_key_applies_the_search_folds():
+    assert normalize_query("  क्रोधी,   हैं ") == normalize_query("क्रोधि है")
+    first = fulltext.search("क्रोधी")
+    fulltext.search.cache.clear()
+    assert fulltext.search("क्रोधि") == first
+    assert fulltext.search("क्रोधी") is fulltext.search("क्रोधि")
+
+
+def test_word_keys_queries_share_an_entry():
+    assert query_key("Krodha!") == query_key("krodh")
+    ngram.search.cache.clear()
+    first = ngram.search("Krodha!")
+    assert ngram.search("krodh") is first
+
+
+def test_matcher_key_keeps_different_keys_apart():
+    assert query_key("anger") != query_key("angry")
+    assert matcher.match_sections("Anger") is matcher.match_sections("anger")
@@ -0,0 +1,17 @@
+# tests/test_corpus_view.py
+"""`iter_shlokas()` must end in exactly the store `get_shlokas()` serves."""
+
+from data import corpus_view, shlokas
+
+
+def test_iter_shlokas_fills_the_shared_view_section_by_section(monkeypatch):
+    monkeypatch.setattr(corpus_view, "_VIEWS", {})
+    sizes = []
+    for store in corpus_view.iter_shlokas():
+        sizes.append(len(store))
+    assert sizes == sorted(sizes) and len(sizes) > 1
+    view = corpus_view.get_shlokas()
+    assert store is view and len(view) == sizes[-1]
+    assert list(map(dict, view)) == list(map(dict, corpus_view.flatten(shlokas.ALL_SHLOKAS)))
+    # Once built, the finished view comes back in one step
+    assert [s is view for s in corpus_view.iter_shlokas()] == [True]
@@ -0,0 +1,23 @@
+# tests/test_related.py
+"""The app reads the shipped related table; only the build writes it."""
+
+from data.corpus_view import get_shlokas
+from search import related
+
+
+def test_shipped_table_matches_the_corpus():
+    table = related.load_related()
+    assert table is not None and len(table) == len(get_shlokas())
+
+
+def test_load_related_never_builds(tmp_path, monkeypatch):
+    monkeypatch.setattr(related, "_TABLES", {})
+    path = tmp_path / "gita_related.bin"
+    assert related.load_related(str(path)) is None
+    assert not path.exists()
+
+
+def test_cache_key_covers_the_tokenizer(monkeypatch):
+    key = related.cache_key(b"x")
+    monkeypatch.setattr(related, "TOKENIZER_VERSION", related.TOKENIZER_VERSION + 1)
+    assert related.cache_key(b"x") != key
@@ -0,0 +1,25 @@
+# tests/test_spelling.py
+"""Spelling correction must only touch Devanagari words the matcher doesn't know."""
+
+from search.matcher import get_matcher
+from search.ngram import word_keys
+from search.spelling import correct_query, correct_word
+
+
+def test_latin_words_are_never_corrected():
+    for word in ("money", "love", "angry", "krodh"):
+        assert correct_word(word) == word
+    assert correct_query("money love angry") == "money love angry"
+
+
+def test_misspelled_devanagari_is_corrected():
+    assert correct_word("करोध") == "क्रोध"
+
+
+def test_matcher_adds_the_correction_of_an_unknown_devanagari_word():
+    matcher = get_matcher()
+    terms = matcher.query_vector("गुस्सा")
+    for key in word_keys("गुस्से"):
+        assert matcher.vocab[key] in terms
+    # Known words are looked up as typed
+    assert set(matcher.query_vector("anger")) == {matcher.vocab["anger"]}
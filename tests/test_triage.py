@@ -0,0 +1,17 @@
+# tests/test_triage.py
+"""`read_queries()` reports malformed input lines and keeps going."""
+
+import io
+
+import triage
+
+
+def test_read_queries_skips_malformed_jsonl_lines(capsys):
+    stream = io.StringIO('{"id": "a", "text": "anger"}\n'
+                         '{not json\n'
+                         '[1, 2]\n'
+                         '\n'
+                         '"grief"\n')
+    assert list(triage.read_queries(stream, "jsonl", "text")) == [("a", "anger"), ("5", "grief")]
+    err = capsys.readouterr().err
+    assert "line 2:" in err and "line 3:" in err
@@ -0,0 +1,152 @@
+"""
+Offline triage: assign user-submitted problems to Gita sections in bulk.
+
+    python triage.py problems.jsonl -o matches.jsonl
+    python triage.py problems.csv --field complaint --workers 4
+
+Input is JSONL (one object per line, or a bare JSON string) or CSV with a
+header row. Each query's text is read from --field and its id from "id" (the
+line number when missing). Queries are read lazily, scored in batches with one
+sparse product per batch (ProblemMatcher.match_batch), and written out as JSONL
+in input order as soon as each batch is done. At most a few batches are held in
+memory, also with --workers, where batches are sharded over worker processes
+that each build their own matcher.
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import sys
+import time
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from search.matcher import get_matcher
+
+BATCH_SIZE = 512
+
+Query = Tuple[str, str]   # (id, text)
+
+
+def read_queries(stream, fmt: str, field: str) -> Iterator[Query]:
+    if fmt == "csv":
+        for n, row in enumerate(csv.DictReader(stream), 1):
+            yield row.get("id") or str(n), row.get(field) or ""
+        return
+    for n, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError as e:
+            print(f"⚠ line {n}: invalid JSON ({e.msg}), skipped", file=sys.stderr)
+            continue
+        if isinstance(obj, str):
+            yield str(n), obj
+        elif isinstance(obj, dict):
+            yield str(obj.get("id", n)), str(obj.get(field) or "")
+        else:
+            print(f"⚠ line {n}: expected an object or a string, got "
+                  f"{type(obj).__name__}, skipped", file=sys.stderr)
+
+
+def batched(items: Iterable[Query], size: int) -> Iterator[List[Query]]:
+    it = iter(items)
+    while True:
+        batch = list(itertools.islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def score_batch(batch: List[Query], k_sections: int, k_verses: int) -> List[Dict]:
+    matcher = get_matcher()
+    store = matcher.store
+    results = matcher.match_batch([text for _id, text in batch], k_sections, k_verses)
+    out = []
+    for (qid, text), (sections, verses) in zip(batch, results):
+        out.append({
+            "id": qid,
+            "query": text,
+            "sections": [
+                {"problem": m.problem, "score": round(m.score, 4), "best_row": m.row_ids[0]}
+                for m in sections
+            ],
+            "verses": [
+                {"row": v.row_id, "problem": store.value(v.row_id, "problem"),
+                 "reference": store.value(v.row_id, "reference"), "score": round(v.score, 4)}
+                for v in verses
+            ],
+        })
+    return out
+
+
+def _score_task(args):
+    return score_batch(*args)
+
+
+def _init_worker():
+    get_matcher()
+
+
+def triage(queries: Iterable[Query], k_sections: int = 3, k_verses: int = 5,
+           batch_size: int = BATCH_SIZE, workers: int = 1) -> Iterator[Dict]:
+    """Ranked matches for each query, in input order."""
+    batches = batched(queries, batch_size)
+    if workers <= 1:
+        for batch in batches:
+            yield from score_batch(batch, k_sections, k_verses)
+        return
+
+    # Keep a bounded window of batches in flight so a huge input is never
+    # read ahead of what the workers can score.
+    with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+        pending = deque()
+        for batch in batches:
+            pending.append(pool.apply_async(_score_task, ((batch, k_sections, k_verses),)))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Assign problem descriptions to Gita sections.")
+    parser.add_argument("input", help="JSONL or CSV file of queries ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-", help="JSONL output file (default: stdout)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), help="input format (default: from extension)")
+    parser.add_argument("--field", default="text", help="field / column holding the query text")
+    parser.add_argument("-k", "--sections", type=int, default=3, help="sections per query")
+    parser.add_argument("--verses", type=int, default=5, help="verses per query")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.input.lower().endswith(".csv") else "jsonl")
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8", newline="")
+    dst = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    start = time.perf_counter()
+    count = 0
+    try:
+        for result in triage(read_queries(src, fmt, args.field), args.sections, args.verses,
+                             args.batch_size, args.workers):
+            dst.write(json.dumps(result, ensure_ascii=False))
+            dst.write("\n")
+            count += 1
+            if count % args.batch_size == 0:
+                dst.flush()
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+
+    print(f"✔ Triaged {count} queries in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
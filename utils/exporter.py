@@ -7,7 +7,7 @@ def export_to_txt(shlokas):
         for s in shlokas:
             f.write(f"{s.get('section','')}\n")
             f.write(f"{s.get('problem','')}\n")
-            f.write(f"{s.get('sloka','' )}\n")
+            f.write(f"{s.get('reference','')}\n")
             f.write(f"{s.get('text','')}\n")
             f.write(f"{s.get('meaning','')}\n")
             f.write(f"{s.get('example','')}\n")
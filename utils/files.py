@@ -0,0 +1,53 @@
+# utils/files.py
+"""
+Atomic writes that leave unchanged files alone.
+
+Build outputs are written to a temporary file next to the target and moved
+into place with `os.replace`, so a reader never sees a half-written file. When
+the new content equals what is already there, the target is not replaced and
+its modification time (which Gradle and other build steps key on) stays as it
+was.
+"""
+
+import os
+
+
+def _same_content(a: str, b: str, block_size: int = 1 << 16) -> bool:
+    if os.path.getsize(a) != os.path.getsize(b):
+        return False
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        while True:
+            block = fa.read(block_size)
+            if block != fb.read(block_size):
+                return False
+            if not block:
+                return True
+
+
+def temp_path(path: str) -> str:
+    """Temporary file name for writing `path`."""
+    return f"{path}.{os.getpid()}.tmp"
+
+
+def replace_if_changed(tmp_path: str, path: str) -> bool:
+    """Move `tmp_path` onto `path` unless both hold the same bytes. Returns True if `path` changed."""
+    if os.path.exists(path) and _same_content(tmp_path, path):
+        os.remove(tmp_path)
+        return False
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_if_changed(path: str, data: bytes) -> bool:
+    """Write `data` to `path` atomically, unless it already holds exactly that. Returns True if written."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    tmp_path = temp_path(path)
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True